@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Parsing / Export Benchmark
+Kaydedilmiş Kanal-Immobilien raporu üzerinde parse ve dışa aktarma
+aşamalarının süresini ve bellek tepe değerini ölçer.
+
+Kullanım:
+    python benchmark.py --repeat 10 --output bench.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+import contextlib
+from typing import Dict, Any, List, Callable, Tuple
+
+# Modules klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modules'))
+
+from bs4 import BeautifulSoup
+from html_parser import HTMLParser
+from js_extractor import JSExtractor
+from data_exporter import DataExporter, PYARROW_AVAILABLE
+from report_ingestor import parse_report_html
+from rank_grid import RankGrid
+from soup_factory import make_soup, resolve_parser, LXML_AVAILABLE
+
+DEFAULT_FIXTURE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "Site Dosyaları",
+    "Local Rankings Report - Kanal-Immobilien GmbH - Keyword_ Hausverkauf.html",
+)
+
+Stage = Tuple[str, Callable[[], Any]]
+RowStage = Tuple[str, Callable[[], Any], int]
+
+
+def build_stages(html: str, workdir: str, parser: str) -> List[Stage]:
+    """
+    Ölçülecek aşamaları sırasıyla oluşturur.
+
+    Args:
+        html: Fixture HTML içeriği
+        workdir: Dışa aktarma dosyalarının yazılacağı geçici dizin
+        parser: parse aşamalarında kullanılacak soup backend'i
+
+    Returns:
+        (aşama adı, çağrılacak fonksiyon) listesi
+    """
+    html_parser = HTMLParser()
+    js_extractor = JSExtractor()
+    exporter = DataExporter()
+
+    soup = make_soup(html, parser)
+    js_data = js_extractor.extract_all_js_data(soup)
+    data = parse_report_html(html, DEFAULT_FIXTURE, parser)
+    base = os.path.join(workdir, "bench")
+
+    stages = [
+        ("soup.html.parser", lambda: BeautifulSoup(html, "html.parser")),
+        ("soup.html.parser.targeted", lambda: make_soup(html, "html.parser", targeted=True)),
+    ]
+    if LXML_AVAILABLE:
+        stages.append(("soup.lxml", lambda: BeautifulSoup(html, "lxml")))
+        stages.append(("soup.lxml.targeted", lambda: make_soup(html, "lxml", targeted=True)))
+
+    stages += [
+        ("html_parser.parse_scan_information", lambda: html_parser.parse_scan_information(soup)),
+        ("html_parser.parse_rank_summary", lambda: html_parser.parse_rank_summary(soup)),
+        ("html_parser.parse_competitors", lambda: html_parser.parse_competitors(soup)),
+        ("html_parser.parse_sponsorlu_listeler", lambda: html_parser.parse_sponsorlu_listeler(soup)),
+        ("html_parser.parse_detayli_sonuclar", lambda: html_parser.parse_detayli_sonuclar(soup)),
+        ("html_parser.parse_report", lambda: html_parser.parse_report(soup)),
+        ("js_extractor.extract_all_js_data", lambda: js_extractor.extract_all_js_data(soup)),
+        ("js_extractor.extract_all_js_data_raw", lambda: js_extractor.extract_all_js_data_raw(html)),
+        ("js_extractor.extract_map_data", lambda: js_extractor.extract_map_data(js_data)),
+        ("pipeline.parse_report_html", lambda: parse_report_html(html, DEFAULT_FIXTURE, parser)),
+        ("rank_grid.from_scan", lambda: RankGrid.from_scan(data).stats()),
+        ("exporter.json", lambda: exporter.save_to_json(data, f"{base}.json")),
+        ("exporter.excel", lambda: exporter.save_to_excel(data, f"{base}.xlsx")),
+        ("exporter.excel.legacy", lambda: exporter.save_to_excel(data, f"{base}.xlsx", fast=False)),
+        ("exporter.csv", lambda: exporter.save_to_csv(data, base)),
+    ]
+    if PYARROW_AVAILABLE:
+        stages.append(("exporter.parquet", lambda: exporter.save_to_parquet(data, base)))
+    stages += [
+        ("exporter.all_formats", lambda: exporter.export_all_formats(data, base)),
+        ("exporter.all_formats.sequential", lambda: exporter.export_all_formats(data, base, parallel=False)),
+    ]
+    return stages
+
+
+def build_row_stages(html: str, parser: str) -> List[RowStage]:
+    """
+    Satır başına parse maliyetini ölçen aşamaları oluşturur.
+    
+    Her aşama ilgili tablodaki tüm satırları bir kez işler; rapora satır
+    sayısı ve satır başına medyan süre (mikrosaniye) eklenir.
+    
+    Args:
+        html: Fixture HTML içeriği
+        parser: Soup backend'i
+        
+    Returns:
+        (aşama adı, çağrılacak fonksiyon, satır sayısı) listesi
+    """
+    html_parser = HTMLParser()
+    soup = make_soup(html, parser)
+    
+    competitor_rows = soup.select("table#tbl_comp_rank tbody tr")
+    ad_rows = soup.select("table#tbl_ads_rank tbody tr")
+    panels = soup.select("div#resultModal div.results_body div.bg-light.panel-body")
+    rating_containers = competitor_rows + ad_rows + panels
+    
+    return [
+        ("row.competitor", lambda: [html_parser._parse_competitor_row(row) for row in competitor_rows],
+         len(competitor_rows)),
+        ("row.sponsorlu", lambda: [html_parser._parse_sponsorlu_row(row) for row in ad_rows],
+         len(ad_rows)),
+        ("row.detail", lambda: [html_parser._parse_detail_panel(panel) for panel in panels],
+         len(panels)),
+        ("row.rating_and_reviews",
+         lambda: [html_parser._extract_rating_and_reviews(row) for row in rating_containers],
+         len(rating_containers)),
+        ("row.index_row", lambda: [html_parser._index_row(row) for row in rating_containers],
+         len(rating_containers)),
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Fonksiyonun duvar saati süresini ve bellek tepe değerini ölçer.
+
+    Süre ölçümleri tracemalloc kapalıyken yapılır; bellek ölçümü ayrı
+    bir çalıştırmada alınır.
+
+    Args:
+        func: Ölçülecek fonksiyon
+        repeat: Tekrar sayısı
+
+    Returns:
+        Süre (ms) ve bellek (KiB) istatistikleri
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": {
+            "min": round(min(timings), 3),
+            "median": round(statistics.median(timings), 3),
+            "mean": round(statistics.mean(timings), 3),
+            "max": round(max(timings), 3),
+        },
+        "peak_memory_kib": round(peak / 1024, 1),
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(fixture: str, repeat: int, only: List[str] = None, parser: str = None) -> Dict[str, Any]:
+    """
+    Tüm aşamaları çalıştırır ve JSON'a dönüştürülebilir rapor döndürür.
+
+    Args:
+        fixture: Rapor HTML dosyası
+        repeat: Aşama başına tekrar sayısı
+        only: Sadece adı bu öneklerden biriyle başlayan aşamalar
+        parser: parse aşamalarında kullanılacak soup backend'i
+
+    Returns:
+        Benchmark raporu
+    """
+    with open(fixture, 'r', encoding='utf-8') as f:
+        html = f.read()
+    parser = resolve_parser(parser)
+
+    report = {
+        "fixture": os.path.basename(fixture),
+        "fixture_bytes": len(html.encode('utf-8')),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parser": parser,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": {},
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Modüllerin print çıktıları JSON raporuna karışmasın
+        with contextlib.redirect_stdout(io.StringIO()):
+            stages = build_stages(html, workdir, parser)
+            for name, func in stages:
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                report["stages"][name] = measure(func, repeat)
+            
+            for name, func, rows in build_row_stages(html, parser):
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                result = measure(func, repeat)
+                result["rows"] = rows
+                result["per_row_us"] = round(result["wall_ms"]["median"] * 1000 / rows, 2) if rows else None
+                report["stages"][name] = result
+
+    return report
+
+
+def main():
+    """Komut satırı girişi"""
+    arg_parser = argparse.ArgumentParser(description="Parse ve dışa aktarma benchmark'ı")
+    arg_parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="Rapor HTML dosyası")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Aşama başına tekrar sayısı")
+    arg_parser.add_argument("--parser", choices=["lxml", "html.parser"],
+                            help="parse aşamalarında kullanılacak backend (varsayılan: lxml)")
+    arg_parser.add_argument("--only", nargs="*", help="Sadece bu öneklerle başlayan aşamalar")
+    arg_parser.add_argument("--output", help="JSON raporunun yazılacağı dosya (varsayılan: stdout)")
+    args = arg_parser.parse_args()
+
+    report = run_benchmarks(args.fixture, max(1, args.repeat), args.only, args.parser)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
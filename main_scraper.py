@@ -13,7 +13,11 @@ Bu dosya tüm yardımcı modülleri kullanarak hibrit scraping yapar:
 
 import sys
 import os
-from typing import Dict, Any, Optional
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -24,7 +28,14 @@ from web_client import WebClient
 from html_parser import HTMLParser
 from js_extractor import JSExtractor
 from api_client import APIClient
-from data_exporter import DataExporter
+from data_exporter import (DataExporter, NDJSONWriter, DEFAULT_FORMATS, SUPPORTED_FORMATS,
+                           PARTITION_COLUMNS, NDJSON_MODES)
+from rate_limiter import HostRateLimiter
+from response_cache import ResponseCache
+from report_ingestor import ReportIngestor, parse_report_sections, sections_cache_variant, SECTIONS_VERSION
+from parse_cache import ParseCache
+from job_queue import JobQueue
+from pipeline import ScanPipeline
 
 
 class MainScraper:
@@ -35,7 +46,17 @@ class MainScraper:
                  timeout: int = 30,
                  use_selenium: bool = False,
                  headless: bool = True,
-                 rate_limit: float = 1.0):
+                 rate_limit: float = 1.0,
+                 analytics_concurrency: int = 1,
+                 burst: int = 1,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 parser: Optional[str] = None,
+                 targeted_parse: bool = True,
+                 api_only: bool = False,
+                 parse_cache: Optional[ParseCache] = None,
+                 keep_raw: bool = False,
+                 data_exporter: Optional[DataExporter] = None):
         """
         MainScraper sınıfını başlatır.
         
@@ -45,27 +66,76 @@ class MainScraper:
             use_selenium: Selenium kullanımı
             headless: Selenium headless modu
             rate_limit: Rate limiting süresi
+            analytics_concurrency: Analytics çağrılarında eşzamanlı istek sayısı
+            burst: Host başına anlık izin verilen istek sayısı
+            rate_limiter: WebClient ve APIClient'ın paylaştığı host rate limiter'ı
+            cache: WebClient ve APIClient'ın paylaştığı disk tabanlı yanıt önbelleği
+            parser: BeautifulSoup parser backend'i ("lxml" varsayılan, "html.parser")
+            targeted_parse: Sadece raporda kullanılan bölgeler için ağaç kurulsun mu
+            api_only: HTML bölümlerini parse etmeden sadece JavaScript/API verilerini çek
+            parse_cache: İçerik hash'ine göre parse sonuçlarını saklayan önbellek
+                (verilmezse sadece bellek içi LRU kullanılır)
+            keep_raw: Sayıya çevrilen alanların ham metnini "(Ham)" sütunlarında sakla
+            data_exporter: Sonuçların aktarılacağı DataExporter (formatlar, Parquet ayarları)
         """
+        # Web ve API istemcileri aynı host bütçesini paylaşır
+        self.rate_limiter = rate_limiter or HostRateLimiter.from_interval(rate_limit, burst)
+        
         # Modülleri başlat
         self.web_client = WebClient(
             user_agent=user_agent,
             timeout=timeout,
             use_selenium=use_selenium,
             headless=headless,
-            rate_limit=rate_limit
+            rate_limit=rate_limit,
+            rate_limiter=self.rate_limiter,
+            cache=cache,
+            parser=parser
         )
         
-        self.html_parser = HTMLParser()
+        self.html_parser = HTMLParser(keep_raw=keep_raw)
         self.js_extractor = JSExtractor()
         self.api_client = APIClient(
             user_agent=user_agent,
             timeout=timeout,
-            rate_limit=rate_limit
+            rate_limit=rate_limit,
+            max_concurrency=analytics_concurrency,
+            rate_limiter=self.rate_limiter,
+            cache=cache,
+            parser=parser
         )
-        self.data_exporter = DataExporter()
+        self.data_exporter = data_exporter or DataExporter()
         
         # Ayarları sakla
         self.use_selenium = use_selenium
+        self.cache = cache
+        self.targeted_parse = targeted_parse
+        self.api_only = api_only
+        self.keep_raw = keep_raw
+        self.parse_cache = parse_cache or ParseCache(namespace=f"sections-v{SECTIONS_VERSION}")
+        self._settings = {
+            "user_agent": user_agent,
+            "timeout": timeout,
+            "use_selenium": use_selenium,
+            "headless": headless,
+            "rate_limit": rate_limit,
+            "analytics_concurrency": analytics_concurrency,
+            "burst": burst,
+            "rate_limiter": self.rate_limiter,
+            "cache": cache,
+            "parser": parser,
+            "targeted_parse": targeted_parse,
+            "api_only": api_only,
+            "parse_cache": self.parse_cache,
+            "keep_raw": keep_raw,
+            "data_exporter": self.data_exporter,
+        }
+        
+        # Toplu tarama (scrape_many) durumu
+        self._host_semaphores: Dict[Tuple[str, int], threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
+        self._worker_local = threading.local()
+        self._worker_scrapers: List["MainScraper"] = []
     
     def scrape_all(self, url: str) -> Dict[str, Any]:
         """
@@ -77,67 +147,116 @@ class MainScraper:
         Returns:
             Tüm çekilen veriler
         """
+        if self.api_only:
+            return self.scrape_api_only(url)
+        
         print(f"Veri çekme işlemi başlatılıyor: {url}")
         
         # 1. HTML içeriğini al
         print("1. HTML içeriği alınıyor...")
-        soup = self.web_client.get_soup(url)
-        if not soup:
+        html = self.web_client.get_html(url)
+        if not html:
             print("❌ HTML içeriği alınamadı")
             return {}
         print("✅ HTML içeriği başarıyla alındı")
         
-        # 2. JavaScript verilerini çıkar
-        print("2. JavaScript verileri çıkarılıyor...")
-        js_data = self.js_extractor.extract_all_js_data(soup)
-        print(f"✅ JavaScript verileri çıkarıldı: {len(js_data)} alan")
+        base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
         
-        # 3. HTML parsing ile temel verileri çek
-        results = {}
+        # 2-7. Rapor bölümlerini çıkar; aynı içerik daha önce parse edildiyse ağaç kurulmaz
+        cache_key = self.parse_cache.content_key(html, sections_cache_variant(self.keep_raw, self.js_extractor))
+        results = self.parse_cache.get(cache_key)
+        if results is not None:
+            print("✅ Rapor bölümleri parse önbelleğinden alındı")
+            js_data = results["javascript_verileri"]
+            print(f"✅ JavaScript verileri çıkarıldı: {len(js_data)} alan")
+            
+            # 8. API verilerini çek
+            print("8. API verileri çekiliyor...")
+            results["api_verileri"] = self.api_client.get_all_api_data(base_url, js_data)
+        else:
+            # API çağrıları sadece scan_guid/pinz'e ihtiyaç duyar; bunlar ağaç
+            # kurmadan ham metinden alınır ve API, bölümler parse edilirken çalışır
+            js_data = self.js_extractor.extract_all_js_data_raw(html)
+            print(f"✅ JavaScript verileri çıkarıldı: {len(js_data)} alan")
+            
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-api") as executor:
+                print("8. API verileri çekiliyor (rapor bölümleri parse edilirken)...")
+                api_future = executor.submit(self.api_client.get_all_api_data, base_url, js_data)
+                
+                print("2-7. Rapor bölümleri çıkarılıyor...")
+                results = parse_report_sections(html, self.web_client.parser,
+                                                self.targeted_parse, self.keep_raw,
+                                                html_parser=self.html_parser,
+                                                js_extractor=self.js_extractor,
+                                                js_data=js_data)
+                self.parse_cache.put(cache_key, results)
+                
+                results["api_verileri"] = api_future.result()
         
-        print("3. Özet bilgiler çekiliyor...")
-        scan_info = self.html_parser.parse_scan_information(soup)
-        rank_summary = self.html_parser.parse_rank_summary(soup)
-        results["ozet_bilgiler"] = {**scan_info, **rank_summary}
+        # Metadata ekle
+        results["metadata"] = {
+            "scraped_at": datetime.now().isoformat(),
+            "url": url,
+            "scraper_version": "4.0",
+            "method": "modular_hybrid",
+            "selenium_used": self.use_selenium
+        }
         
-        print("4. Rakipler çekiliyor...")
-        results["rakipler"] = self.html_parser.parse_competitors(soup)
+        return results
+    
+    def scrape_api_only(self, url: str) -> Dict[str, Any]:
+        """
+        HTML ağacı kurmadan JavaScript ve API verilerini çeker.
         
-        print("5. Sponsorlu listeler çekiliyor...")
-        results["sponsorlu_listeler"] = self.html_parser.parse_sponsorlu_listeler(soup)
+        Ham yanıt metni tek geçişte taranır; HTML bölümleri (rakipler,
+        sponsorlu listeler vb.) bu modda çıkarılmaz.
         
-        print("6. Detaylı sonuçlar çekiliyor...")
-        results["detayli_sonuclar"] = self.html_parser.parse_detayli_sonuclar(soup)
+        Args:
+            url: Hedef URL
+            
+        Returns:
+            Harita, API ve JavaScript verileri
+        """
+        print(f"Veri çekme işlemi başlatılıyor (sadece API): {url}")
         
-        print("7. Harita verileri çekiliyor...")
+        html = self.web_client.get_html(url)
+        if not html:
+            print("❌ HTML içeriği alınamadı")
+            return {}
+        
+        js_data = self.js_extractor.extract_all_js_data_raw(html)
+        print(f"✅ JavaScript verileri çıkarıldı: {len(js_data)} alan")
+        
+        results = {}
         results["harita_verileri"] = self.js_extractor.extract_map_data(js_data)
         
-        # 4. API verilerini çek
-        print("8. API verileri çekiliyor...")
         base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
         results["api_verileri"] = self.api_client.get_all_api_data(base_url, js_data)
-        
-        # 5. JavaScript verilerini ekle
         results["javascript_verileri"] = js_data
-        
-        # 6. Metadata ekle
         results["metadata"] = {
             "scraped_at": datetime.now().isoformat(),
             "url": url,
             "scraper_version": "4.0",
-            "method": "modular_hybrid",
+            "method": "api_only",
             "selenium_used": self.use_selenium
         }
         
         return results
     
-    def export_data(self, data: Dict[str, Any], base_filename: str = "modular_scraped_data") -> Dict[str, bool]:
+    def export_data(self,
+                    data: Dict[str, Any],
+                    base_filename: str = "modular_scraped_data",
+                    formats: Optional[Iterable[str]] = None,
+                    timestamped: bool = True) -> Dict[str, bool]:
         """
         Verileri tüm formatlarda dışa aktarır.
         
         Args:
             data: Çekilen veriler
             base_filename: Temel dosya adı
+            formats: Yazılacak formatlar (varsayılan: DataExporter.formats)
+            timestamped: Dosya adına zaman damgası eklensin mi (False ise
+                dosyalar tam olarak base_filename ile yazılır, varsa üzerine yazılır)
             
         Returns:
             Her format için başarı durumu
@@ -145,11 +264,16 @@ class MainScraper:
         print("\n9. Veriler dışa aktarılıyor...")
         
         # Zaman damgalı dosya adı oluştur
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{base_filename}_{timestamp}"
+        filename = base_filename
+        if timestamped:
+            filename = f"{base_filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Tüm formatlarda dışa aktar
-        results = self.data_exporter.export_all_formats(data, filename)
+        # Tüm formatlarda (eşzamanlı) dışa aktar
+        results, timings = self.data_exporter.export_all_formats(data, filename, formats,
+                                                                 return_timings=True)
+        if timings:
+            print("Dışa aktarma süreleri: " + ", ".join(
+                f"{fmt} {duration:.2f} sn" for fmt, duration in timings.items()))
         
         # Özet göster
         self.data_exporter.print_summary(data)
@@ -192,6 +316,7 @@ class MainScraper:
                 status = "✅" if success else "❌"
                 print(f"{status} {format_name.upper()}")
             
+            self._print_cache_stats()
             print("=" * 60)
             print("🎉 Modüler scraper başarıyla tamamlandı!")
             
@@ -205,35 +330,574 @@ class MainScraper:
             # Kaynakları temizle
             self.web_client.cleanup()
     
+    def _print_cache_stats(self):
+        """Yanıt ve parse önbelleklerinin hit/miss sayaçlarını yazdırır."""
+        if self.cache is not None:
+            stats = self.cache.get_stats()
+            print(f"Önbellek: {stats['hits']} hit, {stats['revalidated']} yeniden doğrulama, "
+                  f"{stats['misses']} miss (oran: {stats['hit_ratio']:.0%})")
+        stats = self.parse_cache.get_stats()
+        if stats["memory_hits"] or stats["disk_hits"]:
+            print(f"Parse önbelleği: {stats['memory_hits']} bellek hit, "
+                  f"{stats['disk_hits']} disk hit, {stats['misses']} miss")
+    
+    def _get_host_semaphore(self, url: str, max_per_host: int) -> threading.Semaphore:
+        """
+        Host başına eşzamanlı tarama sınırını uygulayan semaforu döndürür.
+        
+        Semaforlar (host, max_per_host) ile anahtarlanır; aynı MainScraper
+        üzerinde farklı sınırla yapılan sonraki çağrılar eski sınırı kullanmaz.
+        """
+        key = (urlparse(url).netloc.lower(), max(1, max_per_host))
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.Semaphore(key[1])
+                self._host_semaphores[key] = semaphore
+            return semaphore
+    
+    def _get_worker_scraper(self) -> "MainScraper":
+        """
+        Her worker thread'i için ayrı bir MainScraper örneği döndürür.
+        
+        Worker'lar bu örneğin JSExtractor'ını paylaşır; register_global ile
+        eklenen global'ler toplu taramalarda da çıkarılır.
+        """
+        scraper = getattr(self._worker_local, "scraper", None)
+        if scraper is None:
+            scraper = MainScraper(**self._settings)
+            scraper.js_extractor = self.js_extractor
+            self._worker_local.scraper = scraper
+            with self._host_lock:
+                self._worker_scrapers.append(scraper)
+        return scraper
+    
+    def _scrape_one(self, index: int, url: str, max_per_host: int,
+                    export: bool, base_filename: str,
+                    formats: Optional[List[str]] = None,
+                    timestamped: bool = True) -> Dict[str, Any]:
+        """
+        scrape_many için tek bir taramayı worker thread'inde çalıştırır.
+        
+        Dışa aktarma istendiyse ve hiçbir format yazılamadıysa tarama
+        başarısız sayılır.
+        """
+        started = time.perf_counter()
+        result = {
+            "index": index,
+            "url": url,
+            "success": False,
+            "data": {},
+            "error": None,
+            "export": None,
+            "output": None,
+            "duration": 0.0,
+        }
+        
+        try:
+            scraper = self._get_worker_scraper()
+            with self._get_host_semaphore(url, max_per_host):
+                data = scraper.scrape_all(url)
+            
+            if data:
+                result["data"] = data
+                result["success"] = True
+                if export:
+                    result["output"] = f"{base_filename}_{index:04d}"
+                    result["export"] = scraper.export_data(data, result["output"], formats, timestamped)
+                    if not any((result["export"] or {}).values()):
+                        result["success"] = False
+                        result["error"] = "Dışa aktarma başarısız"
+            else:
+                result["error"] = "Veri çekilemedi"
+                
+        except Exception as e:
+            result["error"] = str(e)
+        
+        result["duration"] = time.perf_counter() - started
+        return result
+    
+    def scrape_many(self,
+                    urls: Iterable[str],
+                    max_workers: int = 4,
+                    max_per_host: int = 2,
+                    export: bool = False,
+                    base_filename: str = "modular_scraped_data",
+                    formats: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Birden fazla taramayı worker havuzu üzerinde paralel çalıştırır.
+        
+        Sonuçlar tamamlanma sırasına göre üretilir. Aynı host'a aynı anda
+        en fazla max_per_host tarama gönderilir.
+        
+        Args:
+            urls: Hedef URL listesi
+            max_workers: Worker thread sayısı
+            max_per_host: Host başına eşzamanlı tarama sayısı
+            export: Her tarama bittiğinde dışa aktarım yapılsın mı
+            base_filename: Dışa aktarım için temel dosya adı
+            formats: Dışa aktarım formatları (varsayılan: DataExporter.formats)
+            
+        Yields:
+            Her tarama için index, url, success, data, error, export ve duration alanları
+        """
+        url_list = [url.strip() for url in urls if url and url.strip()]
+        if not url_list:
+            return
+        formats = list(formats) if formats is not None else None
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                thread_name_prefix="scan-worker") as executor:
+            # Future listesi tutulmaz; as_completed üretilen sonuçları bırakır,
+            # böylece tüketilen taramalar bellekte birikmez
+            completed = as_completed([
+                executor.submit(self._scrape_one, index, url, max_per_host, export, base_filename, formats)
+                for index, url in enumerate(url_list)
+            ])
+            for future in completed:
+                yield future.result()
+    
+    def scrape_pipelined(self,
+                         urls: Iterable[str],
+                         fetch_workers: int = 4,
+                         parse_workers: Optional[int] = None,
+                         max_per_host: int = 2,
+                         export: bool = False,
+                         base_filename: str = "modular_scraped_data",
+                         formats: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Taramaları fetch/parse ayrımlı boru hattında çalıştırır.
+        
+        HTML indirme ve API çağrıları thread'lerde, BeautifulSoup/HTMLParser
+        işi process havuzunda yapılır; böylece parse GIL'i tutmaz ve
+        toplu taramada hem ağ hem tüm CPU çekirdekleri kullanılır.
+        api_only modunda parse aşaması olmadığından scrape_many kullanılır.
+        
+        Args:
+            urls: Hedef URL listesi
+            fetch_workers: HTML indiren (ve API çağıran) thread sayısı
+            parse_workers: Parse process sayısı (varsayılan: CPU sayısı)
+            max_per_host: Host başına eşzamanlı HTML isteği sayısı
+            export: Her tarama bittiğinde dışa aktarım yapılsın mı
+            base_filename: Dışa aktarım için temel dosya adı
+            formats: Dışa aktarım formatları (varsayılan: DataExporter.formats)
+            
+        Yields:
+            scrape_many ile aynı alanlar ve aşama süreleri (timings)
+        """
+        formats = list(formats) if formats is not None else None
+        if self.api_only:
+            yield from self.scrape_many(urls, fetch_workers, max_per_host, export, base_filename, formats)
+            return
+        
+        pipeline = ScanPipeline(
+            self._get_worker_scraper,
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            max_per_host=max_per_host,
+            parser=self.web_client.parser,
+            targeted=self.targeted_parse,
+            keep_raw=self.keep_raw,
+            parse_cache=self.parse_cache
+        )
+        yield from pipeline.run(urls, export, base_filename, formats)
+    
+    def run_many(self,
+                 urls: Iterable[str],
+                 max_workers: int = 4,
+                 max_per_host: int = 2,
+                 base_filename: str = "modular_scraped_data",
+                 ndjson_path: Optional[str] = None,
+                 ndjson_mode: str = "scan",
+                 pipeline: bool = False,
+                 parse_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Toplu tarama işlemini çalıştırır ve her sonucu dışa aktarır.
+        
+        DataExporter formatlarında "ndjson" varsa (veya ndjson_path verilirse)
+        tüm taramalar tek bir NDJSON dosyasına bittikçe eklenir; diğer
+        formatlar tarama başına ayrı dosyalara yazılır.
+        
+        Args:
+            urls: Hedef URL listesi
+            max_workers: Worker thread sayısı
+            max_per_host: Host başına eşzamanlı tarama sayısı
+            base_filename: Temel dosya adı
+            ndjson_path: Toplu NDJSON dosyası (varsayılan: `<base_filename>.ndjson`)
+            ndjson_mode: "scan" (tarama başına satır) veya "row" (bölüm satırı başına satır)
+            pipeline: Parse işini process havuzuna ayıran boru hattını kullan (scrape_pipelined)
+            parse_workers: Boru hattında parse process sayısı (varsayılan: CPU sayısı)
+            
+        Returns:
+            Başarılı ve başarısız tarama sayıları
+        """
+        summary = {"success": 0, "failed": 0}
+        
+        formats = list(self.data_exporter.formats)
+        if ndjson_path is None and "ndjson" in formats:
+            ndjson_path = f"{base_filename}.ndjson"
+        file_formats = [fmt for fmt in formats if fmt != "ndjson"]
+        ndjson_writer = NDJSONWriter(ndjson_path, mode=ndjson_mode) if ndjson_path else None
+        
+        try:
+            if pipeline:
+                results = self.scrape_pipelined(urls, fetch_workers=max_workers, parse_workers=parse_workers,
+                                                max_per_host=max_per_host, export=bool(file_formats),
+                                                base_filename=base_filename, formats=file_formats)
+            else:
+                results = self.scrape_many(urls, max_workers=max_workers, max_per_host=max_per_host,
+                                           export=bool(file_formats), base_filename=base_filename,
+                                           formats=file_formats)
+            for result in results:
+                if result["success"]:
+                    if ndjson_writer is not None:
+                        ndjson_writer.write_scan(result["data"])
+                    summary["success"] += 1
+                    print(f"✅ [{result['index']}] {result['url']} ({result['duration']:.1f} sn)")
+                else:
+                    summary["failed"] += 1
+                    print(f"❌ [{result['index']}] {result['url']}: {result['error']}")
+        finally:
+            if ndjson_writer is not None:
+                ndjson_writer.close()
+            self.cleanup()
+        
+        if ndjson_writer is not None:
+            print(f"NDJSON: {ndjson_writer.scans_written} tarama, {ndjson_writer.lines_written} satır -> {ndjson_path}")
+        
+        print("\n" + "=" * 60)
+        print(f"Toplu tarama tamamlandı: {summary['success']} başarılı, {summary['failed']} başarısız")
+        self._print_cache_stats()
+        print("=" * 60)
+        
+        return summary
+    
+    def run_queue(self,
+                  queue: JobQueue,
+                  max_workers: int = 4,
+                  max_per_host: int = 2,
+                  base_filename: str = "modular_scraped_data",
+                  ndjson_path: Optional[str] = None,
+                  ndjson_mode: str = "scan",
+                  requeue_in_flight: bool = False) -> Dict[str, int]:
+        """
+        Kalıcı iş kuyruğundaki bitmemiş taramaları çalıştırır.
+        
+        Her worker kuyruktan atomik olarak iş alır; başarılı tarama done
+        olarak ve sonuç dosyasının öneki (veya NDJSON dosyası) ile
+        işaretlenir, başarısız tarama deneme hakkı kaldıysa tekrar kuyruğa
+        döner. Kesilen bir çalıştırma aynı kuyrukla yeniden başlatıldığında
+        sadece bitmemiş işler yapılır. Dosya adları iş kimliğiyle
+        oluşturulur, böylece devam eden çalıştırmada da değişmez.
+        
+        Çalışan işlerin lease süresi arka planda heartbeat ile uzatılır;
+        lease_seconds'tan uzun süren tarama başka worker'a geçmez. İşi
+        elinden alınan worker'ın sonucu kuyruğa kaydedilmez.
+        
+        Args:
+            queue: JobQueue örneği
+            max_workers: Worker thread sayısı
+            max_per_host: Host başına eşzamanlı tarama sayısı
+            base_filename: Temel dosya adı
+            ndjson_path: Toplu NDJSON dosyası (varsayılan: `<base_filename>.ndjson`, eklenerek yazılır)
+            ndjson_mode: "scan" (tarama başına satır) veya "row" (bölüm satırı başına satır)
+            requeue_in_flight: Lease süresini beklemeden tüm in_flight işleri geri al
+                (kuyruğu başka process kullanmıyorsa, çökme sonrası hemen devam etmek için)
+            
+        Returns:
+            Bu çalıştırmadaki başarılı, tekrar denenecek ve başarısız tarama sayıları
+        """
+        summary = {"success": 0, "retried": 0, "failed": 0}
+        summary_lock = threading.Lock()
+        
+        formats = list(self.data_exporter.formats)
+        if ndjson_path is None and "ndjson" in formats:
+            ndjson_path = f"{base_filename}.ndjson"
+        file_formats = [fmt for fmt in formats if fmt != "ndjson"]
+        ndjson_writer = NDJSONWriter(ndjson_path, mode=ndjson_mode) if ndjson_path else None
+        
+        # Önceki çalıştırmadan kalan, lease süresi dolmuş (veya istenirse tüm) in_flight işleri geri al
+        requeued = queue.requeue_stale(force=requeue_in_flight)
+        if requeued:
+            print(f"↩️  {requeued} yarım kalmış iş tekrar kuyruğa alındı")
+        
+        stop = threading.Event()
+        active: Dict[int, str] = {}
+        active_lock = threading.Lock()
+        
+        def heartbeat():
+            while not stop.wait(queue.lease_seconds / 3):
+                with active_lock:
+                    jobs = list(active.items())
+                for job_id, worker in jobs:
+                    if not queue.heartbeat(job_id, worker):
+                        print(f"⚠️  [{job_id}] lease kaybedildi, iş başka bir worker'a geçmiş olabilir")
+        
+        def work(worker: str):
+            while not stop.is_set():
+                job = queue.claim(worker)
+                if job is None:
+                    # Tekrar denenmeyi bekleyen iş varsa süresini bekle
+                    wait = queue.next_available_in()
+                    if wait is None:
+                        return
+                    time.sleep(min(wait, 1.0))
+                    continue
+                
+                with active_lock:
+                    active[job["id"]] = worker
+                try:
+                    # Dosya adı zaman damgasız ve iş kimliğine bağlı: result_path gerçek dosyaları
+                    # gösterir, tekrar denenen iş aynı dosyaların üzerine yazar
+                    result = self._scrape_one(job["id"], job["url"], max_per_host,
+                                              bool(file_formats), base_filename, file_formats,
+                                              timestamped=False)
+                finally:
+                    with active_lock:
+                        active.pop(job["id"], None)
+                
+                if result["success"]:
+                    # Lease hâlâ bizdeyse uzatılır; elinden alınan işin satırı NDJSON'a yazılmaz
+                    owned = queue.heartbeat(job["id"], worker)
+                    if owned and ndjson_writer is not None:
+                        # İş done olmadan önce satırlar diske yazılmış olmalı
+                        ndjson_writer.write_scan(result["data"])
+                        ndjson_writer.flush()
+                    if not (owned and queue.complete(job["id"], result["output"] or ndjson_path, worker)):
+                        print(f"⚠️  [{job['id']}] {job['url']}: iş başka bir worker'a geçmiş, sonuç kaydedilmedi")
+                        continue
+                    with summary_lock:
+                        summary["success"] += 1
+                    print(f"✅ [{job['id']}] {job['url']} ({result['duration']:.1f} sn)")
+                else:
+                    state = queue.fail(job["id"], result["error"], worker)
+                    if state is None:
+                        print(f"⚠️  [{job['id']}] {job['url']}: iş başka bir worker'a geçmiş, hata kaydedilmedi")
+                        continue
+                    key = "retried" if state == "pending" else "failed"
+                    with summary_lock:
+                        summary[key] += 1
+                    print(f"❌ [{job['id']}] {job['url']} (deneme {job['attempts']}, {state}): {result['error']}")
+        
+        worker_prefix = f"{os.getpid()}-{threading.get_ident()}"
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="queue-worker")
+        heartbeat_thread = threading.Thread(target=heartbeat, name="queue-heartbeat", daemon=True)
+        heartbeat_thread.start()
+        try:
+            futures = [executor.submit(work, f"{worker_prefix}-{n}") for n in range(max(1, max_workers))]
+            for future in futures:
+                future.result()
+        finally:
+            # Kesintide (ör. Ctrl+C) worker'lar yeni iş almaz, ellerindeki taramayı bitirir
+            stop.set()
+            executor.shutdown(wait=True)
+            heartbeat_thread.join()
+            released = queue.release(f"{worker_prefix}-%")
+            if released:
+                print(f"↩️  {released} bitmemiş iş kuyruğa geri bırakıldı")
+            if ndjson_writer is not None:
+                ndjson_writer.close()
+            self.cleanup()
+        
+        if ndjson_writer is not None:
+            print(f"NDJSON: {ndjson_writer.scans_written} tarama, {ndjson_writer.lines_written} satır -> {ndjson_path}")
+        
+        stats = queue.get_stats()
+        print("\n" + "=" * 60)
+        print(f"Kuyruk çalıştırması tamamlandı: {summary['success']} başarılı, "
+              f"{summary['retried']} tekrar denendi, {summary['failed']} başarısız")
+        print(f"Kuyruk durumu: {stats['done']}/{stats['total']} tamamlandı, {stats['pending']} bekliyor, "
+              f"{stats['in_flight']} işlemde, {stats['failed']} başarısız")
+        self._print_cache_stats()
+        print("=" * 60)
+        
+        return summary
+    
     def cleanup(self):
         """Kaynakları temizler."""
         self.web_client.cleanup()
+        with self._host_lock:
+            worker_scrapers, self._worker_scrapers = self._worker_scrapers, []
+        for scraper in worker_scrapers:
+            scraper.cleanup()
+
+
+def _read_urls(urls: List[str], urls_file: Optional[str]) -> List[str]:
+    """Komut satırı ve dosyadan gelen URL'leri birleştirir."""
+    collected = list(urls)
+    if urls_file:
+        with open(urls_file, 'r', encoding='utf-8') as f:
+            collected.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    return collected
 
 
 def main():
     """Ana fonksiyon - örnek kullanım"""
-    url = "https://www.local-rank.report/scan/97919fde-e478-4081-983f-7e0065b6b5bb"
+    default_url = "https://www.local-rank.report/scan/97919fde-e478-4081-983f-7e0065b6b5bb"
+    
+    arg_parser = argparse.ArgumentParser(description="Local Rank Report modüler scraper")
+    arg_parser.add_argument("urls", nargs="*", help="Taranacak scan URL'leri")
+    arg_parser.add_argument("--urls-file", help="Her satırda bir URL içeren dosya")
+    arg_parser.add_argument("--ingest", metavar="KAYNAK",
+                            help="Kaydedilmiş rapor HTML'lerini çevrimdışı işle (dizin, glob veya dosya)")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Toplu modda worker sayısı")
+    arg_parser.add_argument("--max-per-host", type=int, default=2,
+                            help="Host başına eşzamanlı tarama sayısı")
+    arg_parser.add_argument("--analytics-concurrency", type=int, default=1,
+                            help="Analytics çağrılarında eşzamanlı istek sayısı (her istek host "
+                                 "rate limit'inden token alır; --burst ve --rate-limit ile birlikte ayarlayın)")
+    arg_parser.add_argument("--rate-limit", type=float, default=1.0, help="İstekler arası bekleme süresi")
+    arg_parser.add_argument("--burst", type=int, default=1, help="Host başına anlık izin verilen istek sayısı")
+    arg_parser.add_argument("--timeout", type=int, default=30, help="İstek zaman aşımı")
+    arg_parser.add_argument("--selenium", action="store_true", help="Selenium kullan")
+    arg_parser.add_argument("--cache", help="Disk tabanlı yanıt önbelleği dosyası (ör. http_cache.sqlite)")
+    arg_parser.add_argument("--cache-ttl", type=float, default=3600,
+                            help="Önbellek kayıtlarının yeniden doğrulamasız kullanılma süresi (saniye)")
+    arg_parser.add_argument("--parser", choices=["lxml", "html.parser"],
+                            help="BeautifulSoup parser backend'i (varsayılan: lxml)")
+    arg_parser.add_argument("--full-parse", action="store_true",
+                            help="Sayfanın tamamı için ağaç kur (varsayılan: sadece rapor bölgeleri)")
+    arg_parser.add_argument("--parse-cache", metavar="DIZIN",
+                            help="Parse sonuçları için disk önbelleği dizini (güvenilen bir dizin olmalı; "
+                                 "PARSE_CACHE_SECRET ortam değişkeni kayıtları HMAC ile imzalar)")
+    arg_parser.add_argument("--keep-raw", action="store_true",
+                            help="Sayıya çevrilen alanların ham metnini '(Ham)' sütunlarında sakla")
+    arg_parser.add_argument("--api-only", action="store_true",
+                            help="HTML bölümlerini parse etmeden sadece JavaScript/API verilerini çek")
+    arg_parser.add_argument("--formats", nargs="+", choices=SUPPORTED_FORMATS,
+                            help="Dışa aktarma formatları (varsayılan: json excel csv)")
+    arg_parser.add_argument("--parquet-partition", nargs="+", choices=PARTITION_COLUMNS,
+                            help="Parquet çıktısını bu sütunlara göre bölümle")
+    arg_parser.add_argument("--ndjson", metavar="DOSYA",
+                            help="Toplu çalıştırmada tüm taramaları bittikçe bu NDJSON dosyasına ekle (.gz ile sıkıştırılır)")
+    arg_parser.add_argument("--ndjson-mode", choices=NDJSON_MODES, default="scan",
+                            help="NDJSON satırı: tarama başına (scan) veya bölüm satırı başına (row)")
+    arg_parser.add_argument("--history-db", metavar="DOSYA",
+                            help="Taramaları bu SQLite geçmiş veritabanına da yaz (sqlite formatını ekler)")
+    arg_parser.add_argument("--pipeline", action="store_true",
+                            help="Toplu modda indirme/API thread'lerini ve parse process havuzunu ayır")
+    arg_parser.add_argument("--parse-workers", type=int,
+                            help="--pipeline ile parse process sayısı (varsayılan: CPU sayısı)")
+    arg_parser.add_argument("--queue", metavar="DOSYA",
+                            help="URL'leri bu kalıcı SQLite iş kuyruğuna ekle ve bitmemiş işleri çalıştır "
+                                 "(kesilen çalıştırma aynı dosyayla kaldığı yerden devam eder)")
+    arg_parser.add_argument("--max-attempts", type=int, default=3,
+                            help="Kuyruk modunda bir URL için en fazla deneme sayısı")
+    arg_parser.add_argument("--retry-failed", action="store_true",
+                            help="Kuyruk modunda başarısız işleri tekrar kuyruğa al")
+    arg_parser.add_argument("--requeue-in-flight", action="store_true",
+                            help="Kuyruk modunda çökmüş çalıştırmadan kalan in_flight işleri lease süresini "
+                                 "beklemeden geri al (kuyruğu başka process kullanmıyorsa)")
+    arg_parser.add_argument("--excel-engine", choices=["openpyxl", "xlsxwriter"], default="openpyxl",
+                            help="Excel akış modu motoru (xlsxwriter daha hızlı, kurulu olmalı)")
+    arg_parser.add_argument("--output", default="modular_scraped_data", help="Temel dosya adı")
+    args = arg_parser.parse_args()
+    
+    formats = list(args.formats) if args.formats else None
+    if args.history_db:
+        formats = formats or list(DEFAULT_FORMATS)
+        if "sqlite" not in formats:
+            formats.append("sqlite")
+    
+    data_exporter = DataExporter(
+        formats=formats,
+        parquet_partition_by=args.parquet_partition,
+        parquet_dataset_dir=f"{args.output}_parquet" if args.parquet_partition else None,
+        excel_engine=args.excel_engine,
+        history_db=args.history_db
+    )
+    
+    # Çevrimdışı mod: ağ istemcisi olmadan kayıtlı raporları işle
+    if args.ingest:
+        ingestor = ReportIngestor(data_exporter=data_exporter, max_workers=args.workers,
+                                  parser=args.parser, keep_raw=args.keep_raw)
+        summary = ingestor.ingest(args.ingest, args.output,
+                                  ndjson_path=args.ndjson, ndjson_mode=args.ndjson_mode)
+        if not summary["success"]:
+            print("\n❌ İşlem başarısız oldu")
+        return
+    
+    urls = _read_urls(args.urls, args.urls_file)
+    # Kuyruk modunda URL verilmezse sadece mevcut kuyruk işlenir
+    if not urls and not args.queue:
+        urls = [default_url]
+    
+    if args.analytics_concurrency > args.burst and args.rate_limit > 0:
+        print(f"⚠️  --analytics-concurrency {args.analytics_concurrency} > --burst {args.burst}: "
+              f"analytics istekleri host rate limit'i ({args.rate_limit} sn/istek) kadar hızlanabilir, "
+              f"eşzamanlılık süreyi kısaltmaz")
+    
+    cache = ResponseCache(args.cache, ttl=args.cache_ttl) if args.cache else None
+    # Disk kayıtları unpickle edilir; PARSE_CACHE_SECRET verilirse kayıtlar HMAC ile imzalanır
+    parse_cache = ParseCache(directory=args.parse_cache,
+                             namespace=f"sections-v{SECTIONS_VERSION}",
+                             secret=os.environ.get("PARSE_CACHE_SECRET")) if args.parse_cache else None
     
     # MainScraper örneği oluştur
     scraper = MainScraper(
-        use_selenium=False,  # Selenium kullanmadan başla
-        rate_limit=1.0,      # 1 saniye bekleme
-        timeout=30
+        use_selenium=args.selenium,
+        rate_limit=args.rate_limit,
+        timeout=args.timeout,
+        analytics_concurrency=args.analytics_concurrency,
+        burst=args.burst,
+        cache=cache,
+        parser=args.parser,
+        targeted_parse=not args.full_parse,
+        api_only=args.api_only,
+        parse_cache=parse_cache,
+        keep_raw=args.keep_raw,
+        data_exporter=data_exporter
     )
     
-    # Tam işlemi çalıştır
-    success = scraper.run(url, "modular_scraped_data")
+    if args.queue:
+        queue = JobQueue(args.queue, max_attempts=args.max_attempts)
+        added = queue.add(urls)
+        if args.retry_failed:
+            added += queue.retry_failed()
+        print(f"📋 Kuyruk: {added} yeni iş, {queue.get_stats()['total']} toplam ({args.queue})")
+        try:
+            summary = scraper.run_queue(queue, max_workers=args.workers,
+                                        max_per_host=args.max_per_host,
+                                        base_filename=args.output,
+                                        ndjson_path=args.ndjson,
+                                        ndjson_mode=args.ndjson_mode,
+                                        requeue_in_flight=args.requeue_in_flight)
+        finally:
+            queue.close()
+        success = summary["success"] > 0
+    # Birden fazla URL varsa toplu modda çalıştır
+    elif len(urls) > 1:
+        summary = scraper.run_many(urls, max_workers=args.workers,
+                                   max_per_host=args.max_per_host,
+                                   base_filename=args.output,
+                                   ndjson_path=args.ndjson,
+                                   ndjson_mode=args.ndjson_mode,
+                                   pipeline=args.pipeline,
+                                   parse_workers=args.parse_workers)
+        success = summary["success"] > 0
+    else:
+        success = scraper.run(urls[0], args.output)
     
     if success:
         print("\n📁 Oluşturulan dosyalar:")
-        print("   - modular_scraped_data_YYYYMMDD_HHMMSS.json")
-        print("   - modular_scraped_data_YYYYMMDD_HHMMSS.xlsx")
-        print("   - modular_scraped_data_YYYYMMDD_HHMMSS_*.csv")
+        if "json" in data_exporter.formats:
+            print(f"   - {args.output}_YYYYMMDD_HHMMSS.json")
+        if "excel" in data_exporter.formats:
+            print(f"   - {args.output}_YYYYMMDD_HHMMSS.xlsx")
+        if "csv" in data_exporter.formats:
+            print(f"   - {args.output}_YYYYMMDD_HHMMSS_*.csv")
+        if "parquet" in data_exporter.formats:
+            if data_exporter.parquet_partition_by:
+                print(f"   - {data_exporter.parquet_dataset_dir}/<bölüm>/")
+            else:
+                print(f"   - {args.output}_YYYYMMDD_HHMMSS_*.parquet")
+        if "ndjson" in data_exporter.formats:
+            print(f"   - {args.output}_YYYYMMDD_HHMMSS.ndjson")
+        if "sqlite" in data_exporter.formats:
+            print(f"   - {data_exporter.history_db}")
     else:
         print("\n❌ İşlem başarısız oldu")
 
 
 if __name__ == "__main__":
     main()
-
-
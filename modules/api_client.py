@@ -4,13 +4,22 @@ API Client Module
 API çağrıları için yardımcı modül
 """
 
-import time
-import random
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:
+    from .rate_limiter import HostRateLimiter, get_shared_limiter
+    from .response_cache import ResponseCache
+    from .soup_factory import make_soup, resolve_parser
+except ImportError:
+    from rate_limiter import HostRateLimiter, get_shared_limiter
+    from response_cache import ResponseCache
+    from soup_factory import make_soup, resolve_parser
+
 
 class APIClient:
     """API çağrıları için sınıf"""
@@ -18,17 +27,31 @@ class APIClient:
     def __init__(self, 
                  user_agent: str = None,
                  timeout: int = 30,
-                 rate_limit: float = 1.0):
+                 rate_limit: float = 1.0,
+                 max_concurrency: int = 1,
+                 burst: int = 1,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 parser: Optional[str] = None):
         """
         APIClient sınıfını başlatır.
         
         Args:
             user_agent: User-Agent string'i
             timeout: İstek zaman aşımı
-            rate_limit: Rate limiting süresi
+            rate_limit: Aynı host'a yapılan istekler arası süre (saniye)
+            max_concurrency: Analytics çağrılarında aynı anda uçuşta olabilecek istek sayısı
+            burst: Host başına anlık izin verilen istek sayısı
+            rate_limiter: Paylaşımlı host rate limiter'ı (verilmezse ortak limiter kullanılır)
+            cache: İsteğe bağlı disk tabanlı yanıt önbelleği
+            parser: BeautifulSoup parser backend'i ("lxml" veya "html.parser")
         """
         self.timeout = timeout
+        self.parser = resolve_parser(parser)
         self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or get_shared_limiter(rate_limit, burst)
+        self.cache = cache
+        self.max_concurrency = max(1, max_concurrency)
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -46,11 +69,15 @@ class APIClient:
         # Session for API calls
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # Paralel çağrılarda bağlantı havuzu tükenmesin
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(10, self.max_concurrency))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
-    def _rate_limit(self):
-        """Rate limiting uygular."""
-        if self.rate_limit > 0:
-            time.sleep(self.rate_limit + random.uniform(0, 0.5))
+    def _rate_limit(self, url: str):
+        """Host için token alınana kadar bekler."""
+        self.rate_limiter.acquire(url)
     
     def _get_text(self, elem, default: str = "N/A") -> str:
         """Güvenli bir şekilde element metnini çıkarır."""
@@ -61,6 +88,36 @@ class APIClient:
         except Exception:
             return default
     
+    def _request_endpoint(self, base_url: str, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        API endpoint'ini çağırır, hata durumunda exception fırlatır.
+        
+        Args:
+            base_url: Temel URL
+            endpoint: Endpoint yolu
+            params: Query parametreleri
+            
+        Returns:
+            API response verisi
+        """
+        url = urljoin(base_url, endpoint)
+        
+        if self.cache is not None:
+            response = self.cache.fetch(self.session, url, params=params, timeout=self.timeout,
+                                        before_request=self._rate_limit)
+        else:
+            self._rate_limit(url)
+            response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        
+        # JSON response kontrolü
+        if response.headers.get('content-type', '').startswith('application/json'):
+            return response.json()
+        else:
+            # HTML response ise parse et
+            soup = make_soup(response.text, self.parser)
+            return self._parse_html_response(soup)
+    
     def call_endpoint(self, base_url: str, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """
         API endpoint'ini çağırır.
@@ -74,20 +131,7 @@ class APIClient:
             API response verisi
         """
         try:
-            url = urljoin(base_url, endpoint)
-            self._rate_limit()
-            
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # JSON response kontrolü
-            if response.headers.get('content-type', '').startswith('application/json'):
-                return response.json()
-            else:
-                # HTML response ise parse et
-                soup = BeautifulSoup(response.text, "html.parser")
-                return self._parse_html_response(soup)
-                
+            return self._request_endpoint(base_url, endpoint, params)
         except Exception as e:
             print(f"API çağrısı hatası {endpoint}: {e}")
             return None
@@ -143,30 +187,60 @@ class APIClient:
         competitors_url = f"/scans/get-competitors-list?scan_guid={scan_guid}"
         return self.call_endpoint(base_url, competitors_url)
     
-    def get_analytics_data(self, base_url: str, pinz_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _call_analytics_pin(self, base_url: str, pin: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Tek bir pin için analytics endpoint'ini çağırır, (yanıt, hata) döndürür."""
+        try:
+            return self._request_endpoint(base_url, pin["url"]), None
+        except Exception as e:
+            print(f"API çağrısı hatası {pin['url']}: {e}")
+            return None, str(e)
+    
+    def get_analytics_data(self, base_url: str, pinz_data: List[Dict[str, Any]],
+                           max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Analytics API'lerini çağırır.
         
+        max_concurrency 1'den büyükse çağrılar sınırlı sayıda paralel
+        istekle yapılır; çıktı sırası her durumda pin sırasıyla aynıdır.
+        Başarısız pinler "analytics_response" None ve "error" alanı ile döner.
+        
+        Her istek host rate limiter'ından token alır; eşzamanlılık sadece
+        yanıt beklemelerini örtüştürür. burst, max_concurrency'den küçükse
+        toplam süre eşzamanlılıkla değil, rate limit ile sınırlıdır.
+        
         Args:
             base_url: Temel URL
             pinz_data: pinz array verisi
+            max_concurrency: Aynı anda uçuşta olabilecek istek sayısı
             
         Returns:
             Analytics verileri listesi
         """
         analytics_data = []
+        concurrency = max(1, max_concurrency or self.max_concurrency)
         
         try:
-            for pin in pinz_data:
-                if isinstance(pin, dict) and "url" in pin:
-                    analytics_url = pin["url"]
-                    if analytics_url.startswith("/analytics/"):
-                        analytics_response = self.call_endpoint(base_url, analytics_url)
-                        if analytics_response:
-                            analytics_data.append({
-                                "pin_data": pin,
-                                "analytics_response": analytics_response
-                            })
+            pins = [
+                pin for pin in pinz_data
+                if isinstance(pin, dict) and isinstance(pin.get("url"), str)
+                and pin["url"].startswith("/analytics/")
+            ]
+            
+            if concurrency > 1 and len(pins) > 1:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(pins)),
+                                        thread_name_prefix="analytics") as executor:
+                    responses = list(executor.map(lambda pin: self._call_analytics_pin(base_url, pin), pins))
+            else:
+                responses = [self._call_analytics_pin(base_url, pin) for pin in pins]
+            
+            for pin, (analytics_response, error) in zip(pins, responses):
+                entry = {
+                    "pin_data": pin,
+                    "analytics_response": analytics_response,
+                }
+                if error is not None:
+                    entry["error"] = error
+                analytics_data.append(entry)
                             
         except Exception as e:
             print(f"Analytics API çağrısı hatası: {e}")
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+History Store Module
+Taramaları zaman içinde sorgulanabilir halde tutan SQLite geçmiş deposu
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+try:
+    from .html_parser import parse_int, parse_float, parse_distance_km
+    from .records import to_plain
+except ImportError:
+    from html_parser import parse_int, parse_float, parse_distance_km
+    from records import to_plain
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY,
+    scan_key TEXT NOT NULL UNIQUE,
+    scan_guid TEXT,
+    url TEXT,
+    business TEXT,
+    address TEXT,
+    keyword TEXT,
+    language TEXT,
+    scan_date TEXT,
+    scanned_at TEXT,
+    rating REAL,
+    reviews INTEGER,
+    ranked_locations INTEGER,
+    total_locations INTEGER,
+    unranked_locations INTEGER,
+    average_rank REAL,
+    average_total_rank REAL,
+    best_rank INTEGER,
+    max_distance_km REAL,
+    scraped_at TEXT,
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scans_guid ON scans(scan_guid);
+CREATE INDEX IF NOT EXISTS idx_scans_business ON scans(business, scan_date);
+CREATE INDEX IF NOT EXISTS idx_scans_keyword ON scans(keyword, scan_date);
+CREATE INDEX IF NOT EXISTS idx_scans_date ON scans(scan_date);
+
+CREATE TABLE IF NOT EXISTS competitors (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    rating REAL,
+    reviews INTEGER,
+    address TEXT,
+    categories TEXT,
+    website TEXT,
+    photos INTEGER,
+    claim_status TEXT,
+    found_locations INTEGER,
+    average_rank REAL,
+    PRIMARY KEY (scan_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_competitors_name ON competitors(name, scan_id);
+
+CREATE TABLE IF NOT EXISTS sponsored_listings (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    rating REAL,
+    reviews INTEGER,
+    seen_count INTEGER,
+    PRIMARY KEY (scan_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_sponsored_name ON sponsored_listings(name, scan_id);
+
+CREATE TABLE IF NOT EXISTS detail_results (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    rank INTEGER,
+    name TEXT,
+    rating REAL,
+    reviews INTEGER,
+    address TEXT,
+    PRIMARY KEY (scan_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_detail_name ON detail_results(name, scan_id);
+
+CREATE TABLE IF NOT EXISTS map_pins (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    lat REAL,
+    lon REAL,
+    label TEXT,
+    title TEXT,
+    url TEXT,
+    color TEXT,
+    PRIMARY KEY (scan_id, position)
+);
+"""
+
+# Alt tablolar: (tablo, bölüm anahtarı, [(sütun, rapor anahtarı, dönüştürücü), ...])
+_CHILD_TABLES = (
+    ("competitors", "rakipler", (
+        ("name", "İsim", "text"),
+        ("rating", "Puan", "float"),
+        ("reviews", "Yorum Sayısı", "int"),
+        ("address", "Adres", "text"),
+        ("categories", "Kategoriler", "text"),
+        ("website", "Web Sitesi", "text"),
+        ("photos", "Fotoğraf Sayısı", "int"),
+        ("claim_status", "Sahiplenme Durumu", "text"),
+        ("found_locations", "Bulunduğu Konum Sayısı", "int"),
+        ("average_rank", "Ortalama Sıralama", "float"),
+    )),
+    ("sponsored_listings", "sponsorlu_listeler", (
+        ("name", "İsim", "text"),
+        ("rating", "Puan", "float"),
+        ("reviews", "Yorum Sayısı", "int"),
+        ("seen_count", "Görülme Sayısı", "int"),
+    )),
+    ("detail_results", "detayli_sonuclar", (
+        ("rank", "Sıra", "int"),
+        ("name", "İsim", "text"),
+        ("rating", "Puan", "float"),
+        ("reviews", "Yorum Sayısı", "int"),
+        ("address", "Adres", "text"),
+    )),
+    ("map_pins", "harita_verileri", (
+        ("lat", "lat", "float"),
+        ("lon", "lon", "float"),
+        ("label", "label", "text"),
+        ("title", "title", "text"),
+        ("url", "url", "text"),
+        ("color", "color", "text"),
+    )),
+)
+
+# Eski JSON çıktılarında Tarih "2025-08-07 13:05:02", yenilerinde raporun kendi biçimi
+_DATE_FORMATS = (
+    "%m/%d/%Y, %I:%M:%S %p GMT%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """Sayı veya metni tam sayıya çevirir ("Appeared in9searches" -> 9)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return None if value != value else int(value)
+    return parse_int(str(value))
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Sayı veya metni ondalık sayıya çevirir ("3.00" -> 3.0)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_float(str(value))
+
+
+def _as_text(value: Any) -> Optional[str]:
+    """Boş ve "N/A" değerleri NULL olarak saklar."""
+    if value is None or value == "N/A":
+        return None
+    return str(value)
+
+
+_CONVERTERS = {"int": _as_int, "float": _as_float, "text": _as_text}
+
+
+def parse_scan_datetime(text: Optional[str]) -> Optional[datetime]:
+    """
+    Rapordaki tarama tarihini datetime'a çevirir.
+
+    Args:
+        text: "8/7/2025, 4:05:02 PM GMT+03:00" veya "2025-08-07 13:05:02"
+
+    Returns:
+        datetime veya tanınmayan biçimde None
+    """
+    if not text or text == "N/A":
+        return None
+    text = text.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class HistoryStore:
+    """Tarama sonuçlarını normalleştirilmiş tablolarda tutan SQLite deposu"""
+
+    def __init__(self, path: str = "scan_history.sqlite"):
+        """
+        HistoryStore sınıfını başlatır.
+
+        Args:
+            path: SQLite veritabanı dosyası (":memory:" da olabilir)
+        """
+        self.path = path
+        self.stats = {"scans_written": 0, "rows_written": 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def scan_key(data: Dict[str, Any]) -> str:
+        """
+        Taramayı tekil olarak tanımlayan anahtarı üretir.
+
+        scan_guid çoğu raporda boş geldiğinden, yoksa rapor URL'i ve
+        rapordaki tarama tarihi birlikte kullanılır; aynı tarama tekrar
+        yazıldığında yeni satır açılmaz, mevcut satır güncellenir. Tarih
+        UTC'ye çevrilerek kullanılır; eski JSON çıktılarındaki
+        "2025-08-07 13:05:02" ile raporun "8/7/2025, 4:05:02 PM GMT+03:00"
+        biçimi aynı anahtarı üretir.
+
+        Args:
+            data: scrape_all / parse_report_html sonucu
+
+        Returns:
+            Tarama anahtarı
+        """
+        js_data = data.get("javascript_verileri") or {}
+        scan_guid = js_data.get("scan_guid")
+        if scan_guid:
+            return f"guid:{scan_guid}"
+
+        metadata = data.get("metadata") or {}
+        ozet = data.get("ozet_bilgiler") or {}
+        url = metadata.get("url") or metadata.get("source_file") or ""
+        tarih = ozet.get("Tarih") or metadata.get("scraped_at") or ""
+        scanned = parse_scan_datetime(tarih)
+        if scanned is not None:
+            if scanned.tzinfo is not None:
+                scanned = scanned.astimezone(timezone.utc).replace(tzinfo=None)
+            tarih = scanned.isoformat()
+        return f"url:{url}|{tarih}"
+
+    @staticmethod
+    def _scan_row(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Özet bilgileri ve metadata'yı scans tablosu sütunlarına çevirir."""
+        ozet = data.get("ozet_bilgiler") or {}
+        metadata = data.get("metadata") or {}
+        js_data = data.get("javascript_verileri") or {}
+
+        # "Hausverkauf| Language:de" -> ("Hausverkauf", "de")
+        keyword_text = ozet.get("Anahtar Kelime ve Dil") or ""
+        keyword, _, language = keyword_text.partition("|")
+        language = language.split(":", 1)[-1].strip() if language else None
+
+        scanned = parse_scan_datetime(ozet.get("Tarih"))
+        scraped_at = metadata.get("scraped_at")
+        if scanned is not None:
+            scan_date = scanned.date().isoformat()
+        else:
+            scan_date = (scraped_at or "")[:10] or None
+
+        max_distance = ozet.get("Max Distance")
+        if isinstance(max_distance, str):
+            max_distance = parse_distance_km(max_distance) or parse_float(max_distance)
+
+        return {
+            "scan_guid": js_data.get("scan_guid") or None,
+            "url": metadata.get("url"),
+            "business": _as_text(ozet.get("İşletme Adı")),
+            "address": _as_text(ozet.get("Adres")),
+            "keyword": keyword.strip() or None,
+            "language": language or None,
+            "scan_date": scan_date,
+            "scanned_at": scanned.isoformat() if scanned else _as_text(ozet.get("Tarih")),
+            "rating": _as_float(ozet.get("Puan")),
+            "reviews": _as_int(ozet.get("Yorum Sayısı")),
+            "ranked_locations": _as_int(ozet.get("Ranked Locations")),
+            "total_locations": _as_int(ozet.get("Total Locations")),
+            "unranked_locations": _as_int(ozet.get("Un Ranked Locations")),
+            "average_rank": _as_float(ozet.get("Average rank (Ranked Locations)")),
+            "average_total_rank": _as_float(ozet.get("Avg total rank (All Locations)")),
+            "best_rank": _as_int(ozet.get("Best rank")),
+            "max_distance_km": _as_float(max_distance),
+            "scraped_at": scraped_at,
+            "summary": json.dumps(ozet, ensure_ascii=False, default=str),
+        }
+
+    def _upsert_scan(self, data: Dict[str, Any]) -> Tuple[int, int]:
+        """Tek taramayı yazar (lock ve transaction altında); (scan_id, satır sayısı) döndürür."""
+        row = self._scan_row(data)
+        row["scan_key"] = self.scan_key(data)
+        columns = list(row)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "scan_key")
+        self._conn.execute(
+            f"INSERT INTO scans ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(scan_key) DO UPDATE SET {updates}",
+            [row[column] for column in columns],
+        )
+        scan_id = self._conn.execute("SELECT id FROM scans WHERE scan_key = ?", (row["scan_key"],)).fetchone()[0]
+
+        rows_written = 0
+        for table, section, fields in _CHILD_TABLES:
+            # Tekrar yazılan taramanın eski satırları yenileriyle değiştirilir
+            self._conn.execute(f"DELETE FROM {table} WHERE scan_id = ?", (scan_id,))
+            items = data.get(section) or []
+            if not isinstance(items, list) or not items:
+                continue
+            column_names = ", ".join(["scan_id", "position"] + [column for column, _, _ in fields])
+            placeholders = ", ".join("?" * (len(fields) + 2))
+            self._conn.executemany(
+                f"INSERT INTO {table} ({column_names}) VALUES ({placeholders})",
+                [
+                    [scan_id, position] + [_CONVERTERS[kind](item.get(key)) for _, key, kind in fields]
+                    for position, item in enumerate(items, start=1)
+                    if isinstance(item, dict)
+                ],
+            )
+            rows_written += len(items)
+        return scan_id, rows_written
+
+    def save_scans(self, scans: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Taramaları tek bir transaction içinde toplu olarak yazar.
+
+        Aynı anahtarlı tarama daha önce yazılmışsa güncellenir (upsert);
+        alt tablo satırları executemany ile eklenir.
+
+        Args:
+            scans: scrape_all / parse_report_html sonuçları
+
+        Returns:
+            Yazılan taramaların scan_id listesi
+        """
+        scan_ids = []
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                rows_written = 0
+                for data in scans:
+                    scan_id, rows = self._upsert_scan(to_plain(data))
+                    scan_ids.append(scan_id)
+                    rows_written += rows
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            self.stats["scans_written"] += len(scan_ids)
+            self.stats["rows_written"] += rows_written
+        return scan_ids
+
+    def save_scan(self, data: Dict[str, Any]) -> int:
+        """
+        Tek bir taramayı yazar.
+
+        Args:
+            data: scrape_all / parse_report_html sonucu
+
+        Returns:
+            Taramanın scan_id değeri
+        """
+        return self.save_scans([data])[0]
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, list(params)).fetchall()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _filters(**conditions: Any) -> Tuple[str, List[Any]]:
+        """None olmayan koşullardan WHERE ifadesi üretir (since/until tarih aralığıdır)."""
+        clauses, params = [], []
+        for column, value in conditions.items():
+            if value is None:
+                continue
+            if column == "since":
+                clauses.append("s.scan_date >= ?")
+            elif column == "until":
+                clauses.append("s.scan_date <= ?")
+            else:
+                clauses.append(f"{column} = ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def list_scans(self,
+                   business: Optional[str] = None,
+                   keyword: Optional[str] = None,
+                   since: Optional[str] = None,
+                   until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Kayıtlı taramaları tarih sırasıyla listeler.
+
+        Args:
+            business: İşletme adı
+            keyword: Anahtar kelime
+            since: Bu tarihten (YYYY-MM-DD) itibaren
+            until: Bu tarihe kadar
+
+        Returns:
+            scans tablosu satırları (summary hariç)
+        """
+        where, params = self._filters(**{"s.business": business, "s.keyword": keyword,
+                                          "since": since, "until": until})
+        return self._query(
+            "SELECT s.id, s.scan_key, s.scan_guid, s.url, s.business, s.keyword, s.language, "
+            "s.scan_date, s.scanned_at, s.rating, s.reviews, s.ranked_locations, s.total_locations, "
+            "s.average_rank, s.average_total_rank, s.best_rank, s.max_distance_km "
+            f"FROM scans s{where} ORDER BY s.scan_date, s.scanned_at",
+            params,
+        )
+
+    def competitor_rank_trend(self,
+                              name: str,
+                              keyword: Optional[str] = None,
+                              business: Optional[str] = None,
+                              since: Optional[str] = None,
+                              until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Bir rakibin taramalar boyunca sıralama eğilimini döndürür.
+
+        Args:
+            name: Rakip adı (rakipler tablosundaki "İsim")
+            keyword: Anahtar kelime
+            business: Taramanın yapıldığı işletme
+            since: Bu tarihten (YYYY-MM-DD) itibaren
+            until: Bu tarihe kadar
+
+        Returns:
+            Tarih sırasıyla scan_date, keyword, business, position,
+            average_rank, found_locations, rating ve reviews alanları
+        """
+        where, params = self._filters(**{"c.name": name, "s.keyword": keyword, "s.business": business,
+                                          "since": since, "until": until})
+        return self._query(
+            "SELECT s.id AS scan_id, s.scan_date, s.scanned_at, s.keyword, s.business, "
+            "c.position, c.average_rank, c.found_locations, c.rating, c.reviews "
+            f"FROM competitors c JOIN scans s ON s.id = c.scan_id{where} "
+            "ORDER BY s.scan_date, s.scanned_at",
+            params,
+        )
+
+    def business_rank_trend(self,
+                            business: str,
+                            keyword: Optional[str] = None,
+                            since: Optional[str] = None,
+                            until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Taranan işletmenin kendi sıralama özetlerinin eğilimini döndürür.
+
+        Args:
+            business: İşletme adı
+            keyword: Anahtar kelime
+            since: Bu tarihten (YYYY-MM-DD) itibaren
+            until: Bu tarihe kadar
+
+        Returns:
+            Tarih sırasıyla Rank Summary alanları
+        """
+        where, params = self._filters(**{"s.business": business, "s.keyword": keyword,
+                                          "since": since, "until": until})
+        return self._query(
+            "SELECT s.id AS scan_id, s.scan_date, s.scanned_at, s.keyword, s.ranked_locations, "
+            "s.total_locations, s.average_rank, s.average_total_rank, s.best_rank, s.rating, s.reviews "
+            f"FROM scans s{where} ORDER BY s.scan_date, s.scanned_at",
+            params,
+        )
+
+    def monthly_summary(self,
+                        business: Optional[str] = None,
+                        keyword: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Ay bazında ortalama sıralama özetini döndürür.
+
+        Args:
+            business: İşletme adı
+            keyword: Anahtar kelime
+
+        Returns:
+            month (YYYY-MM), business, keyword, scans, average_rank,
+            average_total_rank, best_rank ve average_ranked_locations alanları
+        """
+        where, params = self._filters(**{"s.business": business, "s.keyword": keyword})
+        return self._query(
+            "SELECT substr(s.scan_date, 1, 7) AS month, s.business, s.keyword, COUNT(*) AS scans, "
+            "AVG(s.average_rank) AS average_rank, AVG(s.average_total_rank) AS average_total_rank, "
+            "MIN(s.best_rank) AS best_rank, AVG(s.ranked_locations) AS average_ranked_locations "
+            f"FROM scans s{where} GROUP BY month, s.business, s.keyword ORDER BY month, s.business, s.keyword",
+            params,
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """Yazma sayaçlarını ve tablo satır sayılarını döndürür."""
+        with self._lock:
+            stats = dict(self.stats)
+            for table in ("scans",) + tuple(table for table, _, _ in _CHILD_TABLES):
+                stats[table] = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return stats
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır."""
+        with self._lock:
+            self._conn.close()
@@ -4,17 +4,84 @@ HTML Parser Module
 HTML parsing işlemleri için yardımcı modül
 """
 
-import re
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 
+try:
+    from .records import CompetitorRecord, SponsoredListingRecord, DetailResultRecord, RAW_SUFFIX
+    from . import patterns
+except ImportError:
+    from records import CompetitorRecord, SponsoredListingRecord, DetailResultRecord, RAW_SUFFIX
+    import patterns
+
+
+# Mesafe birimlerinin km karşılıkları
+DISTANCE_UNITS_KM = {"km": 1.0, "m": 0.001, "mi": 1.609344}
+
+
+def parse_int(text: Optional[str]) -> Optional[int]:
+    """
+    Metindeki ilk tam sayıyı döndürür ("Appeared in9searches" -> 9, "1,234" -> 1234).
+    
+    Args:
+        text: Ham metin
+        
+    Returns:
+        Tam sayı veya sayı yoksa None
+    """
+    if not text:
+        return None
+    match = patterns.INT_RE.search(text)
+    return int(match.group(0).replace(",", "")) if match else None
+
+
+def parse_float(text: Optional[str]) -> Optional[float]:
+    """
+    Metindeki ilk ondalık sayıyı döndürür ("3.00" -> 3.0, "4,9" -> 4.9).
+    
+    Args:
+        text: Ham metin
+        
+    Returns:
+        Ondalık sayı veya sayı yoksa None
+    """
+    if not text:
+        return None
+    match = patterns.FLOAT_RE.search(text)
+    return float(match.group(0).replace(",", ".")) if match else None
+
+
+def parse_distance_km(text: Optional[str]) -> Optional[float]:
+    """
+    Mesafe metnini kilometreye çevirir ("11.32 km" -> 11.32, "800 m" -> 0.8).
+    
+    Args:
+        text: Ham metin
+        
+    Returns:
+        Kilometre cinsinden mesafe veya None
+    """
+    if not text:
+        return None
+    match = patterns.DISTANCE_RE.search(text)
+    if not match:
+        return parse_float(text)
+    value = float(match.group(1).replace(",", "."))
+    return round(value * DISTANCE_UNITS_KM[match.group(2).lower()], 6)
+
 
 class HTMLParser:
     """HTML parsing işlemleri için sınıf"""
     
-    def __init__(self):
-        """HTMLParser sınıfını başlatır."""
-        pass
+    def __init__(self, keep_raw: bool = False):
+        """
+        HTMLParser sınıfını başlatır.
+        
+        Args:
+            keep_raw: Sayıya çevrilen alanların ham metnini de sakla
+                ("<alan> (Ham)" anahtarıyla)
+        """
+        self.keep_raw = keep_raw
     
     def _get_text(self, elem, default: str = "N/A") -> str:
         """
@@ -34,58 +101,164 @@ class HTMLParser:
         except Exception:
             return default
     
-    def _extract_rating_and_reviews(self, container) -> Dict[str, str]:
+    @staticmethod
+    def _has_class(tag, name: str, cls: str) -> bool:
+        return tag is not None and tag.name == name and cls in (tag.get("class") or ())
+    
+    def _index_row(self, row) -> Dict[str, Any]:
+        """
+        Satır/panel alt ağacını tek geçişte dolaşıp gereken elementleri toplar.
+        
+        Her anahtar, karşılık gelen seçicinin select_one sonucunu verir
+        (ör. rating_stars -> RATING_STARS_SEL, reviews_span -> REVIEWS_SPAN_SEL,
+        found_locations -> FOUND_LOCATIONS_SEL); last_td, find_all("td")[-1]
+        karşılığıdır.
+        
+        Args:
+            row: Tablo satırı veya panel elementi
+            
+        Returns:
+            Anahtar -> element sözlüğü
+        """
+        found: Dict[str, Any] = {}
+        targets = patterns.ROW_CLASS_TARGETS
+        
+        for tag in row.descendants:
+            name = tag.name
+            if name is None:
+                continue
+            
+            for cls in tag.get("class") or ():
+                key = targets.get((name, cls))
+                if key is None or key in found:
+                    continue
+                if key == "rating_stars":
+                    # div.rating-container div.rating-stars
+                    if not any(self._has_class(parent, "div", "rating-container")
+                               for parent in tag.parents if parent is not row):
+                        continue
+                found[key] = tag
+                if key == "rating_container":
+                    # div.rating-container + span
+                    sibling = next((s for s in tag.next_siblings if s.name is not None), None)
+                    if sibling is not None and sibling.name == "span" and "reviews_span" not in found:
+                        found["reviews_span"] = sibling
+            
+            if name == "td":
+                found["last_td"] = tag
+            elif name == "h5":
+                found.setdefault("h5", tag)
+                if "found_locations" not in found and self._has_class(tag.parent, "td", "text-center"):
+                    found["found_locations"] = tag
+            elif name == "p":
+                if "categories" not in found and tag.string is not None \
+                        and patterns.CATEGORIES_RE.search(tag.string):
+                    found["categories"] = tag
+            elif name == "span":
+                if "claim_status" not in found and tag.string is not None \
+                        and patterns.CLAIM_STATUS_RE.search(tag.string):
+                    found["claim_status"] = tag
+        
+        return found
+    
+    def _extract_rating_and_reviews(self, container, index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Yıldız puanı ve yorum sayısını çıkarır.
         
         Bu fonksiyon, aynı satır/panel içerisinde bulunan
         `div.rating-container` ve onu takip eden `span` içinden
-        puan (yıldız) ve yorum sayısını ayrıştırır.
+        puan (yıldız, float) ve yorum sayısını (int) ayrıştırır.
+        Puan bulunamazsa None, yorum sayısı bulunamazsa 0 döner.
+        index verilirse (_index_row) elementler tekrar aranmaz.
         """
-        rating_value: Optional[str] = None
-        reviews_count: Optional[str] = None
+        rating_value: Optional[float] = None
+        rating_text: Optional[str] = None
+        reviews_count: Optional[int] = None
+        reviews_text = ""
 
         try:
             # 1) Puan: rating-stars title="4.9 out of 5" üzerinden
-            rating_stars = container.select_one("div.rating-container div.rating-stars")
+            if index is None:
+                rating_stars = patterns.RATING_STARS_SEL.select_one(container)
+                reviews_span = patterns.REVIEWS_SPAN_SEL.select_one(container)
+            else:
+                rating_stars = index.get("rating_stars")
+                reviews_span = index.get("reviews_span")
+            
             if rating_stars:
                 title_text = rating_stars.get("title", "")
-                m = re.search(r"([0-9]+(?:[\.,][0-9]+)?)\s*out\s*of\s*5", title_text, re.I)
+                m = patterns.RATING_TITLE_RE.search(title_text)
                 if m:
-                    rating_value = m.group(1).replace(",", ".")
+                    rating_text = m.group(1).replace(",", ".")
+                    rating_value = float(rating_text)
             # 2) Alternatif: style width: 98% -> 4.9
             if rating_value is None and rating_stars and rating_stars.has_attr("style"):
-                m2 = re.search(r"width:\s*([0-9]+)%", rating_stars["style"])  # type: ignore[index]
+                m2 = patterns.RATING_WIDTH_RE.search(rating_stars["style"])  # type: ignore[index]
                 if m2:
                     pct = int(m2.group(1))
-                    rating_value = f"{round(pct * 5 / 100, 1)}"
+                    rating_value = round(pct * 5 / 100, 1)
+                    rating_text = f"{rating_value}"
 
             # 3) Yorum sayısı: rating-container + span -> "(35)" veya "(35 Reviews)"
-            reviews_span = container.select_one("div.rating-container + span")
             if reviews_span:
-                text = self._get_text(reviews_span, default="")
-                m3 = re.search(r"\(?\s*([0-9]+)\s*(?:Reviews?|Yorum(?:lar)?|Değerlendirme)?\s*\)?", text, re.I)
+                reviews_text = self._get_text(reviews_span, default="")
+                m3 = patterns.REVIEWS_RE.search(reviews_text)
                 if m3:
-                    reviews_count = m3.group(1)
+                    reviews_count = int(m3.group(1).replace(",", ""))
         except Exception:
             pass
 
         # Normalleştir
-        if rating_value is None:
-            rating_value = "N/A"
         if reviews_count is None:
-            reviews_count = "0"
+            reviews_count = 0
 
-        combined = rating_value if rating_value != "N/A" else ""
-        if reviews_count and reviews_count != "0":
+        combined = rating_text or ""
+        if reviews_count:
             combined = f"{combined} ({reviews_count})".strip()
         if not combined:
             combined = "N/A"
 
-        return {
+        result = {
             "Puan": rating_value,
             "Yorum Sayısı": reviews_count,
             "Puan/Yorum": combined,
         }
+        if self.keep_raw:
+            result["Puan" + RAW_SUFFIX] = rating_text
+            result["Yorum Sayısı" + RAW_SUFFIX] = reviews_text
+        return result
+    
+    def _raw_values(self, rating_info: Dict[str, Any], **fields: Optional[str]) -> Optional[Dict[str, Optional[str]]]:
+        """keep_raw açıksa kayıtlara eklenecek ham metinleri toplar."""
+        if not self.keep_raw:
+            return None
+        raw = {key: rating_info.get(key + RAW_SUFFIX) for key in ("Puan", "Yorum Sayısı")}
+        raw.update(fields)
+        return raw
+    
+    def _parse_scan_table(self, scan_table) -> Dict[str, Any]:
+        """Scan Information tablosunun içeriğini çıkarır."""
+        results = {}
+        results["İşletme Adı"] = self._get_text(patterns.BIZNAME_SEL.select_one(scan_table))
+        results["Adres"] = self._get_text(patterns.CENTER_BLOCK_SEL.select_one(scan_table))
+        # Yorum sayısı ve puanı birlikte al
+        rating_info = self._extract_rating_and_reviews(scan_table)
+        results.update({
+            "Puan": rating_info.get("Puan"),
+            "Yorum Sayısı": rating_info.get("Yorum Sayısı", 0),
+        })
+        if self.keep_raw:
+            results["Puan" + RAW_SUFFIX] = rating_info.get("Puan" + RAW_SUFFIX)
+            results["Yorum Sayısı" + RAW_SUFFIX] = rating_info.get("Yorum Sayısı" + RAW_SUFFIX)
+        
+        # Anahtar Kelime ve Dil
+        kw_td = scan_table.find("td", string=patterns.KEYWORD_RE)
+        kw_val_td = kw_td.find_next_sibling("td") if kw_td else None
+        results["Anahtar Kelime ve Dil"] = self._get_text(kw_val_td)
+        
+        # Tarih
+        date_td = scan_table.find("td", class_=patterns.LOCAL_DATE_CLASS_RE)
+        results["Tarih"] = self._get_text(date_td)
+        return results
     
     def parse_scan_information(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
@@ -100,33 +273,78 @@ class HTMLParser:
         results = {}
         
         try:
-            scan_header = soup.find("h4", string=re.compile(r"^\s*Scan Information\s*$", re.I))
+            scan_header = soup.find("h4", string=patterns.SCAN_INFORMATION_RE)
             if scan_header:
                 scan_table = scan_header.find_next("table")
                 if scan_table:
-                    results["İşletme Adı"] = self._get_text(scan_table.select_one("span.bizname"))
-                    results["Adres"] = self._get_text(scan_table.select_one("span.center-block"))
-                    # Yorum sayısı ve puanı birlikte al
-                    rating_info = self._extract_rating_and_reviews(scan_table)
-                    results.update({
-                        "Puan": rating_info.get("Puan", "N/A"),
-                        "Yorum Sayısı": rating_info.get("Yorum Sayısı", "0"),
-                    })
-                    
-                    # Anahtar Kelime ve Dil
-                    kw_td = scan_table.find("td", string=re.compile(r"Keyword", re.I))
-                    kw_val_td = kw_td.find_next_sibling("td") if kw_td else None
-                    results["Anahtar Kelime ve Dil"] = self._get_text(kw_val_td)
-                    
-                    # Tarih
-                    date_td = scan_table.find("td", class_=re.compile(r"cnv_dt_lcl", re.I))
-                    results["Tarih"] = self._get_text(date_td)
+                    results = self._parse_scan_table(scan_table)
                     
         except Exception as e:
             print(f"Scan Information parse hatası: {e}")
         
         return results
     
+    def _parse_rank_table(self, rank_table) -> Dict[str, Any]:
+        """
+        Rank Summary tablosunun satırlarını çıkarır.
+        
+        Konum sayıları ve en iyi sıra int, ortalamalar float, Max Distance
+        km cinsinden float olarak döner; "48/49" biçimindeki değer
+        Ranked Locations ve Total Locations olarak ayrılır.
+        """
+        results = {}
+        for tr in patterns.TABLE_ROWS_SEL.select(rank_table):
+            tds = tr.find_all("td")
+            if len(tds) >= 2:
+                key_cell = tds[0]
+                # Icon'ları kaldır
+                for icon in key_cell.find_all("icon"):
+                    icon.decompose()
+                key = self._get_text(key_cell, default="")
+                
+                value_cell = tds[1]
+                value = self._get_text(value_cell, default="")
+                
+                if key:
+                    if "Ranked Locations" in key and "Un Ranked Locations" not in key:
+                        spans = value_cell.find_all("span")
+                        if len(spans) >= 2:
+                            results["Ranked Locations"] = parse_int(self._get_text(spans[0], default=""))
+                            results["Total Locations"] = parse_int(self._get_text(spans[1], default=""))
+                        elif "/" in value:
+                            ranked, _, total = value.partition("/")
+                            results["Ranked Locations"] = parse_int(ranked)
+                            results["Total Locations"] = parse_int(total)
+                        else:
+                            results["Ranked Locations"] = parse_int(value)
+                        name = "Ranked Locations"
+                    elif "Un Ranked Locations" in key:
+                        name = "Un Ranked Locations"
+                        results[name] = parse_int(value)
+                    elif "Average rank" in key:
+                        span = key_cell.find("span")
+                        if span and span.get("title"):
+                            name = "Average rank (Ranked Locations)"
+                        else:
+                            name = "Average rank"
+                        results[name] = parse_float(value)
+                    elif "Avg total rank" in key:
+                        name = "Avg total rank (All Locations)"
+                        results[name] = parse_float(value)
+                    elif "Best rank" in key:
+                        name = "Best rank"
+                        results[name] = parse_int(value)
+                    elif "Max Distance" in key:
+                        name = "Max Distance"
+                        results[name] = parse_distance_km(value)
+                    else:
+                        results[key] = value or "N/A"
+                        continue
+                    
+                    if self.keep_raw:
+                        results[name + RAW_SUFFIX] = value
+        return results
+    
     def parse_rank_summary(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Rank Summary tablosunu parse eder.
@@ -140,54 +358,76 @@ class HTMLParser:
         results = {}
         
         try:
-            rank_header = soup.find("h4", string=re.compile(r"^\s*Rank Summary\s*$", re.I))
+            rank_header = soup.find("h4", string=patterns.RANK_SUMMARY_RE)
             if rank_header:
                 rank_table = rank_header.find_next("table")
                 if rank_table:
-                    for tr in rank_table.select("tr"):
-                        tds = tr.find_all("td")
-                        if len(tds) >= 2:
-                            key_cell = tds[0]
-                            # Icon'ları kaldır
-                            for icon in key_cell.find_all("icon"):
-                                icon.decompose()
-                            key = self._get_text(key_cell, default="")
-                            
-                            value_cell = tds[1]
-                            value = self._get_text(value_cell)
-                            
-                            if key:
-                                if "Ranked Locations" in key:
-                                    spans = value_cell.find_all("span")
-                                    if len(spans) >= 2:
-                                        ranked = self._get_text(spans[0])
-                                        total = self._get_text(spans[1])
-                                        results["Ranked Locations"] = f"{ranked}/{total}"
-                                    else:
-                                        results["Ranked Locations"] = value
-                                elif "Un Ranked Locations" in key:
-                                    results["Un Ranked Locations"] = value
-                                elif "Average rank" in key:
-                                    span = key_cell.find("span")
-                                    if span and span.get("title"):
-                                        results["Average rank (Ranked Locations)"] = value
-                                    else:
-                                        results["Average rank"] = value
-                                elif "Avg total rank" in key:
-                                    results["Avg total rank (All Locations)"] = value
-                                elif "Best rank" in key:
-                                    results["Best rank"] = value
-                                elif "Max Distance" in key:
-                                    results["Max Distance"] = value
-                                else:
-                                    results[key] = value
+                    results = self._parse_rank_table(rank_table)
                                     
         except Exception as e:
             print(f"Rank Summary parse hatası: {e}")
         
         return results
     
-    def parse_competitors(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_competitor_row(self, row) -> CompetitorRecord:
+        """Rakip tablosundaki tek bir satırı çıkarır."""
+        index = self._index_row(row)
+        rating_info = self._extract_rating_and_reviews(row, index)
+        
+        # Adres
+        addr_span = None
+        map_icon = index.get("map_marker")
+        if map_icon:
+            addr_span = map_icon.find_parent("span")
+        
+        # Kategoriler
+        cat_p = index.get("categories")
+        
+        # Web Sitesi
+        website_link = None
+        globe_icon = index.get("globe")
+        if globe_icon:
+            parent_span = globe_icon.find_parent("span")
+            if parent_span:
+                a_tag = parent_span.find("a", href=True)
+                if a_tag:
+                    website_link = a_tag["href"]
+        
+        # Fotoğraf Sayısı
+        photo_span = None
+        photo_icon = index.get("photo")
+        if photo_icon:
+            photo_span = photo_icon.find_parent("span")
+        
+        # Sahiplenme Durumu
+        claim_span = index.get("claim_status")
+        
+        photos = self._get_text(photo_span, default="")
+        found_locations = self._get_text(index.get("found_locations"), default="")
+        average_rank = self._get_text(index.get("average_rank"), default="")
+        
+        return CompetitorRecord(
+            name=self._get_text(index.get("name_link")),
+            rating=rating_info.get("Puan"),
+            reviews=rating_info.get("Yorum Sayısı", 0),
+            rating_reviews=rating_info.get("Puan/Yorum", "N/A"),
+            address=self._get_text(addr_span),
+            categories=self._get_text(cat_p),
+            website=website_link or "N/A",
+            photos=parse_int(photos),
+            claim_status=self._get_text(claim_span),
+            # Bulunduğu Konum Sayısı
+            found_locations=parse_int(found_locations),
+            # Ortalama Sıralama
+            average_rank=parse_float(average_rank),
+            raw=self._raw_values(rating_info, **{
+                "Fotoğraf Sayısı": photos,
+                "Bulunduğu Konum Sayısı": found_locations,
+                "Ortalama Sıralama": average_rank,
+            }),
+        )
+    
+    def parse_competitors(self, soup: BeautifulSoup) -> List[CompetitorRecord]:
         """
         Rakip bilgilerini parse eder.
         
@@ -200,64 +440,34 @@ class HTMLParser:
         competitors = []
         
         try:
-            rows = soup.select("table#tbl_comp_rank tbody tr")
+            rows = patterns.COMPETITOR_ROWS_SEL.select(soup)
             
             for row in rows:
-                rating_info = self._extract_rating_and_reviews(row)
-                comp = {
-                    "İsim": self._get_text(row.select_one("a.ext")),
-                    "Puan": rating_info.get("Puan", "N/A"),
-                    "Yorum Sayısı": rating_info.get("Yorum Sayısı", "0"),
-                    "Puan/Yorum": rating_info.get("Puan/Yorum", "N/A"),
-                }
-                
-                # Adres
-                addr_span = None
-                map_icon = row.select_one("i.fa-map-marker")
-                if map_icon:
-                    addr_span = map_icon.find_parent("span")
-                comp["Adres"] = self._get_text(addr_span)
-                
-                # Kategoriler
-                cat_p = row.find("p", string=re.compile(r"Categories:", re.I))
-                comp["Kategoriler"] = self._get_text(cat_p)
-                
-                # Web Sitesi
-                website_link = None
-                globe_icon = row.select_one("i.fa-globe")
-                if globe_icon:
-                    parent_span = globe_icon.find_parent("span")
-                    if parent_span:
-                        a_tag = parent_span.find("a", href=True)
-                        if a_tag:
-                            website_link = a_tag["href"]
-                comp["Web Sitesi"] = website_link or "N/A"
-                
-                # Fotoğraf Sayısı
-                photo_span = None
-                photo_icon = row.select_one("i.fa-photo")
-                if photo_icon:
-                    photo_span = photo_icon.find_parent("span")
-                comp["Fotoğraf Sayısı"] = self._get_text(photo_span)
-                
-                # Sahiplenme Durumu
-                claim_span = row.find("span", string=re.compile(r"(Claimed|Un\s*Claimed)", re.I))
-                comp["Sahiplenme Durumu"] = self._get_text(claim_span)
-                
-                # Bulunduğu Konum Sayısı
-                comp["Bulunduğu Konum Sayısı"] = self._get_text(row.select_one("td.text-center > h5"))
-                
-                # Ortalama Sıralama
-                comp["Ortalama Sıralama"] = self._get_text(row.select_one("span.dotlg2"))
-                
-                competitors.append(comp)
+                competitors.append(self._parse_competitor_row(row))
                 
         except Exception as e:
             print(f"Rakip bilgileri parse hatası: {e}")
         
         return competitors
     
-    def parse_sponsorlu_listeler(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_sponsorlu_row(self, row) -> SponsoredListingRecord:
+        """Sponsorlu liste tablosundaki tek bir satırı çıkarır."""
+        index = self._index_row(row)
+        isim = self._get_text(index.get("name_link"))
+        rating_info = self._extract_rating_and_reviews(row, index)
+        gorulme_sayisi = self._get_text(index.get("last_td"), default="")
+        
+        return SponsoredListingRecord(
+            name=isim,
+            rating=rating_info.get("Puan"),
+            reviews=rating_info.get("Yorum Sayısı", 0),
+            rating_reviews=rating_info.get("Puan/Yorum", "N/A"),
+            # "Appeared in9searches" -> 9
+            seen_count=parse_int(gorulme_sayisi),
+            raw=self._raw_values(rating_info, **{"Görülme Sayısı": gorulme_sayisi}),
+        )
+    
+    def parse_sponsorlu_listeler(self, soup: BeautifulSoup) -> List[SponsoredListingRecord]:
         """
         Sponsorlu liste bilgilerini parse eder.
         
@@ -270,28 +480,44 @@ class HTMLParser:
         listings = []
         
         try:
-            rows = soup.select("table#tbl_ads_rank tbody tr")
+            rows = patterns.ADS_ROWS_SEL.select(soup)
             
             for row in rows:
-                tds = row.find_all("td")
-                isim = self._get_text(row.select_one("a.ext"))
-                rating_info = self._extract_rating_and_reviews(row)
-                gorulme_sayisi = self._get_text(tds[-1] if tds else None)
-                
-                listings.append({
-                    "İsim": isim,
-                    "Puan": rating_info.get("Puan", "N/A"),
-                    "Yorum Sayısı": rating_info.get("Yorum Sayısı", "0"),
-                    "Puan/Yorum": rating_info.get("Puan/Yorum", "N/A"),
-                    "Görülme Sayısı": gorulme_sayisi,
-                })
+                listings.append(self._parse_sponsorlu_row(row))
                 
         except Exception as e:
             print(f"Sponsorlu liste parse hatası: {e}")
         
         return listings
     
-    def parse_detayli_sonuclar(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_detail_panel(self, panel) -> DetailResultRecord:
+        """Detaylı sonuçlar modalındaki tek bir paneli çıkarır."""
+        index = self._index_row(panel)
+        rank = self._get_text(index.get("detail_rank"), default="")
+        name = self._get_text(index.get("h5"))
+        rating_info = self._extract_rating_and_reviews(panel, index)
+        
+        address_div = None
+        rating_span = index.get("reviews_span")
+        if rating_span:
+            address_div = rating_span.find_next("div")
+        address = self._get_text(address_div)
+        
+        return DetailResultRecord(
+            rank=parse_int(rank),
+            name=name,
+            rating=rating_info.get("Puan"),
+            reviews=rating_info.get("Yorum Sayısı", 0),
+            rating_reviews=rating_info.get("Puan/Yorum", "N/A"),
+            address=address,
+            raw=self._raw_values(rating_info, **{"Sıra": rank}),
+        )
+    
+    def _parse_detail_container(self, container) -> List[DetailResultRecord]:
+        """div.results_body içindeki tüm panelleri çıkarır."""
+        return [self._parse_detail_panel(panel) for panel in patterns.DETAIL_PANELS_SEL.select(container)]
+    
+    def parse_detayli_sonuclar(self, soup: BeautifulSoup) -> List[DetailResultRecord]:
         """
         Detaylı sonuç bilgilerini parse eder.
         
@@ -304,34 +530,81 @@ class HTMLParser:
         detaylar = []
         
         try:
-            container = soup.select_one("div#resultModal div.results_body")
+            container = patterns.DETAIL_CONTAINER_SEL.select_one(soup)
             if not container:
                 return detaylar
             
-            panels = container.select("div.bg-light.panel-body")
-            for panel in panels:
-                rank = self._get_text(panel.select_one("span.dot"))
-                name = self._get_text(panel.select_one("h5"))
-                rating_info = self._extract_rating_and_reviews(panel)
-                
-                address_div = None
-                rating_span = panel.select_one("div.rating-container + span")
-                if rating_span:
-                    address_div = rating_span.find_next("div")
-                address = self._get_text(address_div)
-                
-                detaylar.append({
-                    "Sıra": rank,
-                    "İsim": name,
-                    "Puan": rating_info.get("Puan", "N/A"),
-                    "Yorum Sayısı": rating_info.get("Yorum Sayısı", "0"),
-                    "Puan/Yorum": rating_info.get("Puan/Yorum", "N/A"),
-                    "Adres": address,
-                })
+            detaylar = self._parse_detail_container(container)
                 
         except Exception as e:
             print(f"Detaylı sonuçlar parse hatası: {e}")
         
         return detaylar
-
-
+    
+    def parse_report(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Tüm rapor bölümlerini dokümanı tek geçişte dolaşarak parse eder.
+        
+        Her h4/table/div düğümü doküman sırasıyla bir kez ziyaret edilir ve
+        ilgili bölüm işleyicisine yönlendirilir. Sonuç, beş ayrı parse_*
+        çağrısının döndürdüğü değerlerle aynıdır.
+        
+        Args:
+            soup: BeautifulSoup objesi
+            
+        Returns:
+            scan_information, rank_summary, competitors, sponsorlu_listeler
+            ve detayli_sonuclar alanları
+        """
+        results = {
+            "scan_information": {},
+            "rank_summary": {},
+            "competitors": [],
+            "sponsorlu_listeler": [],
+            "detayli_sonuclar": [],
+        }
+        
+        # Başlığı görülen, bir sonraki tabloyu bekleyen bölümler
+        pending: List[str] = []
+        done = set()
+        
+        for node in soup.find_all(["h4", "table", "div"]):
+            try:
+                if node.name == "h4":
+                    title = node.string
+                    if title is None:
+                        continue
+                    for section, pattern in (("scan_information", patterns.SCAN_INFORMATION_RE),
+                                             ("rank_summary", patterns.RANK_SUMMARY_RE)):
+                        if section not in done and section not in pending and pattern.search(title):
+                            pending.append(section)
+                
+                elif node.name == "table":
+                    while pending:
+                        section = pending.pop(0)
+                        done.add(section)
+                        if section == "scan_information":
+                            results[section] = self._parse_scan_table(node)
+                        else:
+                            results[section] = self._parse_rank_table(node)
+                    
+                    table_id = node.get("id")
+                    if table_id == "tbl_comp_rank":
+                        results["competitors"].extend(
+                            self._parse_competitor_row(row) for row in patterns.TBODY_ROWS_SEL.select(node)
+                        )
+                    elif table_id == "tbl_ads_rank":
+                        results["sponsorlu_listeler"].extend(
+                            self._parse_sponsorlu_row(row) for row in patterns.TBODY_ROWS_SEL.select(node)
+                        )
+                
+                elif node.get("id") == "resultModal" and "detayli_sonuclar" not in done:
+                    done.add("detayli_sonuclar")
+                    container = patterns.RESULTS_BODY_SEL.select_one(node)
+                    if container:
+                        results["detayli_sonuclar"] = self._parse_detail_container(container)
+                        
+            except Exception as e:
+                print(f"Rapor parse hatası ({node.name}): {e}")
+        
+        return results
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Job Queue Module
+Toplu taramalar için kaldığı yerden devam edebilen SQLite tabanlı iş kuyruğu
+"""
+
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Iterable
+
+
+# İş durumları
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+JOB_STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+
+class JobQueue:
+    """
+    Her URL'in durumunu, deneme sayısını ve sonuç yerini diskte tutan iş kuyruğu.
+
+    İşler BEGIN IMMEDIATE transaction'ı içinde sahiplenilir; aynı dosyayı
+    kullanan thread'ler ve process'ler aynı işi iki kez almaz. Çalışan iş
+    heartbeat ile lease süresini uzatır; lease süresi dolan iş (ör. process
+    çöktüyse) tekrar kuyruğa döner. complete/fail sadece işin güncel sahibi
+    için uygulanır, böylece elinden alınan bir işin sonucu kaydedilmez.
+    """
+
+    def __init__(self,
+                 path: str = "scan_jobs.sqlite",
+                 max_attempts: int = 3,
+                 lease_seconds: float = 120,
+                 retry_delay: float = 30):
+        """
+        JobQueue sınıfını başlatır.
+
+        Args:
+            path: SQLite veritabanı dosyası
+            max_attempts: Bir işin failed durumuna düşmeden önceki en fazla deneme sayısı
+            lease_seconds: Heartbeat gelmezse sahiplenilen işin tekrar alınabilir hale
+                geleceği süre (saniye)
+            retry_delay: Başarısız denemeden sonra, deneme sayısıyla çarpılarak beklenen süre
+        """
+        self.path = path
+        self.max_attempts = max(1, max_attempts)
+        self.lease_seconds = lease_seconds
+        self.retry_delay = retry_delay
+
+        self._lock = threading.Lock()
+        # Transaction'lar elle yönetilir (isolation_level=None)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_until REAL,
+                result_path TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs(state, available_at, id)")
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        URL'leri pending olarak ekler; kuyrukta zaten olan URL'ler atlanır.
+
+        Args:
+            urls: Hedef URL listesi
+
+        Returns:
+            Yeni eklenen iş sayısı
+        """
+        now = time.time()
+        rows = [(url.strip(), now, now) for url in urls if url and url.strip()]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO jobs (url, created_at, updated_at) VALUES (?, ?, ?)", rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return self._conn.total_changes - before
+
+    def claim(self, worker: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Sıradaki işi atomik olarak sahiplenir.
+
+        Bekleyen işler ve lease süresi dolmuş in_flight işler adaydır.
+        Lease süresi dolan ve deneme hakkı bitmiş işler (ör. worker'ı her
+        seferinde çökerten bir URL) aynı transaction'da failed olur.
+
+        Args:
+            worker: Sahiplenen worker'ın adı (izleme için)
+
+        Returns:
+            id, url, attempts ve worker alanları veya alınabilecek iş yoksa None
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, error = ?, lease_until = NULL, updated_at = ? "
+                    "WHERE state = ? AND lease_until < ? AND attempts >= ?",
+                    (FAILED, "lease expired", now, IN_FLIGHT, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT id, url, attempts FROM jobs "
+                    "WHERE (state = ? AND available_at <= ?) OR (state = ? AND lease_until < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (PENDING, now, IN_FLIGHT, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, attempts = attempts + 1, worker = ?, "
+                    "lease_until = ?, updated_at = ? WHERE id = ?",
+                    (IN_FLIGHT, worker, now + self.lease_seconds, now, row["id"]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return {"id": row["id"], "url": row["url"], "attempts": row["attempts"] + 1, "worker": worker}
+
+    def heartbeat(self, job_id: int, worker: Optional[str] = None) -> bool:
+        """
+        Çalışan işin lease süresini lease_seconds kadar uzatır.
+
+        Args:
+            job_id: claim ile alınan iş kimliği
+            worker: claim'e verilen worker adı
+
+        Returns:
+            İş hâlâ bu worker'daysa True
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ? AND worker IS ? AND state = ?",
+                (now + self.lease_seconds, now, job_id, worker, IN_FLIGHT),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, job_id: int, result_path: Optional[str] = None, worker: Optional[str] = None) -> bool:
+        """
+        İşi done olarak işaretler.
+
+        Args:
+            job_id: claim ile alınan iş kimliği
+            result_path: Sonuçların yazıldığı dosya veya dosya öneki
+            worker: claim'e verilen worker adı
+
+        Returns:
+            İş hâlâ bu worker'daysa (ve işaretlendiyse) True
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, result_path = ?, error = NULL, lease_until = NULL, "
+                "updated_at = ? WHERE id = ? AND worker IS ? AND state = ?",
+                (DONE, result_path, time.time(), job_id, worker, IN_FLIGHT),
+            )
+            return cursor.rowcount > 0
+
+    def fail(self, job_id: int, error: str, worker: Optional[str] = None) -> Optional[str]:
+        """
+        Başarısız denemeyi kaydeder.
+
+        Deneme hakkı kaldıysa iş retry_delay * deneme sayısı saniye sonra
+        tekrar alınmak üzere pending'e döner, kalmadıysa failed olur.
+
+        Args:
+            job_id: claim ile alınan iş kimliği
+            error: Hata mesajı
+            worker: claim'e verilen worker adı
+
+        Returns:
+            İşin yeni durumu (pending veya failed) veya iş artık bu worker'da değilse None
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT attempts FROM jobs WHERE id = ? AND worker IS ? AND state = ?",
+                    (job_id, worker, IN_FLIGHT),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                attempts = row["attempts"]
+                state = PENDING if attempts < self.max_attempts else FAILED
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, error = ?, lease_until = NULL, available_at = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    (state, error, now + self.retry_delay * attempts, now, job_id),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return state
+
+    def requeue_stale(self, force: bool = False) -> int:
+        """
+        Lease süresi dolmuş in_flight işleri pending'e döndürür.
+
+        Deneme hakkı bitmiş olanlar claim'deki gibi failed olur; böylece
+        çalıştırmayı her seferinde çökerten bir URL sonsuza kadar denenmez.
+
+        Args:
+            force: Lease süresine bakmadan tüm in_flight işleri döndür
+                (kuyruğu başka process kullanmıyorsa, çökme sonrası hemen devam etmek için)
+
+        Returns:
+            Kuyruğa dönen iş sayısı
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, error = ?, lease_until = NULL, updated_at = ? "
+                    "WHERE state = ? AND (? OR lease_until < ?) AND attempts >= ?",
+                    (FAILED, "lease expired", now, IN_FLIGHT, int(force), now, self.max_attempts),
+                )
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET state = ?, lease_until = NULL, available_at = ?, updated_at = ? "
+                    "WHERE state = ? AND (? OR lease_until < ?)",
+                    (PENDING, now, now, IN_FLIGHT, int(force), now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return cursor.rowcount
+
+    def release(self, worker_pattern: str) -> int:
+        """
+        Worker'ların elindeki in_flight işleri deneme sayılmadan pending'e döndürür.
+
+        Args:
+            worker_pattern: Worker adı için SQL LIKE deseni (ör. "1234-%")
+
+        Returns:
+            Kuyruğa dönen iş sayısı
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, attempts = MAX(attempts - 1, 0), lease_until = NULL, "
+                "available_at = ?, updated_at = ? WHERE state = ? AND worker LIKE ?",
+                (PENDING, now, now, IN_FLIGHT, worker_pattern),
+            )
+            return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        """failed işleri deneme sayısını sıfırlayarak tekrar kuyruğa alır."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, attempts = 0, available_at = ?, updated_at = ? WHERE state = ?",
+                (PENDING, now, now, FAILED),
+            )
+            return cursor.rowcount
+
+    def next_available_in(self) -> Optional[float]:
+        """
+        Bitmemiş bir işin alınabilmesine kalan süre.
+
+        retry_delay süresini bekleyen pending işler ve lease süresi henüz
+        dolmamış in_flight işler dikkate alınır; çökmüş bir çalıştırmadan
+        kalan işler lease dolunca alınabileceğinden kuyruk erken bitmiş
+        sayılmaz.
+
+        Returns:
+            Saniye cinsinden süre veya bitmemiş iş yoksa None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(CASE WHEN state = ? THEN available_at ELSE lease_until END) "
+                "FROM jobs WHERE state IN (?, ?)",
+                (PENDING, PENDING, IN_FLIGHT),
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def get_stats(self) -> Dict[str, int]:
+        """Durum başına iş sayılarını döndürür."""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        stats = {state: 0 for state in JOB_STATES}
+        stats.update({row[0]: row[1] for row in rows})
+        stats["total"] = sum(stats[state] for state in JOB_STATES)
+        return stats
+
+    def jobs(self, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        İşleri listeler.
+
+        Args:
+            state: Sadece bu durumdaki işler
+
+        Returns:
+            id, url, state, attempts, result_path ve error alanları
+        """
+        sql = "SELECT id, url, state, attempts, result_path, error FROM jobs"
+        params: List[Any] = []
+        if state:
+            sql += " WHERE state = ?"
+            params.append(state)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY id", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır."""
+        with self._lock:
+            self._conn.close()
@@ -6,22 +6,55 @@ JavaScript verilerini çıkarma işlemleri için yardımcı modül
 
 import re
 import json
-import ast
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union, Optional
 from bs4 import BeautifulSoup
 
+try:
+    from .js_literal import parse_js_literal, loads as js_literal_loads
+    from .records import MapPinRecord
+    from .patterns import (
+        SCRIPT_BLOCK_RE, CHARSET_RE, PINZ_START_RE, SCAN_GUID_RE, PLACE_ID_RE, global_value_pattern,
+    )
+except ImportError:
+    from js_literal import parse_js_literal, loads as js_literal_loads
+    from records import MapPinRecord
+    from patterns import (
+        SCRIPT_BLOCK_RE, CHARSET_RE, PINZ_START_RE, SCAN_GUID_RE, PLACE_ID_RE, global_value_pattern,
+    )
+
 
 class JSExtractor:
     """JavaScript veri çıkarma işlemleri için sınıf"""
     
     def __init__(self):
         """JSExtractor sınıfını başlatır."""
-        pass
+        # pinz dışında script'lerden çıkarılacak string global'ler (register_global ile genişletilir)
+        self.globals: Dict[str, "re.Pattern"] = {
+            "scan_guid": SCAN_GUID_RE,
+            "place_id": PLACE_ID_RE,
+        }
+    
+    def register_global(self, name: str, pattern: Optional[Union[str, "re.Pattern"]] = None):
+        """
+        Script'lerden çıkarılacak yeni bir global değer kaydeder.
+        
+        Args:
+            name: Sonuç sözlüğündeki alan adı
+            pattern: Değeri ilk grupta yakalayan regex (varsayılan: `name = '...'` ataması)
+        """
+        if pattern is None:
+            pattern = global_value_pattern(name)
+        elif isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        self.globals[name] = pattern
     
     def _safe_json_loads(self, text: str) -> List[Any]:
         """
         JSON'ı güvenli bir şekilde parse eder.
         
+        Geçerli JSON değilse JavaScript literal parser'ı ile tek geçişte
+        parse edilir (tırnaksız anahtarlar, tek tırnak, sondaki virgül vb.).
+        
         Args:
             text: Parse edilecek JSON string
             
@@ -32,14 +65,30 @@ class JSExtractor:
             return json.loads(text)
         except json.JSONDecodeError:
             try:
-                # JavaScript boolean / null değerlerini Python eşdeğerleriyle değiştir
-                text = re.sub(r"\btrue\b", "True", text, flags=re.I)
-                text = re.sub(r"\bfalse\b", "False", text, flags=re.I)
-                text = re.sub(r"\bnull\b", "None", text, flags=re.I)
-                return ast.literal_eval(text)
+                return js_literal_loads(text)
             except Exception:
                 return []
     
+    def _parse_pinz(self, script_text: str) -> Optional[List[Any]]:
+        """
+        Script içindeki `var pinz = [...]` literal'ini parse eder.
+        
+        Args:
+            script_text: Script içeriği
+            
+        Returns:
+            pinz listesi; script'te pinz ataması yoksa None
+        """
+        match = PINZ_START_RE.search(script_text)
+        if not match:
+            return None
+        try:
+            value, _ = parse_js_literal(script_text, match.end())
+            return value if isinstance(value, list) else []
+        except Exception as e:
+            print(f"pinz literal parse hatası: {e}")
+            return []
+    
     def extract_pinz_data(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
         var pinz array'ini çıkarır.
@@ -56,10 +105,9 @@ class JSExtractor:
             for script in soup.find_all("script"):
                 script_text = script.string or ""
                 if "var pinz" in script_text:
-                    match = re.search(r"var\s+pinz\s*=\s*(\[.*?\]);", script_text, re.DOTALL)
-                    if match:
-                        raw_json = match.group(1)
-                        pinz_data = self._safe_json_loads(raw_json)
+                    parsed = self._parse_pinz(script_text)
+                    if parsed is not None:
+                        pinz_data = parsed
                         break
                         
         except Exception as e:
@@ -82,7 +130,7 @@ class JSExtractor:
         try:
             for script in soup.find_all("script"):
                 script_text = script.string or ""
-                scan_match = re.search(r"scan_guid['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]", script_text)
+                scan_match = SCAN_GUID_RE.search(script_text)
                 if scan_match:
                     scan_guid = scan_match.group(1)
                     break
@@ -107,7 +155,7 @@ class JSExtractor:
         try:
             for script in soup.find_all("script"):
                 script_text = script.string or ""
-                place_match = re.search(r"place_id['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]", script_text)
+                place_match = PLACE_ID_RE.search(script_text)
                 if place_match:
                     place_id = place_match.group(1)
                     break
@@ -117,6 +165,70 @@ class JSExtractor:
         
         return place_id
     
+    def _search_scripts(self, soup: BeautifulSoup, pattern: "re.Pattern") -> str:
+        """Desenin ilk eşleştiği script'teki değeri döndürür."""
+        for script in soup.find_all("script"):
+            match = pattern.search(script.string or "")
+            if match:
+                return match.group(1)
+        return ""
+    
+    @staticmethod
+    def _decode(raw: Union[str, bytes]) -> str:
+        """Ham yanıtı meta charset bilgisine göre metne çevirir."""
+        if isinstance(raw, str):
+            return raw
+        match = CHARSET_RE.search(raw[:4096])
+        encoding = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+        try:
+            return raw.decode(encoding, errors="replace")
+        except LookupError:
+            return raw.decode("utf-8", errors="replace")
+    
+    def extract_all_js_data_raw(self, raw: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Tüm JavaScript verilerini BeautifulSoup ağacı kurmadan çıkarır.
+        
+        Ham yanıt metnindeki <script> blokları tek geçişte taranır; pinz,
+        scan_guid, place_id ve register_global ile eklenen değerler aynı
+        döngüde toplanır. Sonuç extract_all_js_data ile aynı yapıdadır.
+        
+        Args:
+            raw: Ham HTML metni veya byte'ları
+            
+        Returns:
+            Tüm JavaScript verileri
+        """
+        js_data = {"pinz": [], **{name: "" for name in self.globals}}
+        
+        try:
+            text = self._decode(raw)
+            remaining = set(js_data)
+            
+            for block in SCRIPT_BLOCK_RE.finditer(text):
+                script_text = block.group(1)
+                
+                if "pinz" in remaining and "var pinz" in script_text:
+                    parsed = self._parse_pinz(script_text)
+                    if parsed is not None:
+                        js_data["pinz"] = parsed
+                        remaining.discard("pinz")
+                
+                for name, pattern in self.globals.items():
+                    if name in remaining:
+                        match = pattern.search(script_text)
+                        if match:
+                            js_data[name] = match.group(1)
+                            remaining.discard(name)
+                
+                if not remaining:
+                    break
+                    
+        except Exception as e:
+            print(f"JavaScript veri çıkarma hatası: {e}")
+        
+        return js_data
+    
     def extract_all_js_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Tüm JavaScript verilerini çıkarır.
@@ -139,12 +251,17 @@ class JSExtractor:
             # place_id çıkar
             js_data["place_id"] = self.extract_place_id(soup)
             
+            # Sonradan kaydedilen global'ler
+            for name, pattern in self.globals.items():
+                if name not in js_data:
+                    js_data[name] = self._search_scripts(soup, pattern)
+            
         except Exception as e:
             print(f"JavaScript veri çıkarma hatası: {e}")
         
         return js_data
     
-    def extract_map_data(self, js_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def extract_map_data(self, js_data: Dict[str, Any]) -> List[MapPinRecord]:
         """
         Harita verilerini JavaScript verilerinden çıkarır.
         
@@ -160,14 +277,14 @@ class JSExtractor:
             if "pinz" in js_data:
                 for obj in js_data["pinz"]:
                     if isinstance(obj, dict):
-                        pins.append({
-                            "lat": obj.get("location", {}).get("lat") or obj.get("lat"),
-                            "lon": obj.get("location", {}).get("lon") or obj.get("lng") or obj.get("longitude"),
-                            "label": obj.get("lable") or obj.get("label"),
-                            "title": obj.get("title"),
-                            "url": obj.get("url"),
-                            "color": obj.get("color"),
-                        })
+                        pins.append(MapPinRecord(
+                            lat=obj.get("location", {}).get("lat") or obj.get("lat"),
+                            lon=obj.get("location", {}).get("lon") or obj.get("lng") or obj.get("longitude"),
+                            label=obj.get("lable") or obj.get("label"),
+                            title=obj.get("title"),
+                            url=obj.get("url"),
+                            color=obj.get("color"),
+                        ))
                         
         except Exception as e:
             print(f"Harita veri çıkarma hatası: {e}")
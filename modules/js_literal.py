@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+JS Literal Module
+JavaScript nesne/dizi literal'lerini doğrudan Python nesnelerine çeviren modül
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+
+# Token desenleri (her biri verilen pozisyondan match edilir, geri izleme yok)
+_SKIP_RE = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)+", re.S)
+_NUMBER_RE = re.compile(
+    r"[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+)
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_STRING_BODY_RE = {
+    "'": re.compile(r"[^'\\\n]*"),
+    '"': re.compile(r'[^"\\\n]*'),
+    "`": re.compile(r"[^`\\]*"),
+}
+
+_ESCAPES = {
+    "n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v",
+    "0": "\0", "'": "'", '"': '"', "\\": "\\", "/": "/", "`": "`",
+}
+
+_KEYWORDS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "undefined": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+}
+
+_CLOSERS = {"(": ")", "[": "]", "{": "}"}
+
+
+class JSLiteralError(ValueError):
+    """Literal parse edilemediğinde fırlatılan hata"""
+
+
+class _LiteralParser:
+    """Tek geçişte, soldan sağa çalışan literal parser'ı"""
+
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+        self.length = len(text)
+
+    def _error(self, message: str) -> JSLiteralError:
+        return JSLiteralError(f"{message} (pozisyon {self.pos})")
+
+    def _skip(self):
+        """Boşlukları ve yorumları atlar."""
+        match = _SKIP_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+
+    def _peek(self) -> str:
+        self._skip()
+        return self.text[self.pos] if self.pos < self.length else ""
+
+    def parse_value(self) -> Any:
+        """Bulunulan pozisyondaki değeri parse eder."""
+        char = self._peek()
+        if char == "{":
+            return self._parse_object()
+        if char == "[":
+            return self._parse_array()
+        if char in _STRING_BODY_RE:
+            return self._parse_string()
+        if not char:
+            raise self._error("Beklenmeyen metin sonu")
+
+        number = _NUMBER_RE.match(self.text, self.pos)
+        if number and not self._continues_expression(number.end()):
+            self.pos = number.end()
+            return self._to_number(number.group(0))
+
+        ident = _IDENT_RE.match(self.text, self.pos)
+        if ident and ident.group(0) in _KEYWORDS and not self._continues_expression(ident.end()):
+            self.pos = ident.end()
+            return _KEYWORDS[ident.group(0)]
+
+        # Fonksiyon çağrısı, değişken vb. ifadeler ham kaynak metni olarak korunur
+        return self._parse_raw_expression()
+
+    def _continues_expression(self, end: int) -> bool:
+        """Token'dan sonra ifade devam ediyor mu (ör. `1 + x`, `true && y`)?"""
+        match = _SKIP_RE.match(self.text, end)
+        if match:
+            end = match.end()
+        return end < self.length and self.text[end] not in ",]}):;"
+
+    @staticmethod
+    def _to_number(token: str) -> Any:
+        sign = -1 if token.startswith("-") else 1
+        body = token.lstrip("+-")
+        if body[:2] in ("0x", "0X"):
+            return sign * int(body, 16)
+        if any(ch in body for ch in ".eE"):
+            return sign * float(body)
+        return sign * int(body)
+
+    def _parse_string(self) -> str:
+        quote = self.text[self.pos]
+        body_re = _STRING_BODY_RE[quote]
+        self.pos += 1
+        parts: List[str] = []
+        while True:
+            match = body_re.match(self.text, self.pos)
+            parts.append(match.group(0))
+            self.pos = match.end()
+            if self.pos >= self.length:
+                raise self._error("Kapanmamış string")
+            char = self.text[self.pos]
+            if char == quote:
+                self.pos += 1
+                return "".join(parts)
+            if char == "\n":
+                raise self._error("String içinde satır sonu")
+            # Kaçış dizisi
+            self.pos += 1
+            if self.pos >= self.length:
+                raise self._error("Kapanmamış string")
+            esc = self.text[self.pos]
+            if esc == "u":
+                if self.text.startswith("{", self.pos + 1):
+                    close = self.text.index("}", self.pos)
+                    parts.append(chr(int(self.text[self.pos + 2:close], 16)))
+                    self.pos = close + 1
+                else:
+                    parts.append(chr(int(self.text[self.pos + 1:self.pos + 5], 16)))
+                    self.pos += 5
+            elif esc == "x":
+                parts.append(chr(int(self.text[self.pos + 1:self.pos + 3], 16)))
+                self.pos += 3
+            elif esc in "\r\n":
+                # Satır devamı
+                self.pos += 2 if self.text.startswith("\r\n", self.pos) else 1
+            else:
+                parts.append(_ESCAPES.get(esc, esc))
+                self.pos += 1
+
+    def _parse_key(self) -> Any:
+        char = self._peek()
+        if char in ("'", '"'):
+            return self._parse_string()
+        ident = _IDENT_RE.match(self.text, self.pos)
+        if ident:
+            self.pos = ident.end()
+            return ident.group(0)
+        number = _NUMBER_RE.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            return number.group(0)
+        raise self._error("Geçersiz nesne anahtarı")
+
+    def _parse_object(self) -> Dict[str, Any]:
+        self.pos += 1
+        result: Dict[str, Any] = {}
+        while True:
+            char = self._peek()
+            if char == "}":
+                self.pos += 1
+                return result
+            key = self._parse_key()
+            if self._peek() != ":":
+                raise self._error("':' bekleniyordu")
+            self.pos += 1
+            result[key] = self.parse_value()
+            char = self._peek()
+            if char == ",":
+                self.pos += 1
+            elif char != "}":
+                raise self._error("',' veya '}' bekleniyordu")
+
+    def _parse_array(self) -> List[Any]:
+        self.pos += 1
+        result: List[Any] = []
+        while True:
+            char = self._peek()
+            if char == "]":
+                self.pos += 1
+                return result
+            if char == ",":
+                # Boş eleman: [1,,2]
+                result.append(None)
+                self.pos += 1
+                continue
+            result.append(self.parse_value())
+            char = self._peek()
+            if char == ",":
+                self.pos += 1
+            elif char != "]":
+                raise self._error("',' veya ']' bekleniyordu")
+
+    def _parse_raw_expression(self) -> str:
+        """Üst seviyede ',', '}' veya ']' görülene kadar ifadenin kaynak metnini alır."""
+        start = self.pos
+        stack: List[str] = []
+        while self.pos < self.length:
+            char = self.text[self.pos]
+            if char in _STRING_BODY_RE:
+                self._parse_string()
+                continue
+            if char in _CLOSERS:
+                stack.append(_CLOSERS[char])
+            elif stack and char == stack[-1]:
+                stack.pop()
+            elif not stack and char in ",]};":
+                break
+            elif char in ")]}":
+                raise self._error("Eşleşmeyen parantez")
+            self.pos += 1
+        expression = self.text[start:self.pos].strip()
+        if not expression:
+            raise self._error("Değer bekleniyordu")
+        return expression
+
+
+def parse_js_literal(text: str, start: int = 0) -> Tuple[Any, int]:
+    """
+    JavaScript nesne/dizi literal'ini Python nesnesine çevirir.
+
+    Tırnaksız anahtarlar, tek/çift tırnaklı stringler, sondaki virgüller,
+    yorumlar ve iç içe yapılar desteklenir. true/false/null/undefined
+    Python karşılıklarına çevrilir; fonksiyon çağrısı gibi literal olmayan
+    ifadeler (ör. `getcolor(0)`) ham kaynak metni olarak döndürülür.
+    Metin soldan sağa tek geçişte okunur.
+
+    Args:
+        text: Kaynak metin
+        start: Literal'in başladığı pozisyon
+
+    Returns:
+        (Python değeri, literal'den sonraki pozisyon)
+    """
+    parser = _LiteralParser(text, start)
+    value = parser.parse_value()
+    return value, parser.pos
+
+
+def loads(text: str) -> Any:
+    """Metnin tamamını tek bir JavaScript literal'i olarak parse eder."""
+    value, end = parse_js_literal(text)
+    rest = _SKIP_RE.match(text, end)
+    end = rest.end() if rest else end
+    if end < len(text) and text[end:].strip(" ;") != "":
+        raise JSLiteralError(f"Literal'den sonra beklenmeyen içerik (pozisyon {end})")
+    return value
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Parse Cache Module
+Yanıt gövdesinin içerik hash'ine göre parse sonuçlarını saklayan modül
+"""
+
+import os
+import re
+import hmac
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union, Iterable
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# İmzalı disk kayıtlarının başındaki HMAC-SHA256 özetinin uzunluğu
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+class ParseCache:
+    """
+    Bellek içi LRU ve isteğe bağlı disk katmanına sahip parse sonucu önbelleği.
+
+    Disk kayıtları pickle ile saklanır ve okunurken unpickle edilir; pickle
+    çözümü kod çalıştırabildiğinden directory sadece güvenilen kullanıcıların
+    yazabildiği bir dizin olmalıdır. secret verilirse her kayıt HMAC-SHA256
+    ile imzalanır ve imzası tutmayan dosyalar unpickle edilmeden atlanır.
+    """
+
+    def __init__(self,
+                 max_entries: int = 128,
+                 directory: Optional[str] = None,
+                 namespace: str = "",
+                 volatile_patterns: Optional[Iterable[str]] = None,
+                 secret: Optional[Union[str, bytes]] = None):
+        """
+        ParseCache sınıfını başlatır.
+
+        Args:
+            max_entries: Bellekte tutulacak en fazla kayıt sayısı
+            directory: Disk katmanı dizini (None ise sadece bellek kullanılır)
+            namespace: Anahtara eklenen önek; parse çıktısının yapısı değişince değiştirilir
+            volatile_patterns: Hash'lenmeden önce gövdeden silinecek regex'ler (ör. CSRF token)
+            secret: Disk kayıtlarını imzalamak için HMAC anahtarı (verilirse imzasız veya
+                imzası tutmayan dosyalar okunmaz)
+        """
+        self.max_entries = max(1, max_entries)
+        self.directory = directory
+        self.namespace = namespace
+        self.volatile_patterns = [re.compile(p) for p in (volatile_patterns or [])]
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "rejected": 0}
+        self._secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+
+        # Değerler pickle'lanmış halde tutulur; çağıran sonucu değiştirse de önbellek bozulmaz
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def content_key(self, body: Union[str, bytes], variant: str = "") -> str:
+        """
+        Normalleştirilmiş yanıt gövdesinden önbellek anahtarı üretir.
+
+        Boşluk farkları ve volatile_patterns ile eşleşen kısımlar anahtarı
+        etkilemez.
+
+        Args:
+            body: Ham yanıt metni veya byte'ları
+            variant: Aynı gövdeden farklı çıktı üreten ayarları ayıran ek (ör. "raw")
+
+        Returns:
+            SHA-256 hex anahtarı
+        """
+        text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+        for pattern in self.volatile_patterns:
+            text = pattern.sub("", text)
+        normalized = _WHITESPACE_RE.sub(" ", text).strip()
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(variant.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """
+        Disk kaydını okur; secret varsa imzayı unpickle etmeden önce doğrular.
+
+        Returns:
+            Pickle'lanmış değer veya kayıt yoksa/imza tutmuyorsa None
+        """
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if not self._secret:
+            return data
+        digest, payload = data[:_DIGEST_SIZE], data[_DIGEST_SIZE:]
+        if not hmac.compare_digest(digest, self._sign(payload)):
+            with self._lock:
+                self.stats["rejected"] += 1
+            return None
+        return payload
+
+    def _remember(self, key: str, payload: bytes):
+        """Kaydı bellek katmanına ekler ve LRU sınırını uygular (lock altında)."""
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Anahtara ait parse sonucunu döndürür.
+
+        Args:
+            key: content_key ile üretilmiş anahtar
+
+        Returns:
+            Önbellekteki değerin kopyası veya None
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return pickle.loads(payload)
+
+        if self.directory:
+            payload = self._read_disk(key)
+            try:
+                value = pickle.loads(payload) if payload is not None else None
+            except (pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                with self._lock:
+                    self._remember(key, payload)
+                    self.stats["disk_hits"] += 1
+                return value
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value: Any):
+        """
+        Parse sonucunu bellek (ve varsa disk) katmanına yazar.
+
+        Args:
+            key: content_key ile üretilmiş anahtar
+            value: Pickle'lanabilir parse sonucu
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, payload)
+            self.stats["stores"] += 1
+
+        if self.directory:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    if self._secret:
+                        f.write(self._sign(payload))
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Parse önbelleği yazma hatası: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss sayaçlarını döndürür."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._memory)
+        return stats
+
+    def clear(self):
+        """Bellek katmanını temizler (disk dosyalarına dokunmaz)."""
+        with self._lock:
+            self._memory.clear()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Patterns Module
+HTMLParser ve JSExtractor'ın kullandığı derlenmiş regex ve CSS seçici kayıt defteri
+
+Desenler ve seçiciler modül yüklenirken bir kez derlenir; satır başına
+çalışan parse döngüleri metin desenlerini tekrar derlemez.
+"""
+
+import re
+from functools import lru_cache
+
+import soupsieve as sv
+
+
+# ---------------------------------------------------------------------------
+# Regex desenleri
+# ---------------------------------------------------------------------------
+
+# Bölüm başlıkları
+SCAN_INFORMATION_RE = re.compile(r"^\s*Scan Information\s*$", re.I)
+RANK_SUMMARY_RE = re.compile(r"^\s*Rank Summary\s*$", re.I)
+
+# Hücre/etiket eşleştirme desenleri
+KEYWORD_RE = re.compile(r"Keyword", re.I)
+LOCAL_DATE_CLASS_RE = re.compile(r"cnv_dt_lcl", re.I)
+CATEGORIES_RE = re.compile(r"Categories:", re.I)
+CLAIM_STATUS_RE = re.compile(r"(Claimed|Un\s*Claimed)", re.I)
+
+# Sayısal değer desenleri
+INT_RE = re.compile(r"\d{1,3}(?:,\d{3})+(?!\d)|\d+")
+FLOAT_RE = re.compile(r"[-+]?\d+(?:[.,]\d+)?")
+DISTANCE_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(km|mi|m)\b", re.I)
+RATING_TITLE_RE = re.compile(r"([0-9]+(?:[\.,][0-9]+)?)\s*out\s*of\s*5", re.I)
+RATING_WIDTH_RE = re.compile(r"width:\s*([0-9]+)%")
+REVIEWS_RE = re.compile(r"\(?\s*(\d{1,3}(?:,\d{3})+(?!\d)|\d+)\s*(?:Reviews?|Yorum(?:lar)?|Değerlendirme)?\s*\)?", re.I)
+POSITION_RE = re.compile(r"Position:\s*(\d+)", re.I)
+
+# Ham HTML / script desenleri
+SCRIPT_BLOCK_RE = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.I | re.S)
+CHARSET_RE = re.compile(rb"""charset\s*=\s*["']?([\w.:-]+)""", re.I)
+PINZ_START_RE = re.compile(r"var\s+pinz\s*=\s*(?=\[)")
+
+
+@lru_cache(maxsize=None)
+def global_value_pattern(name: str) -> "re.Pattern":
+    """`name: '...'` veya `name = "..."` biçimindeki string atamaları için desen üretir."""
+    return re.compile(re.escape(name) + r"['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]")
+
+
+SCAN_GUID_RE = global_value_pattern("scan_guid")
+PLACE_ID_RE = global_value_pattern("place_id")
+
+
+# ---------------------------------------------------------------------------
+# CSS seçicileri (soupsieve ile önceden derlenmiş)
+# ---------------------------------------------------------------------------
+
+# Tablo ve bölüm kökleri
+COMPETITOR_ROWS_SEL = sv.compile("table#tbl_comp_rank tbody tr")
+ADS_ROWS_SEL = sv.compile("table#tbl_ads_rank tbody tr")
+TBODY_ROWS_SEL = sv.compile("tbody tr")
+TABLE_ROWS_SEL = sv.compile("tr")
+DETAIL_CONTAINER_SEL = sv.compile("div#resultModal div.results_body")
+RESULTS_BODY_SEL = sv.compile("div.results_body")
+DETAIL_PANELS_SEL = sv.compile("div.bg-light.panel-body")
+
+# Puan / yorum
+RATING_STARS_SEL = sv.compile("div.rating-container div.rating-stars")
+REVIEWS_SPAN_SEL = sv.compile("div.rating-container + span")
+
+# Scan Information
+BIZNAME_SEL = sv.compile("span.bizname")
+CENTER_BLOCK_SEL = sv.compile("span.center-block")
+
+# Rakip / sponsorlu satırları
+NAME_LINK_SEL = sv.compile("a.ext")
+MAP_MARKER_SEL = sv.compile("i.fa-map-marker")
+GLOBE_SEL = sv.compile("i.fa-globe")
+PHOTO_SEL = sv.compile("i.fa-photo")
+FOUND_LOCATIONS_SEL = sv.compile("td.text-center > h5")
+AVERAGE_RANK_SEL = sv.compile("span.dotlg2")
+
+# Detaylı sonuç panelleri
+DETAIL_RANK_SEL = sv.compile("span.dot")
+DETAIL_NAME_SEL = sv.compile("h5")
+
+
+# ---------------------------------------------------------------------------
+# Satır içi tek geçişli tarama hedefleri
+# ---------------------------------------------------------------------------
+
+# (etiket, class) -> HTMLParser._index_row anahtarı. Satır/panel alt ağacı bir
+# kez dolaşılır ve her hedefin ilk örneği alınır; yukarıdaki satır seçicilerinin
+# (NAME_LINK_SEL, MAP_MARKER_SEL, ...) select_one sonuçlarıyla aynıdır.
+ROW_CLASS_TARGETS = {
+    ("a", "ext"): "name_link",
+    ("i", "fa-map-marker"): "map_marker",
+    ("i", "fa-globe"): "globe",
+    ("i", "fa-photo"): "photo",
+    ("span", "dotlg2"): "average_rank",
+    ("span", "dot"): "detail_rank",
+    ("div", "rating-container"): "rating_container",
+    ("div", "rating-stars"): "rating_stars",
+}
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Pipeline Module
+Ağ (I/O) ve parse (CPU) aşamalarını ayıran toplu tarama boru hattı
+"""
+
+import os
+import time
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Callable, Tuple
+from urllib.parse import urlparse
+
+try:
+    from .report_ingestor import parse_report_sections, sections_cache_variant
+    from .parse_cache import ParseCache
+except ImportError:
+    from report_ingestor import parse_report_sections, sections_cache_variant
+    from parse_cache import ParseCache
+
+
+# Aşamalar arası kuyruk sonlandırma işareti
+_DONE = object()
+
+
+def _parse_inline(*args: Any) -> Future:
+    """parse_workers=0 için parse_report_sections'ı çağıran thread'de çalıştırıp tamamlanmış Future döndürür."""
+    future = Future()
+    try:
+        future.set_result(parse_report_sections(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+class ScanPipeline:
+    """
+    Fetch -> parse -> API aşamalarını birbirine bağlayan boru hattı.
+
+    Fetch thread'leri HTML'i indirir ve parse görevini process havuzuna
+    gönderir; API thread'leri parse sürerken API çağrılarını yapar ve
+    ardından parse sonucunu bekler. Aşamalar arasındaki kuyruklar
+    sınırlıdır: parse geride kalırsa fetch thread'leri, sonuçlar
+    tüketilmezse API thread'leri bekler.
+    Böylece ağ ve tüm CPU çekirdekleri aynı anda kullanılırken bellekte
+    sadece queue_size kadar sayfa birikir.
+    """
+
+    def __init__(self,
+                 worker_factory: Callable[[], Any],
+                 fetch_workers: int = 4,
+                 parse_workers: Optional[int] = None,
+                 api_workers: Optional[int] = None,
+                 queue_size: Optional[int] = None,
+                 max_per_host: int = 2,
+                 parser: Optional[str] = None,
+                 targeted: bool = True,
+                 keep_raw: bool = False,
+                 parse_cache: Optional[ParseCache] = None):
+        """
+        ScanPipeline sınıfını başlatır.
+
+        Args:
+            worker_factory: Çağıran thread için web_client, api_client ve
+                export_data özelliklerine sahip nesne döndürür (ör. MainScraper)
+            fetch_workers: HTML indiren thread sayısı
+            parse_workers: Parse process sayısı (varsayılan: CPU sayısı, 0: fetch thread'inde parse et)
+            api_workers: API çağrılarını yapan thread sayısı (varsayılan: fetch_workers)
+            queue_size: Aşamalar arasında bekleyebilecek en fazla tarama sayısı
+                (varsayılan: parse_workers * 2)
+            max_per_host: Host başına eşzamanlı HTML isteği sayısı
+            parser: BeautifulSoup parser backend'i
+            targeted: Sadece rapor bölgeleri için ağaç kurulsun mu
+            keep_raw: Sayıya çevrilen alanların ham metnini de sakla
+            parse_cache: Parse sonuçları önbelleği (verilmezse kullanılmaz)
+        """
+        self.worker_factory = worker_factory
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = (os.cpu_count() or 1) if parse_workers is None else max(0, parse_workers)
+        self.api_workers = max(1, api_workers or self.fetch_workers)
+        self.queue_size = max(1, queue_size or self.parse_workers * 2)
+        self.max_per_host = max(1, max_per_host)
+        self.parser = parser
+        self.targeted = targeted
+        self.keep_raw = keep_raw
+        self.parse_cache = parse_cache
+
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    @staticmethod
+    def _put(target: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+        """Kuyruk doluysa bekler; tüketici durduysa False döndürür."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _new_result(index: int, url: str) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "url": url,
+            "success": False,
+            "data": {},
+            "error": None,
+            "export": None,
+            "output": None,
+            "duration": 0.0,
+            "timings": {},
+        }
+
+    def run(self,
+            urls: Iterable[str],
+            export: bool = False,
+            base_filename: str = "modular_scraped_data",
+            formats: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Taramaları boru hattında çalıştırır, sonuçları tamamlanma sırasına göre üretir.
+
+        Args:
+            urls: Hedef URL listesi
+            export: Her tarama bittiğinde API thread'inde dışa aktarım yapılsın mı
+            base_filename: Dışa aktarım için temel dosya adı
+            formats: Dışa aktarım formatları
+
+        Yields:
+            MainScraper.scrape_many ile aynı alanlar; ek olarak aşama başına
+            fetch, parse ve api süreleri (timings)
+        """
+        url_iter = iter(enumerate(url.strip() for url in urls if url and url.strip()))
+        url_lock = threading.Lock()
+        parsed: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        finished: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        fetchers_left = [self.fetch_workers]
+
+        executor = None
+        if self.parse_workers:
+            executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+            # Process'ler thread'ler başlamadan oluşturulsun (fork sırasında kilit tutan thread olmasın)
+            executor.submit(os.getpid).result()
+
+        def fetch():
+            worker = self.worker_factory()
+            try:
+                while not stop.is_set():
+                    with url_lock:
+                        item = next(url_iter, None)
+                    if item is None:
+                        return
+                    index, url = item
+                    result = self._new_result(index, url)
+                    started = time.perf_counter()
+                    try:
+                        task = self._submit(worker, executor, result, url, started)
+                    except Exception as e:
+                        # Havuz bozulsa bile (ör. BrokenProcessPool) URL sonuçlarda hata olarak görünür
+                        task, result["error"] = None, str(e)
+                    if task is None:
+                        result["timings"].setdefault("fetch", time.perf_counter() - started)
+                        result["error"] = result["error"] or "Veri çekilemedi"
+                        result["duration"] = time.perf_counter() - started
+                        task = (None, None, None)
+                    # Kuyruk doluysa parse tarafı yetişene kadar yeni sayfa indirilmez
+                    if not self._put(parsed, (result, *task, started), stop):
+                        return
+            finally:
+                with url_lock:
+                    fetchers_left[0] -= 1
+                    last = fetchers_left[0] == 0
+                if last:
+                    for _ in range(self.api_workers):
+                        self._put(parsed, _DONE, stop)
+
+        def call_api():
+            worker = self.worker_factory()
+            try:
+                while not stop.is_set():
+                    try:
+                        item = parsed.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if item is _DONE:
+                        return
+                    result, future, cache_key, js_data, started = item
+                    if future is not None:
+                        self._finish(worker, result, future, cache_key, js_data, export, base_filename, formats)
+                        result["duration"] = time.perf_counter() - started
+                    if not self._put(finished, result, stop):
+                        return
+            finally:
+                self._put(finished, _DONE, stop)
+
+        threads = [threading.Thread(target=fetch, name=f"pipeline-fetch-{n}", daemon=True)
+                   for n in range(self.fetch_workers)]
+        threads += [threading.Thread(target=call_api, name=f"pipeline-api-{n}", daemon=True)
+                    for n in range(self.api_workers)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            remaining = self.api_workers
+            while remaining:
+                result = finished.get()
+                if result is _DONE:
+                    remaining -= 1
+                    continue
+                yield result
+        finally:
+            # Tüketici erken durursa thread'ler kuyruk beklemeyi bırakır
+            stop.set()
+            for thread in threads:
+                thread.join()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self,
+                worker: Any,
+                executor: Optional[ProcessPoolExecutor],
+                result: Dict[str, Any],
+                url: str,
+                started: float) -> Optional[Tuple[Future, Optional[str], Dict[str, Any]]]:
+        """
+        Sayfayı indirir ve parse görevini başlatır.
+
+        Parse, worker'ın html_parser ve js_extractor nesneleriyle yapılır;
+        register_global ile eklenen global'ler API çağrısına ve
+        javascript_verileri'ne birlikte girer.
+
+        Returns:
+            (future, cache_key, js_data) veya sayfa alınamadıysa None
+        """
+        with self._host_semaphore(url):
+            html = worker.web_client.get_html(url)
+        result["timings"]["fetch"] = time.perf_counter() - started
+        if not html:
+            return None
+
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.content_key(
+                html, sections_cache_variant(self.keep_raw, worker.js_extractor)
+            )
+            cached = self.parse_cache.get(cache_key)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future, None, cached["javascript_verileri"]
+
+        # API aşaması parse bitmeden başlayabilsin diye scan_guid/pinz ham metinden alınır
+        js_data = worker.js_extractor.extract_all_js_data_raw(html)
+        # Parse aynı js_data'yı kullanır: harita ve javascript_verileri API'ye verilenle aynı olur
+        args = (html, self.parser, self.targeted, self.keep_raw,
+                worker.html_parser, worker.js_extractor, js_data)
+        if executor is not None:
+            future = executor.submit(parse_report_sections, *args)
+        else:
+            future = _parse_inline(*args)
+        return future, cache_key, js_data
+
+    def _finish(self,
+                worker: Any,
+                result: Dict[str, Any],
+                future: Future,
+                cache_key: Optional[str],
+                js_data: Dict[str, Any],
+                export: bool,
+                base_filename: str,
+                formats: Optional[List[str]]):
+        """
+        API verilerini çeker, parse sonucuyla birleştirir ve isteğe bağlı olarak dışa aktarır.
+
+        API çağrıları ham metinden çıkarılan js_data ile yapılır; bu sırada
+        parse process havuzunda devam eder.
+        """
+        url = result["url"]
+        try:
+            started = time.perf_counter()
+            base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+            api_data = worker.api_client.get_all_api_data(base_url, js_data)
+            result["timings"]["api"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            data = future.result()
+            result["timings"]["parse_wait"] = time.perf_counter() - started
+            if cache_key is not None:
+                self.parse_cache.put(cache_key, data)
+
+            data["api_verileri"] = api_data
+            data["metadata"] = {
+                "scraped_at": datetime.now().isoformat(),
+                "url": url,
+                "scraper_version": "4.0",
+                "method": "modular_hybrid",
+                "selenium_used": worker.web_client.use_selenium,
+            }
+
+            result["data"] = data
+            result["success"] = True
+            if export:
+                result["output"] = f"{base_filename}_{result['index']:04d}"
+                result["export"] = worker.export_data(data, result["output"], formats)
+                if not any((result["export"] or {}).values()):
+                    result["success"] = False
+                    result["error"] = "Dışa aktarma başarısız"
+        except Exception as e:
+            result["error"] = str(e)
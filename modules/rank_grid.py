@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Rank Grid Module
+Harita noktalarını (pinz / harita_verileri) NumPy dizilerine çeviren geo-grid modülü
+"""
+
+import html
+from urllib.parse import unquote
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+import numpy as np
+
+try:
+    from . import patterns
+except ImportError:
+    import patterns
+
+
+# Rapor "Max Distance" değerini WGS84 ekvator yarıçapıyla hesaplıyor
+EARTH_RADIUS_KM = 6378.137
+
+# "Avg total rank (All Locations)" hesabında sıralamaya girmeyen noktaların değeri
+UNRANKED_RANK = 21
+
+# Sıralı koordinatlarda grid aralığının bu oranından büyük boşluklar yeni satır/sütun başlatır
+GRID_GAP_RATIO = 0.5
+
+# Grid aralığı tahmininde en büyük boşluğun bu oranından küçük boşluklar (titreşim) yok sayılır
+_SPACING_FLOOR = 0.1
+
+
+def pin_rank(pin: Any) -> float:
+    """
+    Bir harita noktasının sıralamasını döndürür.
+
+    Sıra label'dan okunur (" %26%2310006%3B" -> "✖" = sıralama dışı);
+    label boşsa title'daki "Position: N" kullanılır (0 = sıralama dışı).
+
+    Args:
+        pin: MapPinRecord veya lat/lon/label/title anahtarlı dict
+
+    Returns:
+        Sıra veya sıralama dışıysa NaN
+    """
+    label = html.unescape(unquote(pin.get("label") or "")).strip()
+    if label.isdigit():
+        rank = int(label)
+        return float(rank) if rank > 0 else np.nan
+    if label:
+        return np.nan
+
+    match = patterns.POSITION_RE.search(pin.get("title") or "")
+    if match and int(match.group(1)) > 0:
+        return float(match.group(1))
+    return np.nan
+
+
+def cluster_axis(values: np.ndarray, gap_ratio: float = GRID_GAP_RATIO) -> Tuple[np.ndarray, int]:
+    """
+    Tek eksendeki koordinatları tolerans ile grid satır/sütunlarına ayırır.
+
+    Jeodezik olarak üretilen grid'lerde aynı sütundaki noktaların boylamı
+    satırdan satıra küçük farklar gösterir; koordinatlar sıralanır ve grid
+    aralığının (büyük boşlukların medyanı) gap_ratio katından büyük
+    boşluklarda bölünür. Küme indeksleri merkezlerin grid aralığına göre
+    konumudur; eksik bir satır/sütun indeks dizisinde boşluk bırakır.
+
+    Args:
+        values: Enlem veya boylam dizisi
+        gap_ratio: Yeni küme başlatan boşluğun grid aralığına oranı
+
+    Returns:
+        (her değerin küme indeksi (küçükten büyüğe), küme sayısı)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return np.zeros(0, dtype=np.int64), 0
+
+    order = np.argsort(values, kind="stable")
+    gaps = np.diff(values[order])
+    largest = gaps.max() if gaps.size else 0.0
+    if largest <= 0.0:
+        return np.zeros(values.size, dtype=np.int64), 1
+
+    spacing = np.median(gaps[gaps > largest * _SPACING_FLOOR])
+    clusters = np.concatenate([[0], np.cumsum(gaps > spacing * gap_ratio)])
+
+    # Kümeler merkezlerinin aralığa göre konumuna yerleştirilir; eksik satır/sütunlar boş kalır
+    centers = np.bincount(clusters, weights=values[order]) / np.bincount(clusters)
+    positions = np.rint((centers - centers[0]) / spacing).astype(np.int64)
+    index = np.empty(values.size, dtype=np.int64)
+    index[order] = positions[clusters]
+    return index, int(positions[-1]) + 1
+
+
+def haversine_km(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> np.ndarray:
+    """
+    İki nokta (veya nokta dizileri) arasındaki büyük daire mesafesini hesaplar.
+
+    Args:
+        lat1, lon1: Başlangıç koordinatları (derece)
+        lat2, lon2: Bitiş koordinatları (derece)
+
+    Returns:
+        Kilometre cinsinden mesafe(ler)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+class RankGrid:
+    """Bir taramanın harita noktalarını sütun dizileri olarak tutan grid"""
+
+    def __init__(self,
+                 lat: np.ndarray,
+                 lon: np.ndarray,
+                 rank: np.ndarray,
+                 center: Optional[Tuple[float, float]] = None):
+        """
+        RankGrid sınıfını başlatır.
+
+        Args:
+            lat: Enlem dizisi
+            lon: Boylam dizisi
+            rank: Sıra dizisi (sıralama dışı = NaN)
+            center: Tarama merkezi (varsayılan: grid sınırlarının ortası)
+        """
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.rank = np.asarray(rank, dtype=np.float64)
+
+        # Satırlar kuzeyden güneye, sütunlar batıdan doğuya
+        lat_index, rows = cluster_axis(self.lat)
+        lon_index, cols = cluster_axis(self.lon)
+        self.row = rows - 1 - lat_index
+        self.col = lon_index
+        self.shape = (rows, cols)
+
+        if center is None and self.lat.size:
+            center = ((self.lat.min() + self.lat.max()) / 2, (self.lon.min() + self.lon.max()) / 2)
+        self.center = center
+        if center is not None:
+            self.distance_km = haversine_km(center[0], center[1], self.lat, self.lon)
+        else:
+            self.distance_km = np.zeros(0)
+
+        # Merkezden satranç tahtası (Chebyshev) uzaklığı: 0 = merkez, 1 = ilk halka ...
+        center_row = (self.shape[0] - 1) / 2
+        center_col = (self.shape[1] - 1) / 2
+        self.ring = np.maximum(np.abs(self.row - center_row), np.abs(self.col - center_col)).astype(np.int64)
+
+    @classmethod
+    def from_pins(cls, pins: Iterable[Any], center: Optional[Tuple[float, float]] = None) -> "RankGrid":
+        """
+        Harita noktalarından grid oluşturur.
+
+        Args:
+            pins: extract_map_data çıktısı (MapPinRecord veya dict listesi)
+            center: Tarama merkezi
+
+        Returns:
+            RankGrid
+        """
+        pins = [pin for pin in pins if pin.get("lat") is not None and pin.get("lon") is not None]
+        lat = np.fromiter((float(pin.get("lat")) for pin in pins), dtype=np.float64, count=len(pins))
+        lon = np.fromiter((float(pin.get("lon")) for pin in pins), dtype=np.float64, count=len(pins))
+        rank = np.fromiter((pin_rank(pin) for pin in pins), dtype=np.float64, count=len(pins))
+        return cls(lat, lon, rank, center)
+
+    @classmethod
+    def from_scan(cls, data: Dict[str, Any], center: Optional[Tuple[float, float]] = None) -> "RankGrid":
+        """scrape_all / parse_report_html sonucundaki harita_verileri'nden grid oluşturur."""
+        return cls.from_pins(data.get("harita_verileri") or [], center)
+
+    @property
+    def ranked(self) -> np.ndarray:
+        """Sıralamada görünen noktaların maskesi."""
+        return ~np.isnan(self.rank)
+
+    def to_matrix(self) -> np.ndarray:
+        """
+        Sıraları (satır, sütun) matrisine yerleştirir.
+
+        Returns:
+            shape boyutunda matris; nokta olmayan veya sıralama dışı hücreler NaN
+        """
+        matrix = np.full(self.shape, np.nan)
+        matrix[self.row, self.col] = self.rank
+        return matrix
+
+    def stats(self, unranked_rank: float = UNRANKED_RANK) -> Dict[str, Any]:
+        """
+        Rank Summary ile karşılaştırılabilir istatistikleri hesaplar.
+
+        Args:
+            unranked_rank: Tüm noktaların ortalamasında sıralama dışı noktaya verilen değer
+
+        Returns:
+            pins, ranked, unranked, ranked_share, mean_rank, median_rank,
+            best_rank, average_total_rank ve max_distance_km alanları
+        """
+        ranked = self.ranked
+        ranked_count = int(ranked.sum())
+        ranks = self.rank[ranked]
+        total = int(self.rank.size)
+        return {
+            "pins": total,
+            "ranked": ranked_count,
+            "unranked": total - ranked_count,
+            "ranked_share": round(ranked_count / total, 4) if total else 0.0,
+            "mean_rank": round(float(ranks.mean()), 2) if ranked_count else None,
+            "median_rank": round(float(np.median(ranks)), 2) if ranked_count else None,
+            "best_rank": int(ranks.min()) if ranked_count else None,
+            "average_total_rank": round(float(np.where(ranked, self.rank, unranked_rank).mean()), 2) if total else None,
+            "max_distance_km": round(float(self.distance_km.max()), 2) if self.distance_km.size else None,
+        }
+
+    def ring_stats(self) -> List[Dict[str, Any]]:
+        """
+        Merkezden uzaklık halkalarına göre istatistikleri hesaplar.
+
+        Halka 0 merkez noktası, halka n merkeze n adım uzaklıktaki kare
+        çerçevedir; son halkanın max_distance_km değeri raporun
+        "Max Distance" değeridir.
+
+        Returns:
+            Halka başına ring, pins, ranked, ranked_share, mean_rank ve
+            max_distance_km alanları
+        """
+        if not self.rank.size:
+            return []
+        rings = self.ring.max() + 1
+        ranked = self.ranked
+        pins = np.bincount(self.ring, minlength=rings)
+        ranked_counts = np.bincount(self.ring, weights=ranked, minlength=rings)
+        rank_sums = np.bincount(self.ring, weights=np.where(ranked, self.rank, 0.0), minlength=rings)
+        max_distance = np.zeros(rings)
+        np.maximum.at(max_distance, self.ring, self.distance_km)
+
+        result = []
+        for ring in range(rings):
+            if not pins[ring]:
+                continue
+            result.append({
+                "ring": ring,
+                "pins": int(pins[ring]),
+                "ranked": int(ranked_counts[ring]),
+                "ranked_share": round(float(ranked_counts[ring] / pins[ring]), 4),
+                "mean_rank": round(float(rank_sums[ring] / ranked_counts[ring]), 2) if ranked_counts[ring] else None,
+                "max_distance_km": round(float(max_distance[ring]), 2),
+            })
+        return result
+
+
+def stack_grids(grids: Iterable[RankGrid]) -> np.ndarray:
+    """
+    Birden fazla taramanın grid'lerini tek bir 3 boyutlu diziye yığar.
+
+    Farklı boyutlu grid'ler en büyük boyuta NaN ile doldurulur ve
+    merkezleri hizalanır; eksen 0 tarama, eksen 1-2 satır/sütundur.
+
+    Args:
+        grids: RankGrid listesi
+
+    Returns:
+        (tarama sayısı, satır, sütun) boyutunda dizi
+    """
+    matrices = [grid.to_matrix() for grid in grids]
+    if not matrices:
+        return np.empty((0, 0, 0))
+
+    rows = max(matrix.shape[0] for matrix in matrices)
+    cols = max(matrix.shape[1] for matrix in matrices)
+    stack = np.full((len(matrices), rows, cols), np.nan)
+    for index, matrix in enumerate(matrices):
+        top = (rows - matrix.shape[0]) // 2
+        left = (cols - matrix.shape[1]) // 2
+        stack[index, top:top + matrix.shape[0], left:left + matrix.shape[1]] = matrix
+    return stack
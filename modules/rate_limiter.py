@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Module
+Host bazlı token-bucket rate limiting için yardımcı modül
+"""
+
+import time
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Thread-safe token-bucket sınıfı"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        TokenBucket sınıfını başlatır.
+
+        Args:
+            rate: Saniyede eklenen token sayısı
+            burst: Kovada birikebilecek en fazla token sayısı
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Geçen süreye göre token ekler (lock altında çağrılır)."""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Token rezerve eder ve beklenmesi gereken süreyi döndürür.
+
+        Token sayısı eksiye düşebilir; böylece bekleyen istekler sıraya
+        girer ve hiçbiri gereğinden uzun uyumaz.
+
+        Args:
+            tokens: Harcanacak token sayısı
+
+        Returns:
+            Saniye cinsinden bekleme süresi
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Token hemen alınabiliyorsa alır, beklemez."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Token alınana kadar thread'i bekletir, beklenen süreyi döndürür."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Token alınana kadar event loop'u bloklamadan bekler."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Host başına ayrı token-bucket tutan paylaşımlı rate limiter"""
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        """
+        HostRateLimiter sınıfını başlatır.
+
+        Args:
+            rate: Host başına saniyedeki istek sayısı (None veya 0 ise sınırsız)
+            burst: Host başına anlık izin verilen istek sayısı
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_interval(cls, interval: float, burst: int = 1) -> "HostRateLimiter":
+        """İstekler arası saniye cinsinden süreden limiter oluşturur."""
+        return cls(1.0 / interval if interval and interval > 0 else None, burst)
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        """URL veya host bilgisinden host adını çıkarır."""
+        if "://" in url_or_host:
+            return urlparse(url_or_host).netloc.lower()
+        return url_or_host.lower()
+
+    def bucket(self, url_or_host: str) -> Optional[TokenBucket]:
+        """Host'a ait token-bucket'ı döndürür, yoksa oluşturur."""
+        if self.rate is None:
+            return None
+        host = self._host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url_or_host: str) -> float:
+        """
+        Host için istek izni alınana kadar bekler.
+
+        Args:
+            url_or_host: İstek URL'i veya host adı
+
+        Returns:
+            Beklenen süre
+        """
+        bucket = self.bucket(url_or_host)
+        return bucket.acquire() if bucket else 0.0
+
+    async def acquire_async(self, url_or_host: str) -> float:
+        """acquire metodunun asyncio uyumlu sürümü."""
+        bucket = self.bucket(url_or_host)
+        return await bucket.acquire_async() if bucket else 0.0
+
+    def try_acquire(self, url_or_host: str) -> bool:
+        """Host için izin hemen alınabiliyorsa alır."""
+        bucket = self.bucket(url_or_host)
+        return bucket.try_acquire() if bucket else True
+
+
+_shared_limiters: Dict[Tuple[float, int], HostRateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(interval: float, burst: int = 1) -> HostRateLimiter:
+    """
+    Aynı ayarlara sahip istemcilerin ortak kullandığı limiter'ı döndürür.
+
+    Args:
+        interval: İstekler arası saniye cinsinden süre
+        burst: Host başına anlık izin verilen istek sayısı
+
+    Returns:
+        Paylaşımlı HostRateLimiter
+    """
+    key = (float(interval or 0), max(1, burst))
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = HostRateLimiter.from_interval(*key)
+            _shared_limiters[key] = limiter
+        return limiter
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Records Module
+Rapor satırları için __slots__ tabanlı kompakt kayıt sınıfları
+"""
+
+from typing import Dict, Any, List, Tuple, Iterator
+
+
+# keep_raw=True iken ham metnin yazıldığı anahtarın eki (html_parser de bunu kullanır)
+RAW_SUFFIX = " (Ham)"
+
+
+class Record:
+    """
+    Tek bir tablo satırını tutan temel kayıt sınıfı.
+
+    Alt sınıflar FIELDS ile (özellik adı, dışa aktarma anahtarı) çiftlerini
+    tanımlar. Satır başına dict yerine __slots__ kullanıldığından uzun Türkçe
+    anahtarlar her satırda tekrar saklanmaz. Okuma tarafında dict ile uyumludur
+    (kayit["İsim"], kayit.get("Puan")); dict'e çevirme sadece dışa aktarmada yapılır.
+
+    raw, HTMLParser(keep_raw=True) ile sayıya çevrilen alanların ham
+    metinlerini tutar; dışa aktarmada "<alan> (Ham)" sütunları olarak yazılır.
+    """
+
+    __slots__ = ("raw",)
+
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+    _ATTRS: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ATTRS = {key: attr for attr, key in cls.FIELDS}
+
+    def __init__(self, *args, **kwargs):
+        """Record sınıfını başlatır; verilmeyen alanlar None olur."""
+        self.raw = kwargs.pop("raw", None)
+        if len(args) > len(self.FIELDS):
+            raise TypeError(f"{type(self).__name__} en fazla {len(self.FIELDS)} değer alır")
+        for (attr, _), value in zip(self.FIELDS, args):
+            setattr(self, attr, value)
+        for attr, _ in self.FIELDS[len(args):]:
+            setattr(self, attr, kwargs.pop(attr, None))
+        if kwargs:
+            raise TypeError(f"Bilinmeyen alan(lar): {', '.join(kwargs)}")
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "Record":
+        """Dışa aktarma anahtarlarıyla verilmiş dict'ten kayıt oluşturur."""
+        return cls(*(row.get(key) for _, key in cls.FIELDS))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Kaydı dışa aktarma anahtarlarıyla dict'e çevirir."""
+        result = {key: getattr(self, attr) for attr, key in self.FIELDS}
+        if self.raw:
+            for key, value in self.raw.items():
+                result[key + RAW_SUFFIX] = value
+        return result
+
+    def keys(self) -> List[str]:
+        return [key for _, key in self.FIELDS]
+
+    def values(self) -> List[Any]:
+        return [getattr(self, attr) for attr, _ in self.FIELDS]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, attr)) for attr, key in self.FIELDS]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._ATTRS.get(key)
+        return getattr(self, attr) if attr else default
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._ATTRS.get(key)
+        if attr is None:
+            raise KeyError(key)
+        return getattr(self, attr)
+
+    def __setitem__(self, key: str, value: Any):
+        attr = self._ATTRS.get(key)
+        if attr is None:
+            raise KeyError(key)
+        setattr(self, attr, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ATTRS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return (type(self) is type(other) and self.values() == other.values()
+                    and self.raw == other.raw)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(self.values()) + (self.raw,)
+
+    def __setstate__(self, state: Tuple[Any, ...]):
+        for (attr, _), value in zip(self.FIELDS, state):
+            setattr(self, attr, value)
+        self.raw = state[len(self.FIELDS)]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr, _ in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompetitorRecord(Record):
+    """Rakip tablosundaki (tbl_comp_rank) bir satır"""
+
+    FIELDS = (
+        ("name", "İsim"),
+        ("rating", "Puan"),
+        ("reviews", "Yorum Sayısı"),
+        ("rating_reviews", "Puan/Yorum"),
+        ("address", "Adres"),
+        ("categories", "Kategoriler"),
+        ("website", "Web Sitesi"),
+        ("photos", "Fotoğraf Sayısı"),
+        ("claim_status", "Sahiplenme Durumu"),
+        ("found_locations", "Bulunduğu Konum Sayısı"),
+        ("average_rank", "Ortalama Sıralama"),
+    )
+    __slots__ = tuple(attr for attr, _ in FIELDS)
+
+
+class SponsoredListingRecord(Record):
+    """Sponsorlu liste tablosundaki (tbl_ads_rank) bir satır"""
+
+    FIELDS = (
+        ("name", "İsim"),
+        ("rating", "Puan"),
+        ("reviews", "Yorum Sayısı"),
+        ("rating_reviews", "Puan/Yorum"),
+        ("seen_count", "Görülme Sayısı"),
+    )
+    __slots__ = tuple(attr for attr, _ in FIELDS)
+
+
+class DetailResultRecord(Record):
+    """Detaylı sonuçlar modalındaki bir panel"""
+
+    FIELDS = (
+        ("rank", "Sıra"),
+        ("name", "İsim"),
+        ("rating", "Puan"),
+        ("reviews", "Yorum Sayısı"),
+        ("rating_reviews", "Puan/Yorum"),
+        ("address", "Adres"),
+    )
+    __slots__ = tuple(attr for attr, _ in FIELDS)
+
+
+class MapPinRecord(Record):
+    """Harita üzerindeki bir tarama noktası"""
+
+    FIELDS = (
+        ("lat", "lat"),
+        ("lon", "lon"),
+        ("label", "label"),
+        ("title", "title"),
+        ("url", "url"),
+        ("color", "color"),
+    )
+    __slots__ = tuple(attr for attr, _ in FIELDS)
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Kayıtları içeren veriyi dict/list'lerden oluşan düz yapıya çevirir.
+
+    Dışa aktarma (JSON, Excel, CSV) öncesinde kullanılır.
+
+    Args:
+        value: Kayıt, dict, list veya başka bir değer
+
+    Returns:
+        Kayıtları dict'e çevrilmiş veri
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
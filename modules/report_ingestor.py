@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Report Ingestor Module
+Kaydedilmiş rapor HTML dosyalarını çevrimdışı işleme modülü
+"""
+
+import os
+import re
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Dict, Any, List, Iterator, Optional
+
+try:
+    from .html_parser import HTMLParser
+    from .js_extractor import JSExtractor
+    from .data_exporter import DataExporter, NDJSONWriter
+    from .soup_factory import make_soup, resolve_parser
+except ImportError:
+    from html_parser import HTMLParser
+    from js_extractor import JSExtractor
+    from data_exporter import DataExporter, NDJSONWriter
+    from soup_factory import make_soup, resolve_parser
+
+
+# Tarayıcının "farklı kaydet" ile eklediği kaynak URL yorumu
+SAVED_FROM_RE = re.compile(r"<!--\s*saved from url=\(\d+\)(\S+?)\s*-->", re.I)
+
+# glob desenlerindeki joker karakterler
+GLOB_MAGIC_RE = re.compile(r"[*?\[]")
+
+
+def collect_report_files(source: str) -> List[str]:
+    """
+    Dizin, glob deseni veya tek dosyadan HTML dosya listesini çıkarır.
+
+    Args:
+        source: Dizin yolu, glob deseni veya dosya yolu
+
+    Returns:
+        Sıralı dosya yolları
+    """
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, "*.html")) + glob.glob(os.path.join(source, "*.htm"))
+    elif os.path.isfile(source):
+        paths = [source]
+    else:
+        paths = [path for path in glob.glob(source, recursive=True) if os.path.isfile(path)]
+    return sorted(paths)
+
+
+def _source_root(source: str) -> str:
+    """Dizin, dosya veya glob kaynağının kök dizinini döndürür (glob'da ilk joker karakterden öncesi)."""
+    if os.path.isdir(source):
+        return source
+    if os.path.isfile(source):
+        return os.path.dirname(source)
+    match = GLOB_MAGIC_RE.search(source)
+    prefix = source[:match.start()] if match else source
+    return os.path.dirname(prefix)
+
+
+def report_output_stem(path: str, root: str) -> str:
+    """
+    Rapor dosyası için çıktı dosya adı kökünü üretir.
+
+    Ad, dosyanın kök dizine göre göreli yolundan oluşturulur; farklı alt
+    dizinlerdeki aynı adlı raporların çıktıları birbirinin üzerine yazılmaz.
+
+    Args:
+        path: Rapor dosyası
+        root: Ingest kök dizini
+
+    Returns:
+        Dosya adında kullanılabilecek kök (ör. "2025-08/report.html" -> "2025-08__report")
+    """
+    relative = os.path.splitext(os.path.relpath(path, root or "."))[0]
+    return re.sub(r"[^\w.-]+", "_", relative.replace(os.sep, "__")).strip("_")
+
+
+# parse_report_sections çıktısının yapısı değiştiğinde artırılır (parse önbelleği anahtarı)
+SECTIONS_VERSION = 3
+
+
+def sections_cache_variant(keep_raw: bool = False, js_extractor: Optional[JSExtractor] = None) -> str:
+    """
+    parse_report_sections çıktısını etkileyen ayarlardan parse önbelleği variant'ı üretir.
+
+    register_global ile eklenen global'ler javascript_verileri'ne girdiğinden
+    adları ve desenleri de anahtara katılır; global'ler değişince eski kayıtlar
+    kullanılmaz.
+
+    Args:
+        keep_raw: Ham metin sütunları saklanıyor mu
+        js_extractor: Bölümleri çıkaran JSExtractor (varsayılan global'ler için None)
+
+    Returns:
+        ParseCache.content_key için variant metni
+    """
+    variant = "raw" if keep_raw else ""
+    if js_extractor is not None:
+        variant += "|" + ";".join(f"{name}={pattern.pattern}"
+                                  for name, pattern in sorted(js_extractor.globals.items()))
+    return variant
+
+
+def parse_report_sections(html: str,
+                          parser: Optional[str] = None,
+                          targeted: bool = True,
+                          keep_raw: bool = False,
+                          html_parser: Optional[HTMLParser] = None,
+                          js_extractor: Optional[JSExtractor] = None,
+                          js_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Rapor HTML'inden tüm bölümleri çıkarır.
+
+    Args:
+        html: Ham HTML içeriği
+        parser: BeautifulSoup parser backend'i
+        targeted: Sadece rapor bölgeleri için ağaç kurulsun mu
+        keep_raw: Sayıya çevrilen alanların ham metnini de sakla (html_parser verilmediyse)
+        html_parser: Kullanılacak HTMLParser (ör. MainScraper.html_parser)
+        js_extractor: Kullanılacak JSExtractor; register_global ile eklenen
+            global'ler javascript_verileri'ne girer
+        js_data: Ham metinden önceden çıkarılmış JavaScript verileri (ör. API
+            çağrısı için extract_all_js_data_raw ile); verilirse ağaçtan tekrar
+            çıkarılmaz, harita_verileri ve javascript_verileri bundan oluşur
+
+    Returns:
+        ozet_bilgiler, rakipler, sponsorlu_listeler, detayli_sonuclar,
+        harita_verileri ve javascript_verileri alanları
+    """
+    soup = make_soup(html, parser, targeted=targeted)
+    html_parser = html_parser or HTMLParser(keep_raw=keep_raw)
+    js_extractor = js_extractor or JSExtractor()
+
+    if js_data is None:
+        js_data = js_extractor.extract_all_js_data(soup)
+    report = html_parser.parse_report(soup)
+
+    return {
+        "ozet_bilgiler": {**report["scan_information"], **report["rank_summary"]},
+        "rakipler": report["competitors"],
+        "sponsorlu_listeler": report["sponsorlu_listeler"],
+        "detayli_sonuclar": report["detayli_sonuclar"],
+        "harita_verileri": js_extractor.extract_map_data(js_data),
+        "javascript_verileri": js_data,
+    }
+
+
+def parse_report_html(html: str,
+                      source: str = "",
+                      parser: Optional[str] = None,
+                      keep_raw: bool = False) -> Dict[str, Any]:
+    """
+    Rapor HTML'ini WebClient olmadan parse eder.
+
+    Çıktı, MainScraper.scrape_all ile aynı bölümleri içerir; API verileri
+    çevrimdışı modda çekilmez.
+
+    Args:
+        html: Ham HTML içeriği
+        source: Kaynak dosya yolu veya URL
+        parser: BeautifulSoup parser backend'i
+        keep_raw: Sayıya çevrilen alanların ham metnini de sakla
+
+    Returns:
+        Parse edilmiş veriler
+    """
+    results = parse_report_sections(html, parser, keep_raw=keep_raw)
+
+    saved_from = SAVED_FROM_RE.search(html[:2048])
+    results["metadata"] = {
+        "scraped_at": datetime.now().isoformat(),
+        "url": saved_from.group(1) if saved_from else source,
+        "source_file": source,
+        "scraper_version": "4.0",
+        "method": "offline_ingest",
+        "selenium_used": False,
+    }
+
+    return results
+
+
+def parse_report_file(path: str, parser: Optional[str] = None, keep_raw: bool = False) -> Dict[str, Any]:
+    """
+    Tek bir kaydedilmiş rapor dosyasını parse eder (process pool görevi).
+
+    Args:
+        path: HTML dosya yolu
+        parser: BeautifulSoup parser backend'i
+        keep_raw: Sayıya çevrilen alanların ham metnini de sakla
+
+    Returns:
+        path, success, data, error ve duration alanları
+    """
+    started = time.perf_counter()
+    result = {"path": path, "success": False, "data": {}, "error": None, "duration": 0.0}
+
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+        data = parse_report_html(html, path, parser, keep_raw)
+        result["data"] = data
+        result["success"] = bool(data.get("ozet_bilgiler") or data.get("rakipler"))
+        if not result["success"]:
+            result["error"] = "Rapor bölümleri bulunamadı"
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["duration"] = time.perf_counter() - started
+    return result
+
+
+class ReportIngestor:
+    """Kaydedilmiş rapor arşivlerini process havuzu ile işleyen sınıf"""
+
+    def __init__(self,
+                 data_exporter: Optional[DataExporter] = None,
+                 max_workers: Optional[int] = None,
+                 parser: Optional[str] = None,
+                 keep_raw: bool = False):
+        """
+        ReportIngestor sınıfını başlatır.
+
+        Args:
+            data_exporter: Sonuçların aktarılacağı DataExporter
+            max_workers: Process sayısı (varsayılan: CPU sayısı)
+            parser: BeautifulSoup parser backend'i
+            keep_raw: Sayıya çevrilen alanların ham metnini de sakla
+        """
+        self.data_exporter = data_exporter or DataExporter()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parser = resolve_parser(parser)
+        self.keep_raw = keep_raw
+
+    def iter_results(self, source: str) -> Iterator[Dict[str, Any]]:
+        """
+        Dosyaları process havuzunda parse eder, sonuçları bittikçe üretir.
+
+        Aynı anda en fazla max_workers * 2 dosya havuzda bekler; sonuç
+        üretilince yerine yenisi gönderilir. Böylece bellekte arşivin
+        tamamı değil, sadece bu pencere kadar rapor tutulur.
+
+        Args:
+            source: Dizin yolu, glob deseni veya dosya yolu
+
+        Yields:
+            parse_report_file sonuçları
+        """
+        paths = collect_report_files(source)
+        if not paths:
+            print(f"İşlenecek HTML dosyası bulunamadı: {source}")
+            return
+
+        task = partial(parse_report_file, parser=self.parser, keep_raw=self.keep_raw)
+        workers = min(self.max_workers, len(paths))
+        if workers <= 1:
+            for path in paths:
+                yield task(path)
+            return
+
+        path_iter = iter(paths)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(task, path) for path in islice(path_iter, workers * 2)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(executor.submit(task, path) for path in islice(path_iter, len(done)))
+                for future in done:
+                    yield future.result()
+
+    def ingest(self,
+               source: str,
+               base_filename: str = "ingested_report",
+               ndjson_path: Optional[str] = None,
+               ndjson_mode: str = "scan") -> Dict[str, int]:
+        """
+        Arşivi işler ve her raporu bittiği anda DataExporter'a aktarır.
+
+        DataExporter formatlarında "ndjson" varsa (veya ndjson_path verilirse)
+        tüm raporlar tek bir NDJSON dosyasına bittikçe eklenir.
+
+        Args:
+            source: Dizin yolu, glob deseni veya dosya yolu
+            base_filename: Temel dosya adı
+            ndjson_path: Toplu NDJSON dosyası (varsayılan: `<base_filename>.ndjson`)
+            ndjson_mode: "scan" veya "row"
+
+        Returns:
+            Başarılı ve başarısız dosya sayıları
+        """
+        summary = {"success": 0, "failed": 0}
+
+        formats = list(self.data_exporter.formats)
+        if ndjson_path is None and "ndjson" in formats:
+            ndjson_path = f"{base_filename}.ndjson"
+        file_formats = [fmt for fmt in formats if fmt != "ndjson"]
+        ndjson_writer = NDJSONWriter(ndjson_path, mode=ndjson_mode) if ndjson_path else None
+        root = _source_root(source)
+
+        try:
+            for result in self.iter_results(source):
+                if not result["success"]:
+                    summary["failed"] += 1
+                    print(f"❌ {result['path']}: {result['error']}")
+                    continue
+
+                if ndjson_writer is not None:
+                    ndjson_writer.write_scan(result["data"])
+                if file_formats:
+                    stem = report_output_stem(result["path"], root)
+                    self.data_exporter.export_all_formats(result["data"], f"{base_filename}_{stem}",
+                                                          file_formats)
+                summary["success"] += 1
+                print(f"✅ {result['path']} ({result['duration']:.2f} sn)")
+        finally:
+            if ndjson_writer is not None:
+                ndjson_writer.close()
+
+        print("\n" + "=" * 60)
+        print(f"Çevrimdışı işleme tamamlandı: {summary['success']} başarılı, {summary['failed']} başarısız")
+        print("=" * 60)
+
+        return summary
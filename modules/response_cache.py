@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Response Cache Module
+HTTP yanıtları için disk tabanlı önbellek modülü
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, Callable
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ResponseCache:
+    """ETag/Last-Modified ile yeniden doğrulama yapan SQLite tabanlı HTTP önbelleği"""
+
+    def __init__(self,
+                 path: str = "http_cache.sqlite",
+                 ttl: float = 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        ResponseCache sınıfını başlatır.
+
+        Args:
+            path: SQLite veritabanı dosyası
+            ttl: Kaydın yeniden doğrulama gerektirmeden kullanılabileceği süre (saniye)
+            max_bytes: Önbellekte tutulacak en fazla gövde boyutu (LRU ile budanır)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any] = None) -> str:
+        """Query parametreleri dahil tam URL'i önbellek anahtarı olarak döndürür."""
+        return requests.Request("GET", url, params=params).prepare().url
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Anahtara ait kaydı döndürür ve erişim zamanını günceller."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, encoding, body, etag, last_modified, stored_at "
+                "FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+        return {
+            "status": row[0],
+            "headers": json.loads(row[1]),
+            "encoding": row[2],
+            "body": row[3],
+            "etag": row[4],
+            "last_modified": row[5],
+            "stored_at": row[6],
+        }
+
+    def _store(self, key: str, response: requests.Response):
+        """Başarılı yanıtı kaydeder ve boyut sınırını aşan eski kayıtları siler."""
+        body = response.content
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE url = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, headers, encoding, body, etag, last_modified, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, json.dumps(dict(response.headers)), response.encoding,
+                 sqlite3.Binary(body), response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 now, now, len(body)),
+            )
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            self.stats["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """En uzun süredir erişilmeyen kayıtları boyut sınırına inene kadar siler (lock altında)."""
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at ASC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._total_bytes -= row[1]
+            self.stats["evictions"] += 1
+
+    def _touch(self, key: str, response: requests.Response):
+        """304 yanıtından sonra kaydın tazelik zamanını yeniler."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (time.time(), response.headers.get("ETag"), response.headers.get("Last-Modified"), key),
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _build_response(key: str, entry: Dict[str, Any]) -> requests.Response:
+        """Önbellek kaydından requests.Response nesnesi oluşturur."""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.url = key
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        response._content = bytes(entry["body"])
+        response.from_cache = True
+        return response
+
+    def fetch(self,
+              session: requests.Session,
+              url: str,
+              params: Dict[str, Any] = None,
+              timeout: int = 30,
+              before_request: Optional[Callable[[str], Any]] = None,
+              **kwargs) -> requests.Response:
+        """
+        URL'i önbellek üzerinden getirir.
+
+        Taze kayıt varsa ağa çıkılmaz. Süresi dolmuş kayıt ETag/Last-Modified
+        ile koşullu istekle doğrulanır; 304 gelirse kayıt yeniden kullanılır.
+
+        Args:
+            session: İsteği yapacak requests.Session
+            url: Hedef URL
+            params: Query parametreleri
+            timeout: İstek zaman aşımı
+            before_request: Ağa çıkmadan önce çağrılacak fonksiyon (ör. rate limiting)
+
+        Returns:
+            requests.Response nesnesi
+        """
+        key = self.make_key(url, params)
+        entry = self._lookup(key)
+
+        if entry is not None and time.time() - entry["stored_at"] < self.ttl:
+            with self._lock:
+                self.stats["hits"] += 1
+            return self._build_response(key, entry)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        if before_request:
+            before_request(key)
+        response = session.get(key, timeout=timeout, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.stats["revalidated"] += 1
+            self._touch(key, response)
+            return self._build_response(key, entry)
+
+        with self._lock:
+            self.stats["misses"] += 1
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", "").lower():
+            self._store(key, response)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss sayaçlarını ve toplam boyutu döndürür."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["bytes"] = self._total_bytes
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_ratio"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Tüm kayıtları siler."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Soup Factory Module
+BeautifulSoup ağaçlarını seçilebilir parser backend'i ile oluşturan modül
+"""
+
+from typing import Optional, Union, Dict, Any
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# lxml kuruluysa C tabanlı hızlı parser, değilse saf Python parser
+DEFAULT_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+SUPPORTED_PARSERS = ("lxml", "html.parser")
+
+# Rapor parse edilirken ihtiyaç duyulan bölgeler:
+# - h4 + table: "Scan Information" / "Rank Summary" başlıkları ve tabloları,
+#   table#tbl_comp_rank, table#tbl_ads_rank
+# - script: pinz, scan_guid, place_id
+# - div#resultModal: detaylı sonuçlar
+REPORT_TAGS = frozenset({"h4", "table", "script"})
+REPORT_IDS = frozenset({"resultModal"})
+
+
+def _is_report_region(name: str, attrs: Optional[Dict[str, Any]] = None) -> bool:
+    """Üst seviye etiketin rapor bölgelerinden biri olup olmadığını kontrol eder."""
+    if name in REPORT_TAGS:
+        return True
+    return bool(attrs) and attrs.get("id") in REPORT_IDS
+
+
+class ReportStrainer(SoupStrainer):
+    """Sadece rapor bölgeleri için ağaç kuran SoupStrainer"""
+
+    def __init__(self):
+        """ReportStrainer sınıfını başlatır."""
+        # bs4 < 4.13 callable'ı (name, attrs) ile çağırır
+        super().__init__(name=_is_report_region)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        """bs4 >= 4.13: etiket oluşturulmadan önce ad ve id'ye göre karar verir."""
+        return _is_report_region(name, attrs)
+
+
+REPORT_STRAINER = ReportStrainer()
+
+
+def resolve_parser(parser: Optional[str] = None) -> str:
+    """
+    Kullanılacak parser backend adını döndürür.
+
+    Args:
+        parser: İstenen parser ("lxml", "html.parser" veya None)
+
+    Returns:
+        Kullanılabilir parser adı
+    """
+    if parser is None:
+        return DEFAULT_PARSER
+    if parser not in SUPPORTED_PARSERS:
+        raise ValueError(f"Desteklenmeyen parser: {parser} (seçenekler: {', '.join(SUPPORTED_PARSERS)})")
+    if parser == "lxml" and not LXML_AVAILABLE:
+        print("lxml kullanılamıyor, html.parser'a geçiliyor")
+        return "html.parser"
+    return parser
+
+
+def make_soup(markup: Union[str, bytes],
+              parser: Optional[str] = None,
+              targeted: bool = False) -> BeautifulSoup:
+    """
+    Markup'tan BeautifulSoup ağacı oluşturur.
+
+    Args:
+        markup: HTML içeriği
+        parser: Parser backend'i (varsayılan: DEFAULT_PARSER)
+        targeted: True ise sadece rapor bölgeleri (REPORT_STRAINER) için ağaç kurulur
+
+    Returns:
+        BeautifulSoup objesi
+    """
+    parse_only = REPORT_STRAINER if targeted else None
+    return BeautifulSoup(markup, resolve_parser(parser), parse_only=parse_only)
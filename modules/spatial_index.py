@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Spatial Index Module
+Taramalar arası harita noktaları için grid kovalı mekânsal indeks modülü
+"""
+
+import os
+import math
+import pickle
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+import numpy as np
+
+try:
+    from .rank_grid import haversine_km, pin_rank, EARTH_RADIUS_KM
+    from .history_store import HistoryStore
+except ImportError:
+    from rank_grid import haversine_km, pin_rank, EARTH_RADIUS_KM
+    from history_store import HistoryStore
+
+
+# Bir enlem derecesinin uzunluğu (haversine_km ile aynı yarıçap)
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+# Kutuplara yakın satırlarda boylam adımı sonsuza gitmesin
+_MIN_COS = 0.01
+
+
+class SpatialIndex:
+    """
+    Noktaları yaklaşık cell_km x cell_km boyutlu enlem/boylam kovalarında tutan indeks.
+
+    Enlem adımı sabittir; boylam adımı her enlem satırında o satırın
+    enlemine göre ayarlanır, böylece kovalar her yerde yaklaşık kare kalır.
+    Sorgular sadece yarıçapın kestiği kovaları tarar ve adayları haversine
+    ile kesin olarak süzer.
+    """
+
+    def __init__(self, cell_km: float = 1.0):
+        """
+        SpatialIndex sınıfını başlatır.
+
+        Args:
+            cell_km: Kova kenar uzunluğu (km); tipik sorgu yarıçapına yakın seçilmelidir
+        """
+        if cell_km <= 0:
+            raise ValueError("cell_km pozitif olmalı")
+        self.cell_km = cell_km
+        self.lat_step = cell_km / KM_PER_DEGREE
+
+        # Koordinatlar kapasitesi ikiye katlanan dizilerde tutulur; ekleme
+        # sonrası sorgular diziyi yeniden oluşturmaz
+        self._size = 0
+        self._coords = np.empty((64, 2), dtype=np.float64)
+        self._payload: List[Dict[str, Any]] = []
+        self._buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _row(self, lat: float) -> int:
+        return math.floor((lat + 90.0) / self.lat_step)
+
+    def _lon_step(self, row: int) -> float:
+        """Satırın ekvatora en yakın kenarındaki enleme göre boylam adımı."""
+        south = row * self.lat_step - 90.0
+        north = south + self.lat_step
+        nearest = 0.0 if south <= 0.0 <= north else min(abs(south), abs(north))
+        return self.lat_step / max(math.cos(math.radians(nearest)), _MIN_COS)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        row = self._row(lat)
+        lon = (lon + 180.0) % 360.0 - 180.0
+        return row, math.floor((lon + 180.0) / self._lon_step(row))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, lat: float, lon: float, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Tek bir nokta ekler.
+
+        Args:
+            lat: Enlem
+            lon: Boylam
+            payload: Noktayla birlikte döndürülecek veri
+
+        Returns:
+            Noktanın indeks içindeki kimliği
+        """
+        lat, lon = float(lat), float(lon)
+        with self._lock:
+            point_id = self._size
+            if point_id == len(self._coords):
+                self._coords = np.concatenate([self._coords, np.empty_like(self._coords)])
+            self._coords[point_id] = (lat, lon)
+            self._size += 1
+            self._payload.append(payload or {})
+            self._buckets[self._cell(lat, lon)].append(point_id)
+        return point_id
+
+    def insert_pins(self, pins: Iterable[Any], scan: Optional[str] = None) -> int:
+        """
+        extract_map_data çıktısındaki noktaları ekler.
+
+        Args:
+            pins: MapPinRecord veya dict listesi
+            scan: Noktaların ait olduğu tarama anahtarı
+
+        Returns:
+            Eklenen nokta sayısı
+        """
+        count = 0
+        for position, pin in enumerate(pins):
+            lat, lon = pin.get("lat"), pin.get("lon")
+            if lat is None or lon is None:
+                continue
+            rank = pin_rank(pin)
+            self.insert(lat, lon, {
+                "scan": scan,
+                "position": position,
+                "rank": None if rank != rank else int(rank),
+                "url": pin.get("url"),
+            })
+            count += 1
+        return count
+
+    def insert_scan(self, data: Dict[str, Any]) -> int:
+        """Taramanın harita_verileri noktalarını HistoryStore.scan_key anahtarıyla ekler."""
+        return self.insert_pins(data.get("harita_verileri") or [], HistoryStore.scan_key(data))
+
+    def _lon_ranges(self, lat: float, lon: float, radius_km: float) -> Tuple[float, float, List[Tuple[float, float]]]:
+        """
+        Yarıçap dairesinin enlem sınırlarını ve boylam aralıklarını hesaplar.
+
+        Daire bir kutbu içeriyorsa tüm boylamlar taranır; aksi halde boylam
+        açıklığı asin(sin(δ) / cos(φ)) ile bulunur ve 180. meridyeni aşan
+        aralıklar ikiye bölünür.
+        """
+        delta = radius_km / EARTH_RADIUS_KM
+        lat_min = lat - math.degrees(delta)
+        lat_max = lat + math.degrees(delta)
+        if lat_min <= -90.0 or lat_max >= 90.0:
+            return max(lat_min, -90.0), min(lat_max, 90.0), [(-180.0, 180.0)]
+
+        lon_span = math.degrees(math.asin(min(math.sin(delta) / math.cos(math.radians(lat)), 1.0)))
+        low, high = lon - lon_span, lon + lon_span
+        if low < -180.0:
+            return lat_min, lat_max, [(low + 360.0, 180.0), (-180.0, high)]
+        if high > 180.0:
+            return lat_min, lat_max, [(low, 180.0), (-180.0, high - 360.0)]
+        return lat_min, lat_max, [(low, high)]
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Yarıçapın kestiği kovalardaki nokta kimliklerini toplar (lock altında)."""
+        lat_min, lat_max, lon_ranges = self._lon_ranges(lat, lon, radius_km)
+        first_row, last_row = self._row(lat_min), self._row(lat_max)
+
+        # Taranacak kova sayısı nokta sayısını aşıyorsa tüm noktalar aday olur
+        # (en dar boylam adımı bandın ekvatora en yakın satırındadır)
+        if lat_min <= 0.0 <= lat_max:
+            narrowest = self.lat_step
+        else:
+            narrowest = min(self._lon_step(first_row), self._lon_step(last_row))
+        width = sum(high - low for low, high in lon_ranges)
+        if (last_row - first_row + 1) * (width / narrowest + 1) > self._size:
+            return np.arange(self._size, dtype=np.int64)
+
+        ids: List[int] = []
+        for row in range(first_row, last_row + 1):
+            step = self._lon_step(row)
+            for low, high in lon_ranges:
+                for col in range(math.floor((low + 180.0) / step), math.floor((high + 180.0) / step) + 1):
+                    bucket = self._buckets.get((row, col))
+                    if bucket:
+                        ids.extend(bucket)
+        return np.array(ids, dtype=np.int64)
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List[Dict[str, Any]]:
+        """
+        Noktaya radius_km mesafedeki tüm kayıtları döndürür.
+
+        Args:
+            lat: Enlem
+            lon: Boylam
+            radius_km: Yarıçap (km)
+
+        Returns:
+            Mesafeye göre sıralı id, lat, lon, distance_km ve payload alanları
+        """
+        with self._lock:
+            ids = self._candidates(lat, lon, radius_km)
+            if not ids.size:
+                return []
+            points = self._coords[ids]
+            distances = haversine_km(lat, lon, points[:, 0], points[:, 1])
+            keep = distances <= radius_km
+            ids, distances = ids[keep], distances[keep]
+            order = np.argsort(distances, kind="stable")
+            return [self._result(int(ids[i]), float(distances[i])) for i in order]
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Dict[str, Any]]:
+        """
+        Noktaya en yakın k kaydı döndürür.
+
+        Arama yarıçapı cell_km'den başlayıp k kayıt bulunana kadar ikiye
+        katlanır; bulunan k kayıt o yarıçapın içinde kalan tüm kayıtların
+        en yakınları olduğundan sonuç kesindir.
+
+        Args:
+            lat: Enlem
+            lon: Boylam
+            k: İstenen kayıt sayısı
+
+        Returns:
+            Mesafeye göre sıralı en fazla k kayıt
+        """
+        total = len(self)
+        if not total or k <= 0:
+            return []
+        radius = self.cell_km
+        while True:
+            results = self.query_radius(lat, lon, radius)
+            # Yarıçap dünyanın yarı çevresini aştıysa tüm noktalar kapsanmıştır
+            if len(results) >= min(k, total) or radius >= math.pi * EARTH_RADIUS_KM:
+                return results[:k]
+            radius *= 2
+
+    def _result(self, point_id: int, distance: float) -> Dict[str, Any]:
+        return {
+            "id": point_id,
+            "lat": float(self._coords[point_id, 0]),
+            "lon": float(self._coords[point_id, 1]),
+            "distance_km": round(distance, 4),
+            "payload": self._payload[point_id],
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Nokta ve kova sayılarını döndürür."""
+        with self._lock:
+            sizes = [len(bucket) for bucket in self._buckets.values()]
+            return {
+                "points": self._size,
+                "buckets": len(sizes),
+                "max_bucket": max(sizes) if sizes else 0,
+                "cell_km": self.cell_km,
+            }
+
+    def save(self, path: str):
+        """
+        İndeksi diske yazar (önce geçici dosyaya, sonra atomik olarak yer değiştirir).
+
+        Args:
+            path: Hedef dosya
+        """
+        with self._lock:
+            payload = pickle.dumps({
+                "cell_km": self.cell_km,
+                "coords": self._coords[:self._size].copy(),
+                "payload": self._payload,
+            }, protocol=pickle.HIGHEST_PROTOCOL)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SpatialIndex":
+        """
+        save ile yazılmış indeksi okur; kovalar yeniden oluşturulur.
+
+        Args:
+            path: Kaynak dosya
+
+        Returns:
+            SpatialIndex
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        index = cls(state["cell_km"])
+        coords = np.asarray(state["coords"], dtype=np.float64).reshape(-1, 2)
+        index._size = len(coords)
+        index._coords = np.empty((max(64, len(coords)), 2), dtype=np.float64)
+        index._coords[:index._size] = coords
+        index._payload = list(state["payload"])
+        for point_id, (lat, lon) in enumerate(coords.tolist()):
+            index._buckets[index._cell(lat, lon)].append(point_id)
+        return index
@@ -4,12 +4,19 @@ Web Client Module
 Web istekleri için yardımcı modül
 """
 
-import time
-import random
 from typing import Optional
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    from .rate_limiter import HostRateLimiter, get_shared_limiter
+    from .response_cache import ResponseCache
+    from .soup_factory import make_soup, resolve_parser
+except ImportError:
+    from rate_limiter import HostRateLimiter, get_shared_limiter
+    from response_cache import ResponseCache
+    from soup_factory import make_soup, resolve_parser
+
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
@@ -29,7 +36,11 @@ class WebClient:
                  timeout: int = 30,
                  use_selenium: bool = False,
                  headless: bool = True,
-                 rate_limit: float = 1.0):
+                 rate_limit: float = 1.0,
+                 burst: int = 1,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 parser: Optional[str] = None):
         """
         WebClient sınıfını başlatır.
         
@@ -38,10 +49,17 @@ class WebClient:
             timeout: İstek zaman aşımı
             use_selenium: Selenium kullanımı
             headless: Selenium headless modu
-            rate_limit: Rate limiting süresi
+            rate_limit: Aynı host'a yapılan istekler arası süre (saniye)
+            burst: Host başına anlık izin verilen istek sayısı
+            rate_limiter: Paylaşımlı host rate limiter'ı (verilmezse ortak limiter kullanılır)
+            cache: İsteğe bağlı disk tabanlı yanıt önbelleği
+            parser: BeautifulSoup parser backend'i ("lxml" veya "html.parser")
         """
         self.timeout = timeout
+        self.parser = resolve_parser(parser)
         self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or get_shared_limiter(rate_limit, burst)
+        self.cache = cache
         self.use_selenium = use_selenium
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -91,35 +109,61 @@ class WebClient:
             print(f"Selenium kurulumu başarısız: {e}")
             self.use_selenium = False
     
-    def _rate_limit(self):
-        """Rate limiting uygular."""
-        if self.rate_limit > 0:
-            time.sleep(self.rate_limit + random.uniform(0, 0.5))
+    def _rate_limit(self, url: str):
+        """Host için token alınana kadar bekler."""
+        self.rate_limiter.acquire(url)
     
-    def get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch(self, url: str) -> requests.Response:
+        """URL'i (varsa önbellek üzerinden) requests ile getirir."""
+        if self.cache is not None:
+            return self.cache.fetch(self.session, url, timeout=self.timeout,
+                                    before_request=self._rate_limit, allow_redirects=True)
+        self._rate_limit(url)
+        return self.session.get(url, timeout=self.timeout, allow_redirects=True)
+    
+    def get_soup(self, url: str, targeted: bool = False) -> Optional[BeautifulSoup]:
         """
         URL'den HTML içeriğini alır.
         
         Args:
             url: Hedef URL
+            targeted: True ise sadece rapor bölgeleri için ağaç kurulur
             
         Returns:
             BeautifulSoup objesi veya None
         """
         try:
             if self.use_selenium and self.driver:
-                return self._get_soup_selenium(url)
+                return self._get_soup_selenium(url, targeted)
             else:
-                return self._get_soup_requests(url)
+                return self._get_soup_requests(url, targeted)
         except Exception as e:
             print(f"HTML içeriği alınamadı: {e}")
             return None
     
-    def _get_soup_requests(self, url: str) -> Optional[BeautifulSoup]:
-        """Requests ile HTML içeriği alır."""
-        self._rate_limit()
+    def get_html(self, url: str) -> Optional[str]:
+        """
+        URL'den ham HTML metnini alır (ağaç kurulmaz).
+        
+        Args:
+            url: Hedef URL
+            
+        Returns:
+            HTML metni veya None
+        """
+        try:
+            if self.use_selenium and self.driver:
+                return self._get_html_selenium(url)
+            else:
+                return self._get_html_requests(url)
+        except Exception as e:
+            print(f"HTML içeriği alınamadı: {e}")
+            return None
+    
+    def _get_html_requests(self, url: str) -> Optional[str]:
+        """Requests ile ham HTML metnini alır."""
         try:
-            resp = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            resp = self._fetch(url)
             resp.raise_for_status()
             
             # Content-Type kontrolü
@@ -127,27 +171,47 @@ class WebClient:
             if 'text/html' not in content_type and 'text/plain' not in content_type:
                 print(f"Uyarı: Beklenmeyen content-type: {content_type}")
             
-            return BeautifulSoup(resp.text, "html.parser")
+            return resp.text
             
         except requests.exceptions.RequestException as e:
             print(f"Request hatası: {e}")
             return None
-        except Exception as e:
-            print(f"HTML parsing hatası: {e}")
-            return None
     
-    def _get_soup_selenium(self, url: str) -> Optional[BeautifulSoup]:
-        """Selenium ile HTML içeriği alır."""
+    def _get_html_selenium(self, url: str) -> Optional[str]:
+        """Selenium ile ham HTML metnini alır."""
+        self._rate_limit(url)
         try:
             self.driver.get(url)
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            return self.driver.page_source
         except Exception as e:
             print(f"Selenium ile HTML alınamadı: {e}")
             return None
     
+    def _get_soup_requests(self, url: str, targeted: bool = False) -> Optional[BeautifulSoup]:
+        """Requests ile HTML içeriği alır."""
+        html = self._get_html_requests(url)
+        if html is None:
+            return None
+        try:
+            return make_soup(html, self.parser, targeted)
+        except Exception as e:
+            print(f"HTML parsing hatası: {e}")
+            return None
+    
+    def _get_soup_selenium(self, url: str, targeted: bool = False) -> Optional[BeautifulSoup]:
+        """Selenium ile HTML içeriği alır."""
+        html = self._get_html_selenium(url)
+        if html is None:
+            return None
+        try:
+            return make_soup(html, self.parser, targeted)
+        except Exception as e:
+            print(f"HTML parsing hatası: {e}")
+            return None
+    
     def cleanup(self):
         """Kaynakları temizler."""
         if self.driver:
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Parser Parity Validator
+HTMLParser ve JSExtractor çıktılarının farklı parser backend'lerinde
+referans (html.parser) sonuçlarla aynı olduğunu doğrular.
+
+Kullanım:
+    python3 validate_parser_parity.py [rapor.html ...]
+"""
+
+import os
+import io
+import sys
+import glob
+import contextlib
+from typing import Dict, Any, List, Callable, Tuple
+
+# Modules klasörünü Python path'ine ekle
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modules'))
+
+from bs4 import BeautifulSoup
+from html_parser import HTMLParser
+from js_extractor import JSExtractor
+from soup_factory import make_soup, LXML_AVAILABLE
+
+REFERENCE_PARSER = "html.parser"
+FIXTURE_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Site Dosyaları", "*.html")
+
+
+def reference_outputs(html: str) -> Dict[str, Any]:
+    """Referans parser ile her çıkarıcının çıktısını hesaplar."""
+    soup = BeautifulSoup(html, REFERENCE_PARSER)
+    return collect_outputs(soup)
+
+
+def collect_outputs(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Bir soup üzerinde tüm HTMLParser ve JSExtractor metotlarını çalıştırır."""
+    html_parser = HTMLParser()
+    js_extractor = JSExtractor()
+    js_data = js_extractor.extract_all_js_data(soup)
+    return {
+        "parse_scan_information": html_parser.parse_scan_information(soup),
+        "parse_rank_summary": html_parser.parse_rank_summary(soup),
+        "parse_competitors": html_parser.parse_competitors(soup),
+        "parse_sponsorlu_listeler": html_parser.parse_sponsorlu_listeler(soup),
+        "parse_detayli_sonuclar": html_parser.parse_detayli_sonuclar(soup),
+        "extract_pinz_data": js_extractor.extract_pinz_data(soup),
+        "extract_scan_guid": js_extractor.extract_scan_guid(soup),
+        "extract_place_id": js_extractor.extract_place_id(soup),
+        "extract_all_js_data": js_data,
+        "extract_map_data": js_extractor.extract_map_data(js_data),
+    }
+
+
+def single_pass_outputs(soup: BeautifulSoup) -> Dict[str, Any]:
+    """HTMLParser.parse_report sonucunu ayrı parse_* çağrılarının adlarıyla döndürür."""
+    report = HTMLParser().parse_report(soup)
+    return {f"parse_{section}": value for section, value in report.items()}
+
+
+def raw_js_outputs(html: str) -> Dict[str, Any]:
+    """JSExtractor.extract_all_js_data_raw sonucunu soup tabanlı metotların adlarıyla döndürür."""
+    js_extractor = JSExtractor()
+    js_data = js_extractor.extract_all_js_data_raw(html.encode("utf-8"))
+    return {
+        "extract_pinz_data": js_data["pinz"],
+        "extract_scan_guid": js_data["scan_guid"],
+        "extract_place_id": js_data["place_id"],
+        "extract_all_js_data": js_data,
+        "extract_map_data": js_extractor.extract_map_data(js_data),
+    }
+
+
+def candidate_runners() -> List[Tuple[str, Callable[[str], Dict[str, Any]]]]:
+    """Referansla karşılaştırılacak parse yollarını döndürür."""
+    runners = [
+        ("html.parser+strainer", lambda html: collect_outputs(make_soup(html, "html.parser", targeted=True))),
+    ]
+    if LXML_AVAILABLE:
+        runners.append(("lxml", lambda html: collect_outputs(make_soup(html, "lxml"))))
+        runners.append(("lxml+strainer", lambda html: collect_outputs(make_soup(html, "lxml", targeted=True))))
+    runners.append(("parse_report", lambda html: single_pass_outputs(make_soup(html, targeted=True))))
+    runners.append(("raw_js", raw_js_outputs))
+    return runners
+
+
+def compare(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """Farklı olan çıktıların adlarını döndürür (sadece actual içindeki adlar karşılaştırılır)."""
+    return [name for name in actual if expected.get(name) != actual[name]]
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob(FIXTURE_GLOB))
+    if not paths:
+        print("❌ Karşılaştırılacak rapor HTML dosyası bulunamadı")
+        sys.exit(1)
+
+    runners = candidate_runners()
+
+    failures = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        print(f"🔍 {os.path.basename(path)}")
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = reference_outputs(html)
+
+        for name, runner in runners:
+            with contextlib.redirect_stdout(io.StringIO()):
+                actual = runner(html)
+            mismatches = compare(expected, actual)
+            if mismatches:
+                failures += 1
+                print(f"❌ {name}: farklı çıktılar -> {', '.join(mismatches)}")
+            else:
+                print(f"✅ {name}: {len(actual)} çıktı referansla aynı")
+
+    print("=" * 50)
+    if failures:
+        print(f"❌ {failures} karşılaştırma başarısız")
+        sys.exit(1)
+    print("✅ Tüm parser çıktıları referansla aynı")
+
+
+if __name__ == "__main__":
+    main()